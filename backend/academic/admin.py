@@ -2,7 +2,7 @@
 Configuración del panel de administración para la app academic.
 """
 from django.contrib import admin
-from .models import Comision, Docente
+from .models import Comision, Docente, ImportJob
 
 
 @admin.register(Comision)
@@ -35,3 +35,12 @@ class DocenteAdmin(admin.ModelAdmin):
     """Admin para el modelo Docente."""
     list_display = ('nombre_completo', 'nombre', 'apellido')
     search_fields = ('nombre', 'apellido', 'alias_search')
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    """Admin para el modelo ImportJob."""
+    list_display = ('nombre_archivo', 'estado', 'etapa', 'ciclo', 'filas_procesadas', 'usuario', 'fecha_creacion', 'fin')
+    list_filter = ('estado', 'ciclo')
+    search_fields = ('nombre_archivo',)
+    readonly_fields = ('fecha_creacion', 'inicio', 'fin', 'contadores', 'archivos', 'plan')
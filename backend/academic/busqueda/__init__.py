@@ -0,0 +1,25 @@
+"""
+Búsqueda de texto libre sobre docentes y comisiones.
+
+Los modelos mantienen una columna search_texto con los tokens normalizados
+(sin mayúsculas ni acentos, ver utils.texto_busqueda) de los campos
+buscables; los viewsets la consultan con NormalizedSearchFilter en lugar de
+un OR de icontains por campo (y por JOIN al docente).
+
+    - ?search=: prefijos de palabra (NormalizedSearchFilter)
+    - ?q=: similitud por trigramas, tolera errores de tipeo (TrigramSearchFilter)
+    - /api/sugerencias/: typeahead desde un índice de prefijos en memoria
+    - /api/search/: comisiones, docentes y recomendaciones juntas (unificada)
+"""
+from .filtros import (
+    CoincideTokens, CoincideTrigramas, NormalizedSearchFilter, SimilitudTrigramas,
+    TrigramSearchFilter, filtrar_tokens,
+)
+from .sugerencias import IndicePrefijos, Sugerencia, indice_sugerencias
+from .trigramas import IndiceTrigramas, indice_para, invalidar, similitud, trigramas
+
+__all__ = [
+    'CoincideTokens', 'CoincideTrigramas', 'IndicePrefijos', 'IndiceTrigramas',
+    'NormalizedSearchFilter', 'SimilitudTrigramas', 'Sugerencia', 'TrigramSearchFilter',
+    'filtrar_tokens', 'indice_para', 'indice_sugerencias', 'invalidar', 'similitud', 'trigramas',
+]
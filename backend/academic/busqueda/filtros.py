@@ -0,0 +1,218 @@
+"""
+Filtros de búsqueda sobre las columnas search_texto.
+
+NormalizedSearchFilter (?search=): cada término buscado se normaliza igual que la columna y debe ser el
+comienzo de alguna palabra ("garc" encuentra "García", "mat" encuentra
+"MAT-101"); varios términos se combinan con AND.
+
+    - PostgreSQL: to_tsvector('simple', search_texto) @@ to_tsquery('simple',
+      'garc:* & juan:*'), que usa el índice GIN de la migración 0015.
+    - Resto (SQLite): search_texto LIKE '% garc%' por término, sobre una
+      sola columna y sin JOIN.
+
+TrigramSearchFilter (?q=): búsqueda tolerante a errores de tipeo ("garsia"
+encuentra "García"), ordenada por similitud, con ?umbral= y ?limite=.
+
+    - PostgreSQL: pg_trgm (q <<% search_texto, strict_word_similarity) con
+      el índice GIN gin_trgm_ops de la migración 0016.
+    - Resto: índice de trigramas en memoria (ver trigramas.py) con el mismo
+      criterio de similitud.
+"""
+from django.db import connections
+from django.db.models import BooleanField, Case, F, FloatField, Func, Q, Value, When
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+
+from academic.utils import normalizar_texto, tokenizar
+
+from .trigramas import indice_para
+
+
+class CoincideTokens(Func):
+    """
+    search_texto @@ to_tsquery (PostgreSQL) con la misma expresión que el
+    índice GIN, para que el planner lo use. Los tokens ya están normalizados
+    (sólo letras y dígitos), así que no hace falta escapar la sintaxis de
+    tsquery; igual viajan como parámetro.
+    """
+    output_field = BooleanField()
+
+    def __init__(self, campo, tokens):
+        consulta = ' & '.join(f'{token}:*' for token in tokens)
+        super().__init__(F(campo), Value(consulta))
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        campo, consulta = self.get_source_expressions()
+        sql_campo, params_campo = compiler.compile(campo)
+        sql_consulta, params_consulta = compiler.compile(consulta)
+        sql = (
+            f"to_tsvector('simple'::regconfig, COALESCE({sql_campo}, '')) "
+            f"@@ to_tsquery('simple'::regconfig, {sql_consulta})"
+        )
+        return sql, (*params_campo, *params_consulta)
+
+
+def filtrar_tokens(queryset, texto, campo='search_texto'):
+    """Filtra `queryset` por los tokens de `texto` (prefijos de palabra, AND)."""
+    tokens = list(dict.fromkeys(tokenizar(texto)))
+    if not tokens:
+        return queryset
+    if connections[queryset.db].vendor == 'postgresql':
+        return queryset.filter(CoincideTokens(campo, tokens))
+    condicion = Q()
+    for token in tokens:
+        condicion &= Q(**{f'{campo}__contains': f' {token}'})
+    return queryset.filter(condicion)
+
+
+class NormalizedSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter (mismo parámetro ?search=) que consulta la columna
+    normalizada del modelo en lugar de `search_fields`.
+
+    El viewset puede cambiar la columna con `search_texto_field`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terminos = self.get_search_terms(request)
+        if not terminos:
+            return queryset
+        campo = getattr(view, 'search_texto_field', 'search_texto')
+        return filtrar_tokens(queryset, ' '.join(terminos), campo)
+
+
+# ============================================================================
+# BÚSQUEDA POR SIMILITUD (trigramas)
+# ============================================================================
+
+class CoincideTrigramas(Func):
+    """
+    `texto <<% campo` (pg_trgm): usa el índice GIN gin_trgm_ops y filtra por
+    pg_trgm.strict_word_similarity_threshold (ver TrigramSearchFilter).
+    """
+    output_field = BooleanField()
+
+    def __init__(self, campo, texto):
+        super().__init__(Value(texto), F(campo))
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        texto, campo = self.get_source_expressions()
+        sql_texto, params_texto = compiler.compile(texto)
+        sql_campo, params_campo = compiler.compile(campo)
+        return f'{sql_texto} <<%% {sql_campo}', (*params_texto, *params_campo)
+
+
+class SimilitudTrigramas(Func):
+    """strict_word_similarity(texto, campo) (pg_trgm)."""
+    function = 'strict_word_similarity'
+    output_field = FloatField()
+
+    def __init__(self, campo, texto):
+        super().__init__(Value(texto), F(campo))
+
+
+class TrigramSearchFilter(filters.BaseFilterBackend):
+    """
+    Búsqueda por similitud: ?q=garsia&umbral=0.3&limite=50.
+
+    Devuelve como mucho `limite` resultados con similitud >= `umbral`,
+    ordenados por similitud (el orden del queryset desempata) y anotados
+    con `similitud`. Va después de OrderingFilter en filter_backends para
+    que el ranking no se pierda.
+    """
+    search_param = 'q'
+    umbral_param = 'umbral'
+    limite_param = 'limite'
+    UMBRAL = 0.3
+    LIMITE = 50
+    LIMITE_MAX = 200
+    # Filas por consulta al cruzar el ranking en memoria con el queryset
+    LOTE = 500
+
+    def get_parametros(self, request):
+        """(texto, umbral, limite) de la request; texto vacío si no hay ?q=."""
+        texto = normalizar_texto(request.query_params.get(self.search_param, '').replace('\x00', ''))
+        try:
+            umbral = float(request.query_params.get(self.umbral_param, self.UMBRAL))
+        except ValueError:
+            umbral = None
+        if umbral is None or not 0 < umbral <= 1:
+            raise ValidationError({self.umbral_param: 'Debe ser un número mayor que 0 y menor o igual a 1.'})
+        try:
+            limite = int(request.query_params.get(self.limite_param, self.LIMITE))
+        except ValueError:
+            limite = 0
+        if limite < 1:
+            raise ValidationError({self.limite_param: 'Debe ser un entero mayor que 0.'})
+        return texto, umbral, min(limite, self.LIMITE_MAX)
+
+    def filter_queryset(self, request, queryset, view):
+        texto, umbral, limite = self.get_parametros(request)
+        if not tokenizar(texto):
+            return queryset
+        campo = getattr(view, 'search_texto_field', 'search_texto')
+        orden = [o for o in queryset.query.order_by if not (isinstance(o, str) and o.lstrip('-') == 'similitud')]
+        if connections[queryset.db].vendor == 'postgresql':
+            ranking = self.ranking_postgresql(queryset, campo, texto, umbral, limite)
+        else:
+            ranking = self.ranking_en_memoria(queryset, campo, texto, umbral, limite)
+        return ranking.order_by('-similitud', *orden)
+
+    def ranking_postgresql(self, queryset, campo, texto, umbral, limite):
+        # El operador <<% usa el umbral de la sesión; se fija antes de la query
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('pg_trgm.strict_word_similarity_threshold', %s, false)", [str(umbral)]
+            )
+        coincidencias = queryset.filter(CoincideTrigramas(campo, texto)).annotate(
+            similitud=SimilitudTrigramas(campo, texto)
+        )
+        mejores = coincidencias.order_by('-similitud', 'pk').values('pk')[:limite]
+        return queryset.filter(pk__in=mejores).annotate(similitud=SimilitudTrigramas(campo, texto))
+
+    def ranking_en_memoria(self, queryset, campo, texto, umbral, limite):
+        """
+        Ranking con el índice de trigramas de toda la tabla; se cruza por
+        lotes con el queryset (que puede tener otros filtros) hasta juntar
+        `limite` filas.
+        """
+        candidatos = indice_para(queryset, campo).buscar(texto, umbral)
+        elegidos = []
+        for i in range(0, len(candidatos), self.LOTE):
+            lote = candidatos[i:i + self.LOTE]
+            visibles = set(queryset.filter(pk__in=[pk for pk, _ in lote]).values_list('pk', flat=True))
+            elegidos.extend((pk, valor) for pk, valor in lote if pk in visibles)
+            if len(elegidos) >= limite:
+                break
+        elegidos = elegidos[:limite]
+        if not elegidos:
+            return queryset.none().annotate(similitud=Value(0.0, output_field=FloatField()))
+        return queryset.filter(pk__in=[pk for pk, _ in elegidos]).annotate(similitud=Case(
+            *(When(pk=pk, then=Value(valor)) for pk, valor in elegidos),
+            output_field=FloatField(),
+        ))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Búsqueda por similitud (tolera errores de tipeo)',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.umbral_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Similitud mínima entre 0 y 1 (por defecto {self.UMBRAL})',
+                'schema': {'type': 'number'},
+            },
+            {
+                'name': self.limite_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Cantidad máxima de resultados (por defecto {self.LIMITE}, máximo {self.LIMITE_MAX})',
+                'schema': {'type': 'integer'},
+            },
+        ]
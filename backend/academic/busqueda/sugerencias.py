@@ -0,0 +1,185 @@
+"""
+Sugerencias de búsqueda (typeahead) desde un índice de prefijos en memoria.
+
+Tipos de sugerencia:
+    - docente:  nombre completo y alias (popularidad: comisiones activas)
+    - materia:  nombre y codigo_actividad (popularidad: comisiones activas)
+    - comision: código de comisión (popularidad: cuatrimestres/sedes en que aparece)
+
+Cada tipo es un IndicePrefijos de arrays ordenados: las claves (sufijos de
+palabra normalizados: "juan garcia" y "garcia") en una lista ordenada con
+bisect, y las sugerencias ordenadas por ranking, de modo que el número de
+sugerencia ES su posición en el ranking y el top-k de un rango de claves son
+los k números más chicos. Los prefijos de hasta PREFIJO_PRECALCULADO letras
+(los de rangos más grandes) tienen el top-k ya calculado.
+
+indice_sugerencias() construye el índice una vez por proceso y lo reconstruye
+sólo cuando cambia Cache_Metadatos.version (leída del cache de Django); el
+camino caliente no toca la base de datos.
+"""
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from django.db.models import Count, Max, Q
+
+from academic.utils import normalizar_texto, tokenizar
+
+from .trigramas import generacion
+
+TIPOS = ('docente', 'materia', 'comision')
+
+# Máximo de sugerencias por consulta (y largo de los top-k precalculados)
+K_MAX = 20
+PREFIJO_PRECALCULADO = 2
+
+
+@dataclass(slots=True)
+class Sugerencia:
+    tipo: str
+    id: object
+    texto: str
+    detalle: str = ''
+    popularidad: int = 0
+
+    def as_dict(self):
+        return {
+            'tipo': self.tipo, 'id': self.id, 'texto': self.texto,
+            'detalle': self.detalle, 'popularidad': self.popularidad,
+        }
+
+
+def claves(*valores):
+    """Sufijos de palabra normalizados: "García Juan" -> ["garcia juan", "juan"]."""
+    resultado = []
+    for valor in valores:
+        for texto in {normalizar_texto(valor), ' '.join(tokenizar(valor))}:
+            palabras = texto.split(' ')
+            resultado.extend(' '.join(palabras[i:]) for i in range(len(palabras)) if palabras[i])
+    return list(dict.fromkeys(resultado))
+
+
+def _ranking(sugerencia):
+    return (-sugerencia.popularidad, len(sugerencia.texto), normalizar_texto(sugerencia.texto))
+
+
+class IndicePrefijos:
+    """
+    Índice de prefijos de un tipo de sugerencia.
+
+    Uso:
+        indice = IndicePrefijos([(sugerencia, claves(sugerencia.texto)), ...])
+        indice.buscar('gar', k=5)   # [Sugerencia, ...] por ranking
+    """
+
+    def __init__(self, entradas):
+        entradas = sorted(entradas, key=lambda entrada: _ranking(entrada[0]))
+        self._sugerencias = [sugerencia for sugerencia, _ in entradas]
+        pares = sorted(
+            (clave, posicion) for posicion, (_, lista) in enumerate(entradas) for clave in lista
+        )
+        self._claves = [clave for clave, _ in pares]
+        self._posiciones = array('I', (posicion for _, posicion in pares))
+
+        # Top-k de los prefijos cortos (los de rangos más grandes)
+        cortos = {}
+        for clave, posicion in pares:
+            for largo in range(1, min(PREFIJO_PRECALCULADO, len(clave)) + 1):
+                cortos.setdefault(clave[:largo], set()).add(posicion)
+        self._top = {prefijo: sorted(posiciones)[:K_MAX] for prefijo, posiciones in cortos.items()}
+
+    def __len__(self):
+        return len(self._sugerencias)
+
+    def buscar(self, prefijo, k=8):
+        """Las k mejores sugerencias con alguna clave que empieza con `prefijo` (normalizado)."""
+        if not prefijo:
+            return []
+        if len(prefijo) <= PREFIJO_PRECALCULADO:
+            posiciones = self._top.get(prefijo, ())[:k]
+        else:
+            inicio = bisect_left(self._claves, prefijo)
+            fin = bisect_left(self._claves, prefijo + '\uffff', inicio)
+            posiciones = heapq.nsmallest(k, set(self._posiciones[inicio:fin]))
+        return [self._sugerencias[posicion] for posicion in posiciones]
+
+
+class IndiceSugerencias:
+    """Un IndicePrefijos por tipo, construido para una versión del dataset."""
+
+    def __init__(self, indices, version=None, clave=None):
+        self.indices = indices
+        self.version = version
+        self.clave = clave
+
+    def buscar(self, texto, tipos=TIPOS, k=8):
+        prefijo = normalizar_texto(texto)
+        k = max(1, min(k, K_MAX))
+        resultados = [s for tipo in tipos for s in self.indices[tipo].buscar(prefijo, k)]
+        return heapq.nsmallest(k, resultados, key=_ranking)
+
+
+def construir_indice(version=None, clave=None):
+    """Lee el catálogo (tres queries agregadas) y arma el índice de sugerencias."""
+    from academic.models import Comision, Docente  # Import local para evitar ciclos
+
+    activas = Q(comisiones__activa=True)
+    docentes = []
+    for pk, nombre, alias, comisiones in (
+        Docente.objects.annotate(n=Count('comisiones', filter=activas))
+        .values_list('id_docente', 'nombre_completo', 'alias_search', 'n')
+    ):
+        sugerencia = Sugerencia('docente', pk, nombre, popularidad=comisiones)
+        docentes.append((sugerencia, claves(nombre, *(alias or '').split(','))))
+
+    materias = []
+    for codigo_actividad, nombre, comisiones in (
+        Comision.objects.filter(activa=True).values('codigo_actividad', 'nombre')
+        .annotate(n=Count('pk')).values_list('codigo_actividad', 'nombre', 'n')
+    ):
+        sugerencia = Sugerencia(
+            'materia', codigo_actividad or nombre, nombre, detalle=codigo_actividad, popularidad=comisiones
+        )
+        materias.append((sugerencia, claves(nombre, codigo_actividad)))
+
+    comisiones = []
+    for codigo, nombre, apariciones in (
+        Comision.objects.filter(activa=True).values('codigo')
+        .annotate(ejemplo=Max('nombre'), n=Count('pk')).values_list('codigo', 'ejemplo', 'n')
+    ):
+        sugerencia = Sugerencia('comision', codigo, codigo, detalle=nombre, popularidad=apariciones)
+        comisiones.append((sugerencia, claves(codigo)))
+
+    return IndiceSugerencias({
+        'docente': IndicePrefijos(docentes),
+        'materia': IndicePrefijos(materias),
+        'comision': IndicePrefijos(comisiones),
+    }, version=version, clave=clave)
+
+
+_indice = None
+_lock = threading.Lock()
+
+
+def indice_sugerencias():
+    """
+    Índice del proceso, reconstruido sólo si cambió la versión del dataset.
+
+    La clave incluye además la generación local de academic.busqueda (los
+    cambios de este proceso, que también incrementan la versión) para no
+    confundir versiones iguales de bases distintas, como en los tests.
+    """
+    from recommendations.models import Cache_Metadatos  # Import local para evitar ciclos
+
+    global _indice
+    version = Cache_Metadatos.get_cached_version()
+    clave = (version, generacion())
+    indice = _indice
+    if indice is not None and indice.clave == clave:
+        return indice
+    with _lock:
+        if _indice is None or _indice.clave != clave:
+            _indice = construir_indice(version, clave)
+        return _indice
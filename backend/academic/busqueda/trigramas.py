@@ -0,0 +1,162 @@
+"""
+Similitud por trigramas (búsqueda tolerante a errores de tipeo).
+
+Reproduce en Python el criterio de strict_word_similarity de pg_trgm para
+los backends sin esa extensión (SQLite en desarrollo y tests):
+
+    - Cada palabra se rellena con dos espacios adelante y uno atrás y se
+      parte en trigramas: "lopez" -> {"  l", " lo", "lop", "ope", "pez", "ez "}
+    - La similitud entre la búsqueda y un texto es el máximo, sobre todos los
+      tramos de palabras consecutivas del texto, de |A ∩ B| / |A ∪ B|.
+
+IndiceTrigramas es un índice invertido trigrama -> filas sobre la columna
+search_texto de un modelo; indice_para() lo mantiene en memoria por proceso
+y lo reconstruye sólo cuando cambia la firma de la tabla o alguien llama a
+invalidar() (signals de Docente/Comision y la importación).
+"""
+import threading
+from collections import Counter, defaultdict
+
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import Length
+
+from academic.utils import tokenizar
+
+
+def trigramas(palabra):
+    """Trigramas de una palabra ya normalizada (como pg_trgm)."""
+    relleno = f'  {palabra} '
+    return frozenset(relleno[i:i + 3] for i in range(len(relleno) - 2))
+
+
+def similitud(tokens_consulta, tokens_texto, cache=None):
+    """
+    strict_word_similarity entre dos listas de tokens normalizados.
+
+    `cache` (dict token -> trigramas) evita recalcular los trigramas de
+    palabras repetidas.
+    """
+    cache = {} if cache is None else cache
+    consulta = frozenset().union(*(_trigramas_cache(t, cache) for t in tokens_consulta))
+    texto = [_trigramas_cache(t, cache) for t in tokens_texto]
+    return _mejor_tramo(consulta, texto)
+
+
+def _trigramas_cache(token, cache):
+    tri = cache.get(token)
+    if tri is None:
+        tri = cache[token] = trigramas(token)
+    return tri
+
+
+def _mejor_tramo(consulta, texto):
+    """Máximo Jaccard entre `consulta` y la unión de cada tramo de `texto`."""
+    if not consulta or not texto:
+        return 0.0
+    mejor = 0.0
+    for inicio in range(len(texto)):
+        tramo = set()
+        for tri in texto[inicio:]:
+            tramo |= tri
+            comunes = len(consulta & tramo)
+            if comunes:
+                mejor = max(mejor, comunes / (len(consulta) + len(tramo) - comunes))
+        if mejor == 1.0:
+            break
+    return mejor
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido en memoria sobre (pk, search_texto).
+
+    Uso:
+        indice = IndiceTrigramas(Docente.objects.values_list('pk', 'search_texto'))
+        indice.buscar('garsia', umbral=0.3)   # [(pk, similitud), ...] de mayor a menor
+    """
+
+    def __init__(self, filas):
+        self._trigramas = {}                 # token -> frozenset de trigramas
+        self._tokens = {}                    # pk -> tokens en orden
+        self._filas = defaultdict(set)       # trigrama -> pks
+        for pk, texto in filas:
+            tokens = (texto or '').split()
+            self._tokens[pk] = tokens
+            for token in tokens:
+                for tri in _trigramas_cache(token, self._trigramas):
+                    self._filas[tri].add(pk)
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def buscar(self, texto, umbral=0.3):
+        """
+        Filas con similitud >= umbral, ordenadas por similitud (y pk).
+
+        Primero cuenta trigramas compartidos con el índice invertido:
+        comunes / |consulta| es una cota superior de la similitud, así que
+        sólo se calcula la similitud exacta de las filas que pueden pasar
+        el umbral.
+        """
+        tokens = tokenizar(texto)
+        consulta = frozenset().union(*(trigramas(t) for t in tokens))
+        if not consulta:
+            return []
+
+        compartidos = Counter()
+        for tri in consulta:
+            compartidos.update(self._filas.get(tri, ()))
+
+        resultados = []
+        for pk, comunes in compartidos.items():
+            if comunes / len(consulta) < umbral:
+                continue
+            valor = _mejor_tramo(consulta, [self._trigramas[t] for t in self._tokens[pk]])
+            if valor >= umbral:
+                resultados.append((pk, valor))
+        resultados.sort(key=lambda item: (-item[1], item[0]))
+        return resultados
+
+
+# Índices por (alias de base, modelo, columna): (firma, IndiceTrigramas)
+_indices = {}
+_lock = threading.Lock()
+# Cambios hechos en este proceso (ver invalidar)
+_generacion = 0
+
+
+def invalidar():
+    """Marca los índices como viejos (cambios que la firma podría no ver)."""
+    global _generacion
+    with _lock:
+        _generacion += 1
+
+
+def generacion():
+    """Cantidad de invalidaciones de este proceso."""
+    return _generacion
+
+
+def firma(queryset, campo='search_texto'):
+    """
+    Firma barata de la tabla (una query de agregados): cambia con altas,
+    bajas y ediciones que alteran el largo de la columna, aunque las haga
+    otro proceso. Las de este proceso se ven además por invalidar().
+    """
+    datos = queryset.model._default_manager.using(queryset.db).aggregate(
+        filas=Count('pk'), maximo=Max('pk'), largo=Sum(Length(campo)),
+    )
+    return (_generacion, datos['filas'], datos['maximo'], datos['largo'])
+
+
+def indice_para(queryset, campo='search_texto'):
+    """IndiceTrigramas de toda la tabla del queryset, reconstruido si cambió."""
+    modelo = queryset.model
+    clave = (queryset.db, modelo._meta.label, campo)
+    actual = firma(queryset, campo)
+    with _lock:
+        guardado = _indices.get(clave)
+        if guardado is None or guardado[0] != actual:
+            filas = modelo._default_manager.using(queryset.db).values_list('pk', campo)
+            guardado = _indices[clave] = (actual, IndiceTrigramas(filas.iterator(chunk_size=2000)))
+        return guardado[1]
@@ -0,0 +1,153 @@
+"""
+Búsqueda unificada: comisiones, docentes y recomendaciones en una consulta.
+
+Cada tipo usa los índices que ya tiene y su relevancia se lleva a una escala
+común entre 0 y 1:
+
+    - comision / docente: similitud de trigramas sobre search_texto (como
+      ?q=, ver filtros.TrigramSearchFilter) unida a las coincidencias por
+      prefijo de palabra (como ?search=). Una coincidencia por prefijo vale
+      0.5 + similitud / 2, así "gar" no queda debajo de un error de tipeo.
+    - recomendacion: texto completo (scraping.busqueda) con todas las
+      palabras y la última como prefijo; el rango del motor r se lleva a
+      r / (1 + r).
+
+El resultado se guarda en el cache de Django por consulta normalizada,
+límites y versión del dataset (Cache_Metadatos.version): una consulta
+repetida no toca la base hasta que cambie el catálogo o venza el cache.
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.db import connections
+
+from academic.utils import tokenizar
+
+from .filtros import TrigramSearchFilter, filtrar_tokens
+from .trigramas import generacion, similitud
+
+TIPOS = ('comision', 'docente', 'recomendacion')
+
+LIMITE = 5
+LIMITE_MAX = 50
+UMBRAL = TrigramSearchFilter.UMBRAL
+CACHE_PREFIJO = 'busqueda'
+
+
+def consulta_normalizada(texto):
+    """Tokens normalizados de la consulta, separados por un espacio."""
+    return ' '.join(dict.fromkeys(tokenizar(texto)))
+
+
+def clave_cache(consulta, limites, version):
+    firma = repr((consulta, sorted(limites.items())))
+    digest = hashlib.sha1(firma.encode()).hexdigest()
+    return f'{CACHE_PREFIJO}:{version}:{generacion()}:{digest}'
+
+
+def relevancia_texto(rango):
+    """Rango del motor de texto completo (>= 0, sin techo) a la escala 0-1."""
+    rango = max(rango, 0.0)
+    return rango / (1 + rango)
+
+
+def _ranking_catalogo(queryset, consulta, limite):
+    """[(pk, relevancia), ...] de un modelo con search_texto."""
+    filtro = TrigramSearchFilter()
+    if connections[queryset.db].vendor == 'postgresql':
+        ranking = filtro.ranking_postgresql(queryset, 'search_texto', consulta, UMBRAL, limite)
+    else:
+        ranking = filtro.ranking_en_memoria(queryset, 'search_texto', consulta, UMBRAL, limite)
+    puntajes = dict(ranking.values_list('pk', 'similitud'))
+
+    tokens = consulta.split()
+    cache_trigramas = {}
+    for pk, texto in filtrar_tokens(queryset, consulta).order_by('pk').values_list('pk', 'search_texto')[:limite]:
+        valor = puntajes.get(pk)
+        if valor is None:
+            valor = similitud(tokens, texto.split(), cache_trigramas)
+        puntajes[pk] = 0.5 + valor / 2
+    return sorted(puntajes.items(), key=lambda item: (-item[1], item[0]))[:limite]
+
+
+def _buscar_docentes(consulta, limite):
+    from academic.models import Docente  # Import local para evitar ciclos
+
+    ranking = _ranking_catalogo(Docente.objects.all(), consulta, limite)
+    datos = Docente.objects.in_bulk([pk for pk, _ in ranking])
+    return [
+        {'tipo': 'docente', 'id': pk, 'texto': datos[pk].nombre_completo, 'detalle': '', 'relevancia': valor}
+        for pk, valor in ranking if pk in datos
+    ]
+
+
+def _buscar_comisiones(consulta, limite):
+    from academic.models import Comision  # Import local para evitar ciclos
+
+    ranking = _ranking_catalogo(Comision.objects.all(), consulta, limite)
+    datos = {
+        fila['pk']: fila for fila in Comision.objects.filter(pk__in=[pk for pk, _ in ranking])
+        .values('pk', 'codigo', 'nombre', 'cuatrimestre', 'docente__nombre_completo')
+    }
+    return [
+        {
+            'tipo': 'comision', 'id': pk, 'texto': f"{datos[pk]['codigo']} - {datos[pk]['nombre']}",
+            'detalle': ' · '.join(filter(None, [datos[pk]['docente__nombre_completo'], datos[pk]['cuatrimestre']])),
+            'relevancia': valor,
+        }
+        for pk, valor in ranking if pk in datos
+    ]
+
+
+def _buscar_recomendaciones(consulta, limite):
+    from recommendations.models import Recomendacion  # Import local para evitar ciclos
+    from scraping.busqueda import buscar  # Import local para evitar ciclos
+
+    palabras = consulta.split()
+    resultados = buscar('recomendacion', ' '.join(palabras[:-1] + [palabras[-1] + '*']), limite)
+    codigos = dict(
+        Recomendacion.objects.filter(pk__in=[r.id for r in resultados]).values_list('pk', 'comision__codigo')
+    )
+    return [
+        {
+            'tipo': 'recomendacion', 'id': r.id, 'texto': r.fragmento,
+            'detalle': codigos.get(r.id) or '', 'relevancia': relevancia_texto(r.rango),
+        }
+        for r in resultados
+    ]
+
+
+BUSCADORES = {
+    'comision': _buscar_comisiones,
+    'docente': _buscar_docentes,
+    'recomendacion': _buscar_recomendaciones,
+}
+
+
+def buscar(texto, limites):
+    """
+    Resultados de todos los tipos de `limites` ({tipo: máximo}), mezclados
+    por relevancia.
+
+    Devuelve {'q': consulta normalizada, 'version': ..., 'resultados': [...]}
+    (desde el cache si la misma consulta ya se hizo en esta versión).
+    """
+    from recommendations.models import Cache_Metadatos  # Import local para evitar ciclos
+
+    consulta = consulta_normalizada(texto)
+    version = Cache_Metadatos.get_cached_version()
+    if not consulta:
+        return {'q': consulta, 'version': version, 'resultados': []}
+
+    clave = clave_cache(consulta, limites, version)
+    respuesta = cache.get(clave)
+    if respuesta is None:
+        resultados = [
+            resultado
+            for tipo, limite in limites.items() if limite > 0
+            for resultado in BUSCADORES[tipo](consulta, limite)
+        ]
+        resultados.sort(key=lambda r: (-r['relevancia'], TIPOS.index(r['tipo']), r['id']))
+        respuesta = {'q': consulta, 'version': version, 'resultados': resultados}
+        cache.set(clave, respuesta)
+    return respuesta
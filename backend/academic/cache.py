@@ -0,0 +1,150 @@
+"""
+Cache de respuestas de lectura por versión del dataset y GET condicional.
+
+RespuestaVersionadaMixin guarda el `response.data` de list/retrieve en el
+cache de Django con una clave que incluye la URL (host, path y parámetros
+ordenados), el formato pedido y Cache_Metadatos.version. Un acierto
+devuelve los datos ya serializados sin tocar el ORM ni los serializers.
+
+Además responde con validadores HTTP:
+    - ETag fuerte: versión del dataset + firma de la URL (igual en todos
+      los procesos).
+    - Last-Modified: Cache_Metadatos.ultima_actualizacion, o el campo de
+      fecha del objeto en el detalle (campo_ultima_modificacion).
+    - If-None-Match / If-Modified-Since que coinciden → 304 antes de correr
+      la vista (sin queries en la lista; el detalle lee sólo la fecha, y si
+      el objeto no existe corre la vista para responder 404).
+
+No hace falta invalidar nada: cualquier escritura de Docente, Comision o
+Recomendacion sube la versión (signals, delete() y la importación, ver
+utils.catalogo_modificado) y las claves viejas dejan de usarse hasta que
+vencen por TIMEOUT.
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+CACHE_PREFIJO = 'respuesta'
+
+# Encabezados con los que get_conditional_response puede responder 304/412
+ENCABEZADOS_CONDICIONALES = ('HTTP_IF_MATCH', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_UNMODIFIED_SINCE')
+
+
+def metadatos_dataset():
+    """Cache_Metadatos actual (version, hash, ultima_actualizacion) desde el cache."""
+    from recommendations.models import Cache_Metadatos  # Import local para evitar ciclos
+
+    return Cache_Metadatos.get_cached_metadatos()
+
+
+def firma_request(request):
+    """sha1 de host, path, parámetros ordenados y formato de una request GET."""
+    parametros = sorted((k, v) for k, valores in request.query_params.lists() for v in valores)
+    formato = getattr(request, 'accepted_media_type', '')
+    firma = repr((request.get_host(), request.path, parametros, formato))
+    return hashlib.sha1(firma.encode()).hexdigest()
+
+
+def clave_respuesta(request, metadatos=None):
+    """
+    Clave de cache de una request GET para la versión actual del dataset.
+
+    Sólo versión y firma de la request: la misma en todos los procesos que
+    comparten el cache.
+    """
+    metadatos = metadatos or metadatos_dataset()
+    return f"{CACHE_PREFIJO}:{metadatos['version']}:{firma_request(request)}"
+
+
+def etag_respuesta(request, metadatos):
+    """ETag fuerte (con comillas) de la representación para esta versión."""
+    return quote_etag(f"{metadatos['version']}-{firma_request(request)[:20]}")
+
+
+class RespuestaVersionadaMixin:
+    """
+    Cachea list/retrieve de un ViewSet por versión del dataset y responde
+    304 a los GET condicionales.
+
+    Va antes del ViewSet base en la herencia:
+        class ComisionViewSet(RespuestaVersionadaMixin, viewsets.ModelViewSet)
+
+    Sólo sirve para respuestas que no dependen del usuario.
+    """
+    acciones_cacheadas = ('list', 'retrieve')
+    # Campo de fecha del modelo para el Last-Modified del detalle (None: el
+    # del dataset). Tiene que cambiar con cualquier cambio de la representación
+    campo_ultima_modificacion = None
+
+    def list(self, request, *args, **kwargs):
+        return self.respuesta_cacheada(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.respuesta_cacheada(super().retrieve, request, *args, **kwargs)
+
+    def ultima_modificacion(self, request, metadatos):
+        """
+        Fecha para Last-Modified. En el detalle con campo_ultima_modificacion
+        o con un GET condicional, una query de una columna; None si el objeto
+        no existe.
+        """
+        condicional = any(encabezado in request.META for encabezado in ENCABEZADOS_CONDICIONALES)
+        if self.action != 'retrieve' or not (self.campo_ultima_modificacion or condicional):
+            return metadatos['ultima_actualizacion']
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        fechas = list(
+            self.get_queryset().model._default_manager
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .values_list(self.campo_ultima_modificacion or 'pk', flat=True)[:1]
+        )
+        if not fechas:
+            return None
+        if self.campo_ultima_modificacion and fechas[0]:
+            return fechas[0]
+        return metadatos['ultima_actualizacion']
+
+    def respuesta_cacheada(self, vista, request, *args, **kwargs):
+        if self.action not in self.acciones_cacheadas:
+            return vista(request, *args, **kwargs)
+
+        metadatos = metadatos_dataset()
+        clave = clave_respuesta(request, metadatos)
+        guardado = cache.get(clave)
+        modificado = guardado['modificado'] if guardado is not None else self.ultima_modificacion(request, metadatos)
+        if modificado is None:
+            # Detalle inexistente: nunca 304, la vista responde 404
+            return vista(request, *args, **kwargs)
+        validadores = {
+            'ETag': etag_respuesta(request, metadatos),
+            'Last-Modified': http_date(modificado.timestamp()),
+        }
+
+        condicional = get_conditional_response(
+            request, etag=validadores['ETag'], last_modified=int(modificado.timestamp())
+        )
+        if condicional is not None:
+            if isinstance(condicional, HttpResponseNotModified):
+                return self.con_validadores(condicional, validadores)
+            return condicional
+
+        if guardado is not None:
+            return self.con_validadores(Response(guardado['datos']), validadores)
+        response = vista(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(clave, {'datos': response.data, 'modificado': modificado})
+            self.con_validadores(response, validadores)
+        return response
+
+    @staticmethod
+    def con_validadores(response, validadores):
+        for encabezado, valor in validadores.items():
+            response[encabezado] = valor
+        # El cliente puede guardar la respuesta pero tiene que revalidarla
+        patch_cache_control(response, no_cache=True)
+        return response
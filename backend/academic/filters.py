@@ -0,0 +1,39 @@
+"""
+FilterSets de la app academic (DjangoFilterBackend).
+
+Cada filtro estructurado es una igualdad (o IN) sobre una columna, así la
+base puede resolverlo con los índices de Comision.Meta.indexes en lugar de
+recorrer la tabla como ?search=.
+
+Valores múltiples separados por coma con el sufijo __in:
+
+    ?cuatrimestre=1C2025&ciclo=CPO&activa=true
+    ?sede__in=General,Penal&modalidad__in=Presencial,Híbrida
+"""
+from django_filters import rest_framework as django_filters
+
+from .models import Comision
+
+
+class ComisionFilter(django_filters.FilterSet):
+    """
+    Filtros de /api/catedras/.
+
+    cuatrimestre + ciclo + activa usan el índice compuesto del mismo orden;
+    sede, es_centro_externo, codigo_actividad y docente tienen índice propio.
+    """
+
+    class Meta:
+        model = Comision
+        fields = {
+            'cuatrimestre': ['exact', 'in'],
+            'ciclo': ['exact', 'in'],
+            'activa': ['exact'],
+            'sede': ['exact', 'in'],
+            'es_centro_externo': ['exact'],
+            'modalidad': ['exact', 'in'],
+            'ano': ['exact', 'in'],
+            'tipo_catedra': ['exact', 'in'],
+            'codigo_actividad': ['exact', 'in'],
+            'docente': ['exact', 'in'],
+        }
@@ -0,0 +1,13 @@
+"""
+Componentes reutilizables de la importación de comisiones.
+
+Los usa el comando import_comisiones y, a través de él, la API web.
+"""
+from .contenido import CAMPOS_CONTENIDO, campos_modificados, hash_contenido
+from .duplicados import DuplicateAnalyzer
+from .normalizacion import ComisionNormalizada, FilaNormalizada, normalizar_filas
+
+__all__ = [
+    'CAMPOS_CONTENIDO', 'ComisionNormalizada', 'DuplicateAnalyzer', 'FilaNormalizada',
+    'campos_modificados', 'hash_contenido', 'normalizar_filas',
+]
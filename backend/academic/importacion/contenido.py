@@ -0,0 +1,45 @@
+"""
+Hash del contenido importable de una comisión.
+
+La importación en modo diff compara este hash contra el guardado en
+Comision.hash_contenido para escribir sólo las comisiones que cambiaron.
+La identidad (código + docente + cuatrimestre + sede) no forma parte del
+hash: es la clave con la que se busca la comisión.
+"""
+import hashlib
+
+# Campos que vienen del archivo (además de la clave)
+CAMPOS_CONTENIDO = [
+    'codigo_actividad', 'nombre', 'modalidad', 'recomendacion_raw',
+    'es_centro_externo', 'ciclo', 'horario',
+]
+
+_SEPARADOR = '\x1f'
+
+
+def hash_contenido(valores):
+    """
+    Retorna el sha256 (hex) de los CAMPOS_CONTENIDO de un dict.
+
+    None y '' son equivalentes (el archivo nunca distingue entre ambos).
+    """
+    partes = []
+    for campo in CAMPOS_CONTENIDO:
+        valor = valores.get(campo)
+        if campo == 'nombre':
+            valor = (valor or '')[:200]
+        partes.append('' if valor is None else str(valor))
+    return hashlib.sha256(_SEPARADOR.join(partes).encode('utf-8')).hexdigest()
+
+
+def campos_modificados(comision, valores):
+    """Lista los CAMPOS_CONTENIDO en los que la comisión difiere de los valores."""
+    cambios = []
+    for campo in CAMPOS_CONTENIDO:
+        actual = getattr(comision, campo)
+        nuevo = valores.get(campo)
+        if campo == 'nombre':
+            nuevo = (nuevo or '')[:200]
+        if ('' if actual is None else str(actual)) != ('' if nuevo is None else str(nuevo)):
+            cambios.append(campo)
+    return cambios
@@ -0,0 +1,118 @@
+"""
+Análisis de duplicados dentro de un archivo de comisiones.
+
+Identificador único de una fila = código + docente + horario + sede.
+Varias filas con el mismo código son válidas (múltiples horarios), pero el
+mismo identificador repetido es un duplicado exacto.
+"""
+from collections import defaultdict
+
+
+class DuplicateAnalyzer:
+    """
+    Analizador de duplicados de una sola pasada (O(n)).
+
+    Se alimenta fila a fila mientras se lee el archivo y mantiene índices
+    anidados:
+        - ids: identificador -> {docente, horario, sede, filas}
+        - codigos: código -> docente -> set de horarios
+
+    Uso:
+        analizador = DuplicateAnalyzer()
+        for row in filas:
+            if analizador.add(row):
+                continue  # duplicado exacto de una fila anterior
+        resultado = analizador.result()
+    """
+
+    def __init__(self):
+        self.filas = 0
+        self.ids = {}
+        self.codigos = defaultdict(lambda: defaultdict(set))
+
+    @staticmethod
+    def identificador(row):
+        """Retorna (código, docente, horario, sede) normalizados de una fila."""
+        return (
+            (row.get('Comisión') or '').strip(),
+            (row.get('Docente') or '').strip(),
+            (row.get('Horario') or '').strip(),
+            (row.get('Sede') or '').strip(),
+        )
+
+    def add(self, row):
+        """
+        Registra una fila. Retorna True si es duplicado exacto de una anterior.
+
+        Las filas sin código se cuentan (para numerar filas) pero no se analizan.
+        """
+        self.filas += 1
+        codigo, docente, horario, sede = self.identificador(row)
+        if not codigo:
+            return False
+
+        id_unico = f"{codigo}|{docente}|{horario}|{sede}"
+        instancia = self.ids.get(id_unico)
+        if instancia is not None:
+            instancia['filas'].append(self.filas)
+            return True
+
+        self.ids[id_unico] = {
+            'codigo': codigo,
+            'docente': docente,
+            'horario': horario,
+            'sede': sede,
+            'filas': [self.filas],
+        }
+        self.codigos[codigo][docente].add(horario)
+        return False
+
+    def result(self):
+        """
+        Retorna diccionario con:
+        - exactos: combinaciones (código|docente|horario|sede) que aparecen múltiples veces
+        - variaciones: misma comisión pero diferente docente o horario
+        - warnings: lista de mensajes de advertencia
+        - errores: problemas serios (ej: múltiples docentes)
+        """
+        resultado = {'exactos': set(), 'variaciones': set(), 'warnings': [], 'errores': []}
+
+        # ANÁLISIS 1: duplicados exactos (mismo ID único aparece múltiples veces)
+        for id_unico, instancia in self.ids.items():
+            filas = instancia['filas']
+            if len(filas) > 1:
+                resultado['exactos'].add(id_unico)
+                resultado['warnings'].append(
+                    f"Comisión {instancia['codigo']} (docente: {instancia['docente']}, "
+                    f"horario: {instancia['horario']}, sede: {instancia['sede'] or 'N/D'}) "
+                    f"aparece {len(filas)} veces (idénticas, filas: {', '.join(map(str, filas))})"
+                )
+
+        for codigo, docentes in self.codigos.items():
+            if len(docentes) > 1:
+                # ANÁLISIS 2: misma comisión con múltiples docentes (ERROR)
+                resultado['errores'].append(
+                    f"Comisión {codigo} asignada a múltiples docentes: {', '.join(sorted(docentes))}"
+                )
+                # Marcar como variación para mostrar advertencia
+                resultado['variaciones'].add(codigo)
+                continue
+
+            # ANÁLISIS 3: un solo docente con múltiples horarios (válido)
+            docente_unico, horarios = next(iter(docentes.items()))
+            if len(horarios) > 1:
+                resultado['variaciones'].add(codigo)
+                resultado['warnings'].append(
+                    f"Comisión {codigo} ({docente_unico}) tiene {len(horarios)} horarios diferentes: "
+                    f"{', '.join(sorted(horarios))}"
+                )
+
+        return resultado
+
+    @classmethod
+    def analyze(cls, rows):
+        """Analiza un iterable completo de filas y retorna result()."""
+        analizador = cls()
+        for row in rows:
+            analizador.add(row)
+        return analizador.result()
@@ -0,0 +1,113 @@
+"""
+Eventos de una importación de comisiones.
+
+El comando import_comisiones emite eventos tipados en lugar de que los
+clientes (API, jobs) tengan que capturar todo su stdout:
+    - progress: filas leídas y etapa (lectura, escritura, consolidacion)
+    - warning:  advertencias (ej: duplicados en el archivo)
+    - error:    problemas de los datos o errores que cortan la importación
+    - summary:  estadísticas finales
+
+ImportEventLog cuenta todos los eventos por tipo, guarda sólo advertencias y
+errores (hasta MAX_LOG) y reenvía cada evento a los listeners registrados.
+"""
+import json
+from dataclasses import dataclass, field
+
+TIPOS = ('progress', 'warning', 'error', 'summary')
+
+# Advertencias/errores que se guardan; el resto sólo se cuenta
+MAX_LOG = 200
+
+
+@dataclass(slots=True)
+class ImportEvent:
+    """Evento de importación. `seq` numera los eventos guardados en el log."""
+    tipo: str
+    mensaje: str = ''
+    datos: dict = field(default_factory=dict)
+    seq: int | None = None
+
+    def as_dict(self):
+        evento = {'tipo': self.tipo, 'mensaje': self.mensaje, **self.datos}
+        if self.seq is not None:
+            evento['seq'] = self.seq
+        return evento
+
+
+class ImportEventLog:
+    """
+    Acumulador de eventos con contadores y log acotado.
+
+    Uso:
+        eventos = ImportEventLog(listeners=[lambda evento: ...])
+        eventos.progress(500)
+        eventos.warning('Comisión 0620 aparece 2 veces')
+        eventos.contadores  # {'progress': 1, 'warning': 1, 'error': 0, 'summary': 0}
+    """
+
+    def __init__(self, max_log=MAX_LOG, listeners=()):
+        self.max_log = max_log
+        self.listeners = list(listeners)
+        self.contadores = dict.fromkeys(TIPOS, 0)
+        self.log = []
+
+    def emit(self, tipo, mensaje='', **datos):
+        if tipo not in self.contadores:
+            raise ValueError(f'Tipo de evento desconocido: {tipo}')
+        self.contadores[tipo] += 1
+        evento = ImportEvent(tipo, mensaje, datos)
+        if tipo in ('warning', 'error') and len(self.log) < self.max_log:
+            evento.seq = len(self.log)
+            self.log.append(evento.as_dict())
+        for listener in self.listeners:
+            listener(evento)
+        return evento
+
+    def progress(self, filas, etapa='lectura', **datos):
+        return self.emit('progress', filas=filas, etapa=etapa, **datos)
+
+    def warning(self, mensaje, **datos):
+        return self.emit('warning', mensaje, **datos)
+
+    def error(self, mensaje, **datos):
+        return self.emit('error', mensaje, **datos)
+
+    def summary(self, stats, **datos):
+        return self.emit('summary', stats=stats, **datos)
+
+    def incorporar(self, otro, **datos):
+        """
+        Suma las advertencias y errores de otro log (el de un hilo lector),
+        con `datos` agregados a cada uno: los que `otro` guardó se vuelven a
+        emitir (log y listeners) y el resto sólo suma a los contadores.
+        """
+        reemitidos = dict.fromkeys(('warning', 'error'), 0)
+        for evento in otro.log:
+            extra = {k: v for k, v in evento.items() if k not in ('tipo', 'mensaje', 'seq')}
+            self.emit(evento['tipo'], evento['mensaje'], **{**extra, **datos})
+            reemitidos[evento['tipo']] += 1
+        for tipo, cantidad in reemitidos.items():
+            self.contadores[tipo] += otro.contadores[tipo] - cantidad
+
+    @property
+    def truncado(self):
+        """True si hubo más advertencias/errores de los que se guardaron."""
+        return self.contadores['warning'] + self.contadores['error'] > len(self.log)
+
+
+def formatear_ndjson(evento):
+    """Una línea NDJSON por evento."""
+    return json.dumps(evento, ensure_ascii=False, default=str) + '\n'
+
+
+def formatear_sse(evento):
+    """
+    Evento Server-Sent Events con el tipo como nombre de evento.
+
+    Las entradas del log llevan `id:` (su seq): al reconectarse, el
+    navegador lo manda en Last-Event-ID.
+    """
+    datos = json.dumps(evento, ensure_ascii=False, default=str)
+    id_evento = f"id: {evento['seq']}\n" if evento.get('seq') is not None else ''
+    return f"{id_evento}event: {evento['tipo']}\ndata: {datos}\n\n"
@@ -0,0 +1,203 @@
+"""
+Etapa de normalización de filas de la importación de comisiones.
+
+Convierte cada fila cruda del CSV/Excel (dict de columna -> texto) en un
+registro tipado, sin tocar la base de datos. Es código puro: no importa
+modelos ni usa la conexión, así que puede correr por lotes en un pool de
+procesos mientras el proceso principal sigue leyendo el archivo. La etapa
+de escritura (import_comisiones.bulk_upsert / diff_upsert) consume los
+registros resultantes.
+"""
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+
+from academic.utils import normalizar_texto
+
+# "205 (PRI) - DERECHO ROMANO" -> ("205", "DERECHO ROMANO")
+ACTIVIDAD_RE = re.compile(r'^(\S+)\s+\([^)]+\)\s*-\s*(.+)$')
+ANIO_RE = re.compile(r'20\d{2}')
+
+MODALIDADES = frozenset({'Presencial', 'Remota', 'Híbrida'})
+
+ORIENTACIONES_INTERNAS = frozenset({
+    'GENERAL', 'PENAL', 'NOTARIAL', 'AMBIENTAL', 'INT.PUBLICO', 'INT. PUBLICO',
+    'INMIG./REFUG.', 'VIOLENCIA DE GENERO', 'VIOLENCIA DE GÉNERO', 'CIVIL', 'EMPRESARIAL'
+})
+
+AFIRMATIVOS = frozenset({'si', 'sí', 'yes', 'true', '1', 'externo', 'externa'})
+
+# Filas por lote enviado a la etapa de normalización
+BATCH_SIZE = 1000
+
+
+@dataclass(slots=True)
+class ComisionNormalizada:
+    """Datos de comisión de una fila, listos para escribir."""
+    codigo: str
+    codigo_actividad: str
+    nombre: str
+    modalidad: str | None
+    sede: str
+    es_centro_externo: bool
+    ciclo: str
+    horario: str
+    recomendacion_raw: str
+    cuatrimestre: str
+
+
+@dataclass(slots=True)
+class FilaNormalizada:
+    """
+    Fila normalizada: docente + comisión (None si faltan actividad o código).
+
+    docente_id lo completa la etapa de escritura al resolver el docente.
+    """
+    docente_nombre_completo: str
+    docente_nombre: str
+    docente_apellido: str
+    docente_key: str
+    comision: ComisionNormalizada | None = None
+    docente_id: int | None = None
+
+
+def normalizar_fila(row, ciclo=''):
+    """
+    Normaliza una fila del CSV/Excel.
+
+    Retorna None si la fila no tiene docente. Si la fila tiene docente pero
+    le falta actividad o código, 'comision' queda en None (el docente se
+    crea igual).
+    """
+    docente_nombre_completo = (row.get('Docente') or '').strip()
+    if not docente_nombre_completo:
+        return None
+
+    # Formato: "APELLIDO NOMBRE" o "APELLIDO NOMBRE1 NOMBRE2"
+    partes = docente_nombre_completo.split(None, 1)
+    fila = FilaNormalizada(
+        docente_nombre_completo=docente_nombre_completo,
+        docente_nombre=' '.join(partes[1].split()) if len(partes) > 1 else '',
+        docente_apellido=partes[0],
+        docente_key=normalizar_texto(docente_nombre_completo),
+    )
+
+    actividad = (row.get('Actividad') or '').strip()
+    codigo_comision = (row.get('Comisión') or '').strip()
+    if not actividad or not codigo_comision:
+        return fila
+
+    match = ACTIVIDAD_RE.match(actividad)
+    if match:
+        codigo_actividad = match.group(1)
+        nombre_actividad = match.group(2).strip()
+    else:
+        codigo_actividad = ''
+        nombre_actividad = actividad
+
+    modalidad = (row.get('Modalidad') or '').strip()
+    sede = (row.get('Sede') or '').strip()
+
+    fila.comision = ComisionNormalizada(
+        codigo=codigo_comision,
+        codigo_actividad=codigo_actividad,
+        nombre=nombre_actividad,
+        modalidad=modalidad if modalidad in MODALIDADES else None,
+        sede=sede,
+        es_centro_externo=is_centro_externo(sede, row),
+        ciclo=ciclo,
+        horario=(row.get('Horario') or '').strip(),
+        recomendacion_raw=(row.get('RECOMENDACIÓN') or '').strip(),
+        cuatrimestre=extract_cuatrimestre((row.get('Período lectivo') or '').strip()),
+    )
+    return fila
+
+
+def normalizar_lote(rows, ciclo=''):
+    """Normaliza un lote de filas (unidad de trabajo del pool de procesos)."""
+    filas = []
+    for row in rows:
+        fila = normalizar_fila(row, ciclo)
+        if fila is not None:
+            filas.append(fila)
+    return filas
+
+
+def normalizar_filas(rows, ciclo='', workers=0, batch_size=BATCH_SIZE):
+    """
+    Normaliza un iterable de filas por lotes y genera FilaNormalizada en orden.
+
+    Con workers > 1 los lotes se procesan en un pool de procesos: mientras
+    los workers normalizan, el proceso principal sigue consumiendo `rows`
+    (lectura del archivo y análisis de duplicados). Se mantienen a lo sumo
+    2 * workers lotes en vuelo para acotar la memoria.
+    """
+    lotes = _lotes(rows, batch_size)
+    if workers <= 1:
+        for lote in lotes:
+            yield from normalizar_lote(lote, ciclo)
+        return
+
+    # spawn: los workers no heredan las conexiones a la base de datos
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        en_vuelo = []
+        for lote in lotes:
+            en_vuelo.append(pool.submit(normalizar_lote, lote, ciclo))
+            if len(en_vuelo) >= 2 * workers:
+                yield from en_vuelo.pop(0).result()
+        for futuro in en_vuelo:
+            yield from futuro.result()
+
+
+def extract_cuatrimestre(periodo_text):
+    """
+    Extrae el cuatrimestre del texto del período.
+
+    Ejemplos:
+        "PRIMER CUATRIMESTRE ABOGACÍA 2025" -> "1C2025"
+        "SEGUNDO BIMESTRE ABOGACÍA 2025" -> "2B2025"
+    """
+    year_match = ANIO_RE.search(periodo_text)
+    if not year_match:
+        return ''
+
+    texto = periodo_text.upper()
+    periodo = '2' if 'PRIMER' not in texto and 'SEGUNDO' in texto else '1'
+    tipo = 'B' if 'CUATRIMESTRE' not in texto and 'BIMESTRE' in texto else 'C'
+    return f"{periodo}{tipo}{year_match.group(0)}"
+
+
+def is_centro_externo(sede_value, row):
+    """
+    Determina si la comisión corresponde a un centro externo.
+
+    Reglas:
+    - Si existe una columna 'Centro externo'/'Centros externos' con valor afirmativo → True
+    - Si la sede no está en la lista de orientaciones internas conocidas → probablemente externo
+    """
+    centro_col = (row.get('Centro externo') or row.get('Centros externos') or '').strip().lower()
+    if centro_col in AFIRMATIVOS:
+        return True
+
+    sede_norm = (sede_value or '').strip().upper()
+    if not sede_norm:
+        return False
+
+    if sede_norm in ORIENTACIONES_INTERNAS:
+        return False
+
+    # Nombres institucionales (y, por defecto, cualquier sede que no sea
+    # una orientación conocida) se tratan como externos
+    return True
+
+
+def _lotes(rows, batch_size):
+    lote = []
+    for row in rows:
+        lote.append(row)
+        if len(lote) >= batch_size:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
@@ -0,0 +1,60 @@
+"""
+Plan de escritura de una importación de comisiones.
+
+import_comisiones decide en memoria qué hace con cada comisión antes de
+escribir: crear, actualizar, omitir, borrar (duplicados reemplazados),
+consolidar (duplicados que limpia la consolidación final) o desactivar
+(modo diff). ImportPlan guarda ese plan como resúmenes serializables; con
+--dry-run el comando sólo calcula el plan y no escribe nada.
+
+Cada comisión se resume con su clave legible:
+    {'codigo', 'docente', 'cuatrimestre', 'sede'}
+y las actualizaciones agregan 'campos' (los que cambian).
+"""
+from dataclasses import dataclass, field
+
+ACCIONES = ('crear', 'actualizar', 'omitir', 'eliminar', 'consolidar', 'desactivar')
+
+
+def resumir(codigo, docente, cuatrimestre, sede, **extra):
+    """Resumen de una comisión dentro del plan."""
+    return {'codigo': codigo, 'docente': docente, 'cuatrimestre': cuatrimestre, 'sede': sede, **extra}
+
+
+@dataclass(slots=True)
+class ImportPlan:
+    """Plan de una importación (o de la suma de varias, ver merge)."""
+    docentes_nuevos: list = field(default_factory=list)
+    crear: list = field(default_factory=list)
+    actualizar: list = field(default_factory=list)
+    omitir: list = field(default_factory=list)
+    eliminar: list = field(default_factory=list)
+    consolidar: list = field(default_factory=list)
+    desactivar: list = field(default_factory=list)
+    sin_cambios: int = 0
+
+    def merge(self, otro):
+        """Agrega el plan de otro archivo (importación en lote)."""
+        self.docentes_nuevos.extend(otro.docentes_nuevos)
+        for accion in ACCIONES:
+            getattr(self, accion).extend(getattr(otro, accion))
+        self.sin_cambios += otro.sin_cambios
+        return self
+
+    def hay_cambios(self):
+        """True si el plan escribe algo (omitir no escribe; consolidar lo hace la limpieza final)."""
+        return bool(self.docentes_nuevos or self.crear or self.actualizar or self.eliminar or self.desactivar)
+
+    def totales(self):
+        return {
+            'docentes_nuevos': len(self.docentes_nuevos),
+            **{accion: len(getattr(self, accion)) for accion in ACCIONES},
+            'sin_cambios': self.sin_cambios,
+        }
+
+    def as_dict(self):
+        return {
+            'totales': self.totales(),
+            'docentes': {'crear': list(self.docentes_nuevos)},
+            'comisiones': {accion: list(getattr(self, accion)) for accion in ACCIONES},
+        }
@@ -0,0 +1,161 @@
+"""
+Generador de archivos sintéticos de oferta de comisiones.
+
+Lo usa el comando benchmark_import para medir la importación con archivos
+de tamaño controlado. Las filas imitan el archivo real de la facultad:
+preámbulo antes del header, duplicados exactos, variaciones de horario
+(misma comisión y docente con otro horario) y centros externos.
+"""
+import csv
+import random
+
+HEADERS = [
+    'Período lectivo', 'Actividad', 'Comisión', 'Modalidad',
+    'Docente', 'Horario', 'RECOMENDACIÓN', 'Sede',
+]
+
+PREAMBULO = [
+    'FACULTAD DE DERECHO - OFERTA DE COMISIONES',
+    'Listado generado automáticamente',
+]
+
+PERIODOS = ['PRIMER CUATRIMESTRE ABOGACÍA 2025', 'SEGUNDO CUATRIMESTRE ABOGACÍA 2025']
+
+ACTIVIDADES = [
+    '205 (PRI) - DERECHO ROMANO', '2X8 (PRI) - DERECHO DE DAÑOS', '73U (PRI) - DERECHO PENAL I',
+    '85S (PRI) - CONTRATOS CIVILES Y COMERCIALES', '301 (PRI) - DERECHO CONSTITUCIONAL',
+    '412 (PRI) - DERECHO ADMINISTRATIVO', '520 (PRI) - SOCIEDADES', '611 (PRI) - DERECHO DE FAMILIA',
+    '702 (PRI) - DERECHO INTERNACIONAL PÚBLICO', '803 (PRI) - FINANZAS PÚBLICAS',
+    'PRÁCTICO PROFESIONAL', 'TEORÍA GENERAL DEL DERECHO',
+]
+
+APELLIDOS = [
+    'GARCÍA', 'LÓPEZ', 'MARTÍNEZ', 'RODRÍGUEZ', 'FERNÁNDEZ', 'GÓMEZ', 'PÉREZ', 'SÁNCHEZ',
+    'ROMERO', 'DÍAZ', 'ÁLVAREZ', 'TORRES', 'RUIZ', 'SUÁREZ', 'BENÍTEZ', 'ACOSTA', 'MEDINA',
+    'HERRERA', 'AGUIRRE', 'GIMÉNEZ', 'MOLINA', 'CASTRO', 'ROJAS', 'ORTIZ', 'SILVA',
+]
+
+NOMBRES = [
+    'JUAN', 'MARÍA', 'CARLOS', 'ANA', 'JOSÉ', 'LAURA', 'MARTÍN', 'SOFÍA', 'DIEGO', 'LUCÍA',
+    'PABLO', 'VALERIA', 'JORGE', 'CAROLINA', 'MIGUEL', 'FLORENCIA', 'RICARDO', 'PAULA',
+]
+
+DIAS = ['Lun', 'Mar', 'Mie', 'Jue', 'Vie', 'Sab']
+BANDAS = ['07:00 a 08:30', '08:30 a 10:00', '10:00 a 11:30', '17:00 a 18:30', '19:00 a 20:30', '21:00 a 22:30']
+
+ORIENTACIONES = ['GENERAL', 'PENAL', 'NOTARIAL', 'CIVIL', 'EMPRESARIAL']
+CENTROS_EXTERNOS = [
+    'COLEGIO PÚBLICO DE ABOGADOS', 'DEFENSORÍA GENERAL DE LA NACIÓN',
+    'HOSPITAL DE CLÍNICAS', 'TRIBUNAL ORAL EN LO CRIMINAL', 'CENTRO DE MEDIACIÓN COMUNITARIA',
+]
+
+RECOMENDACIONES = [
+    'Cátedra recomendable, toma asistencia', 'Cátedra exigente, parciales escritos',
+    'No toma trabajos prácticos', 'Buena llegada a los estudiantes',
+]
+
+# Proporciones de filas "problemáticas"
+PROPORCION_DUPLICADOS = 0.03
+PROPORCION_VARIACIONES = 0.10
+PROPORCION_CENTROS_EXTERNOS = 0.05
+PROPORCION_ORIENTACIONES = 0.10
+
+# Filas recientes de las que se toman duplicados y variaciones
+VENTANA = 1000
+
+
+def filas_sinteticas(cantidad, seed=0):
+    """Genera `cantidad` filas (dicts con HEADERS) de forma determinística."""
+    rng = random.Random(seed)
+    docentes = _docentes(max(10, cantidad // 4), rng)
+    recientes = []
+
+    for i in range(cantidad):
+        azar = rng.random()
+        if recientes and azar < PROPORCION_DUPLICADOS:
+            fila = dict(rng.choice(recientes))
+        elif recientes and azar < PROPORCION_DUPLICADOS + PROPORCION_VARIACIONES:
+            fila = dict(rng.choice(recientes))
+            fila['Horario'] = _horario(rng)
+        else:
+            fila = _fila_nueva(i, docentes, rng)
+
+        if len(recientes) < VENTANA:
+            recientes.append(fila)
+        else:
+            recientes[rng.randrange(VENTANA)] = fila
+        yield fila
+
+
+def escribir_csv(path, filas):
+    """Escribe las filas como CSV (utf-8, con preámbulo antes del header)."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for linea in PREAMBULO:
+            f.write(linea + '\n')
+        writer = csv.DictWriter(f, fieldnames=HEADERS)
+        writer.writeheader()
+        writer.writerows(filas)
+
+
+def escribir_xlsx(path, filas):
+    """Escribe las filas como .xlsx en modo write-only (requiere openpyxl)."""
+    import openpyxl  # type: ignore[import-not-found]
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for linea in PREAMBULO:
+        ws.append([linea])
+    ws.append(HEADERS)
+    for fila in filas:
+        ws.append([fila[h] for h in HEADERS])
+    wb.save(path)
+
+
+def _docentes(cantidad, rng):
+    docentes = []
+    for i in range(cantidad):
+        nombre = f'{rng.choice(APELLIDOS)} {rng.choice(NOMBRES)}'
+        # Sufijo para no agotar las combinaciones en archivos grandes
+        docentes.append(nombre if i < 200 else f'{nombre} {_sufijo(i)}')
+    return docentes
+
+
+def _sufijo(i):
+    letras = ''
+    while i:
+        i, resto = divmod(i, 26)
+        letras += chr(ord('A') + resto)
+    return letras + '.'
+
+
+def _horario(rng):
+    dias = rng.sample(DIAS, rng.choice([1, 2, 2, 3]))
+    banda = rng.choice(BANDAS)
+    return ' - '.join(f'{dia} {banda}' for dia in dias)
+
+
+def _fila_nueva(i, docentes, rng):
+    azar = rng.random()
+    if azar < PROPORCION_CENTROS_EXTERNOS:
+        sede = rng.choice(CENTROS_EXTERNOS)
+        modalidad = 'Presencial'
+        actividad = 'PRÁCTICO PROFESIONAL'
+    elif azar < PROPORCION_CENTROS_EXTERNOS + PROPORCION_ORIENTACIONES:
+        sede = rng.choice(ORIENTACIONES)
+        modalidad = rng.choice(['Presencial', 'Remota'])
+        actividad = rng.choice(ACTIVIDADES)
+    else:
+        sede = ''
+        modalidad = rng.choice(['Presencial', 'Presencial', 'Remota', 'Híbrida'])
+        actividad = rng.choice(ACTIVIDADES)
+
+    return {
+        'Período lectivo': rng.choice(PERIODOS),
+        'Actividad': actividad,
+        'Comisión': f'{i % 10000:04d}',
+        'Modalidad': modalidad,
+        'Docente': rng.choice(docentes),
+        'Horario': _horario(rng),
+        'RECOMENDACIÓN': rng.choice(RECOMENDACIONES) if rng.random() < 0.2 else '',
+        'Sede': sede,
+    }
@@ -0,0 +1,278 @@
+"""
+Escritura de la importación en PostgreSQL vía COPY + tabla de staging.
+
+import_comisiones decide en memoria qué comisiones se crean, actualizan y
+borran (bulk_upsert / diff_upsert); en PostgreSQL ese plan se escribe así:
+
+    1. COPY de las filas a una tabla UNLOGGED de staging (sin WAL ni índices)
+    2. DELETE / UPDATE ... FROM / INSERT ... SELECT set-based desde staging
+    3. DROP de la tabla de staging
+
+Los docentes se insertan con INSERT ... ON CONFLICT (nombre_normalizado)
+DO NOTHING y la consolidación de duplicados es un único DELETE con
+ROW_NUMBER() sobre los grupos copiados a staging.
+
+Como el plan es el mismo que usa el camino ORM (SQLite), ambos producen el
+mismo resultado para el mismo archivo; sólo cambia cómo viajan las filas.
+Todo corre dentro de la transacción de la importación: si se hace rollback
+(dry-run o error) la tabla de staging también desaparece.
+"""
+import uuid
+from datetime import date, datetime
+
+from django.db import connection
+
+# Valores de la columna `accion` de la tabla de staging de comisiones
+ACCION_INSERTAR = 'I'
+ACCION_ACTUALIZAR = 'U'
+ACCION_BORRAR = 'D'
+
+
+def disponible():
+    """True si la conexión activa es PostgreSQL (única que soporta COPY)."""
+    return connection.vendor == 'postgresql'
+
+
+class StagingWriter:
+    """
+    Escribe en PostgreSQL un plan de importación usando COPY.
+
+    Uso:
+        writer = StagingWriter()
+        ids = writer.insertar_docentes(docentes)           # {nombre_normalizado: id}
+        writer.escribir_comisiones(eliminar, modificadas, nuevas, campos)
+        eliminadas = writer.consolidar(claves)
+    """
+
+    def __init__(self):
+        from academic.models import Comision, Docente  # Import local para evitar ciclos
+
+        self.Comision = Comision
+        self.Docente = Docente
+        self.quote = connection.ops.quote_name
+
+    # ------------------------------------------------------------------
+    # Docentes
+    # ------------------------------------------------------------------
+    def insertar_docentes(self, docentes):
+        """
+        Inserta docentes con ON CONFLICT DO NOTHING (como ignore_conflicts).
+
+        Retorna {nombre_normalizado: id_docente} de todos los docentes
+        copiados, existieran o no.
+        """
+        if not docentes:
+            return {}
+
+        campos = self._campos_insert(self.Docente)
+        tabla = self.quote(self.Docente._meta.db_table)
+        pk = self.quote(self.Docente._meta.pk.column)
+        columnas = ', '.join(self.quote(f.column) for f in campos)
+
+        with connection.cursor() as cursor:
+            stage = self._crear_staging(cursor, self.Docente, campos)
+            try:
+                self._copy(cursor, stage, [f.column for f in campos] + ['orden'], (
+                    [self._valor(f, docente, add=True) for f in campos] + [orden]
+                    for orden, docente in enumerate(docentes)
+                ))
+                cursor.execute(
+                    f'INSERT INTO {tabla} ({columnas}) '
+                    f'SELECT {columnas} FROM {stage} ORDER BY orden '
+                    f'ON CONFLICT (nombre_normalizado) DO NOTHING'
+                )
+                cursor.execute(
+                    f'SELECT d.nombre_normalizado, d.{pk} FROM {tabla} d '
+                    f'JOIN {stage} s ON s.nombre_normalizado = d.nombre_normalizado'
+                )
+                return dict(cursor.fetchall())
+            finally:
+                cursor.execute(f'DROP TABLE {stage}')
+
+    # ------------------------------------------------------------------
+    # Comisiones
+    # ------------------------------------------------------------------
+    def escribir_comisiones(self, eliminar, modificadas, nuevas, campos_update):
+        """
+        Aplica el plan de escritura de comisiones en tres sentencias.
+
+        eliminar: pks a borrar; modificadas: Comision existentes a actualizar
+        (sólo campos_update, igual que bulk_update); nuevas: Comision a crear
+        (se insertan en el orden recibido, igual que bulk_create).
+        """
+        if not (eliminar or modificadas or nuevas):
+            return
+
+        Comision = self.Comision
+        meta = Comision._meta
+        pk_field = meta.pk
+        campos = [pk_field] + self._campos_insert(Comision)
+        tabla = self.quote(meta.db_table)
+        pk = self.quote(pk_field.column)
+        actualizar = [meta.get_field(nombre) for nombre in campos_update]
+
+        def filas():
+            orden = 0
+            for pk_valor in eliminar:
+                yield [pk_valor] + [None] * (len(campos) - 1) + [ACCION_BORRAR, orden]
+                orden += 1
+            for com in modificadas:
+                valores = {f.attname: self._valor(f, com) for f in actualizar}
+                yield (
+                    [com.pk] + [valores.get(f.attname) for f in campos[1:]]
+                    + [ACCION_ACTUALIZAR, orden]
+                )
+                orden += 1
+            for com in nuevas:
+                yield [None] + [self._valor(f, com, add=True) for f in campos[1:]] + [ACCION_INSERTAR, orden]
+                orden += 1
+
+        with connection.cursor() as cursor:
+            stage = self._crear_staging(cursor, Comision, campos, accion=True)
+            try:
+                self._copy(cursor, stage, [f.column for f in campos] + ['accion', 'orden'], filas())
+
+                # Borrar antes de escribir para no chocar con unique_together
+                if eliminar:
+                    cursor.execute(
+                        f'DELETE FROM {tabla} t USING {stage} s '
+                        f"WHERE s.accion = '{ACCION_BORRAR}' AND t.{pk} = s.{pk}"
+                    )
+                if modificadas:
+                    asignaciones = ', '.join(
+                        f'{self.quote(f.column)} = s.{self.quote(f.column)}' for f in actualizar
+                    )
+                    cursor.execute(
+                        f'UPDATE {tabla} t SET {asignaciones} FROM {stage} s '
+                        f"WHERE s.accion = '{ACCION_ACTUALIZAR}' AND t.{pk} = s.{pk}"
+                    )
+                if nuevas:
+                    columnas = ', '.join(self.quote(f.column) for f in campos[1:])
+                    cursor.execute(
+                        f'INSERT INTO {tabla} ({columnas}) '
+                        f"SELECT {columnas} FROM {stage} WHERE accion = '{ACCION_INSERTAR}' ORDER BY orden"
+                    )
+            finally:
+                cursor.execute(f'DROP TABLE {stage}')
+
+    def consolidar(self, claves):
+        """
+        Borra duplicados por código+docente+cuatrimestre+sede (horario más
+        largo gana, a igual largo el id más bajo) sólo en los grupos de
+        `claves`. Retorna la cantidad de comisiones eliminadas.
+        """
+        if not claves:
+            return 0
+
+        tabla = self.quote(self.Comision._meta.db_table)
+        pk = self.quote(self.Comision._meta.pk.column)
+
+        claves_campos = [
+            self.Comision._meta.get_field(nombre) for nombre in ('codigo', 'docente', 'cuatrimestre', 'sede')
+        ]
+        with connection.cursor() as cursor:
+            stage = self._crear_staging(cursor, self.Comision, claves_campos)
+            try:
+                self._copy(cursor, stage, [f.column for f in claves_campos], (
+                    list(clave) for clave in claves
+                ))
+                cursor.execute(
+                    f'DELETE FROM {tabla} t USING ('
+                    f'  SELECT c.{pk}, ROW_NUMBER() OVER ('
+                    f"    PARTITION BY c.codigo, c.docente_id, COALESCE(c.cuatrimestre, ''), c.sede"
+                    f'    ORDER BY COALESCE(LENGTH(c.horario), 0) DESC, c.{pk} ASC'
+                    f'  ) AS posicion'
+                    f'  FROM {tabla} c'
+                    f'  WHERE EXISTS ('
+                    f'    SELECT 1 FROM {stage} k'
+                    f'    WHERE k.codigo = c.codigo'
+                    f'      AND k.docente_id IS NOT DISTINCT FROM c.docente_id'
+                    f"      AND k.cuatrimestre = COALESCE(c.cuatrimestre, '')"
+                    f'      AND k.sede IS NOT DISTINCT FROM c.sede'
+                    f'  )'
+                    f') r WHERE t.{pk} = r.{pk} AND r.posicion > 1'
+                )
+                return cursor.rowcount
+            finally:
+                cursor.execute(f'DROP TABLE {stage}')
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _campos_insert(model):
+        """Campos concretos sin la clave primaria (autoincremental)."""
+        return [f for f in model._meta.concrete_fields if not f.primary_key]
+
+    @staticmethod
+    def _valor(field, obj, add=False):
+        """Valor listo para la base, igual que bulk_create/bulk_update."""
+        valor = field.pre_save(obj, add) if add else getattr(obj, field.attname)
+        return field.get_db_prep_save(valor, connection)
+
+    @staticmethod
+    def _nombre_staging(sufijo):
+        return f'academic_import_{sufijo}_{uuid.uuid4().hex[:12]}'
+
+    def _crear_staging(self, cursor, model, campos, accion=False):
+        """
+        Crea una tabla UNLOGGED con las columnas (y tipos) de `campos` y
+        una columna `orden` (más `accion` si se pide). Sin índices ni
+        constraints ni WAL: sólo recibe el COPY.
+        """
+        stage = self.quote(self._nombre_staging(model._meta.model_name))
+        columnas = ', '.join(f'{self.quote(f.column)}' for f in campos)
+        extra = ", ''::varchar(1) AS accion" if accion else ''
+        cursor.execute(
+            f'CREATE UNLOGGED TABLE {stage} AS '
+            f'SELECT {columnas}{extra}, 0::bigint AS orden '
+            f'FROM {self.quote(model._meta.db_table)} WITH NO DATA'
+        )
+        return stage
+
+    def _copy(self, cursor, tabla, columnas, filas):
+        """COPY ... FROM STDIN con psycopg 3 (write_row) o psycopg2 (copy_expert)."""
+        sql = f"COPY {tabla} ({', '.join(self.quote(c) for c in columnas)}) FROM STDIN"
+        if hasattr(cursor.cursor, 'copy'):
+            with cursor.cursor.copy(sql) as copy:
+                for fila in filas:
+                    copy.write_row(fila)
+        else:
+            cursor.cursor.copy_expert(sql, _TextoCopy(filas))
+
+
+class _TextoCopy:
+    """Archivo de sólo lectura en formato texto de COPY (para psycopg2)."""
+
+    def __init__(self, filas):
+        self._lineas = (
+            '\t'.join(_formatear_copy(valor) for valor in fila) + '\n'
+            for fila in filas
+        )
+        self._buffer = ''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            linea = next(self._lineas, None)
+            if linea is None:
+                break
+            self._buffer += linea
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _formatear_copy(valor):
+    r"""Formato texto de COPY: \N para NULL y escapes de \, tab y saltos de línea."""
+    if valor is None:
+        return r'\N'
+    if isinstance(valor, bool):
+        return 't' if valor else 'f'
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    texto = str(valor)
+    return (
+        texto.replace('\\', '\\\\').replace('\t', '\\t')
+        .replace('\n', '\\n').replace('\r', '\\r')
+    )
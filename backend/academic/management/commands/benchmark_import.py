@@ -0,0 +1,318 @@
+"""
+Benchmark de throughput de import_comisiones.
+
+Uso:
+    python manage.py benchmark_import
+    python manage.py benchmark_import --sizes 1000 10000 --formats csv
+    DJANGO_ENV=production DATABASE_URL=postgres://... python manage.py benchmark_import
+
+Genera archivos sintéticos (ver academic.importacion.sintetico), los importa
+sobre una base de datos de test descartable (la de la configuración activa:
+SQLite o PostgreSQL) y mide por fase:
+    - read:    lectura del archivo (CSV/Excel en streaming, a una lista)
+    - dedupe:  análisis de duplicados y etapa de normalización de filas
+    - write:   resolución de docentes y escritura en lote
+    - cleanup: consolidación de comisiones duplicadas
+
+Para cada fase registra tiempo, cantidad de queries y pico de memoria
+(tracemalloc). Los resultados se agregan a un historial JSON y se comparan
+con la corrida anterior del mismo motor de base de datos.
+"""
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from academic.importacion import DuplicateAnalyzer
+from academic.importacion import normalizacion, sintetico
+from academic.management.commands import import_comisiones
+from academic.models import Docente, Comision
+from academic.utils import DocenteIndex
+
+FASES = ['read', 'dedupe', 'write', 'cleanup']
+
+
+class Command(BaseCommand):
+    help = 'Mide tiempo, queries y memoria de import_comisiones con archivos sintéticos'
+
+    DEFAULT_SIZES = [1000, 10000, 100000]
+    DEFAULT_FORMATS = ['csv', 'xlsx']
+    DEFAULT_OUTPUT = Path(settings.BASE_DIR) / 'benchmarks' / 'import_history.json'
+
+    # Opciones de medición (handle las toma de la línea de comandos)
+    medir_memoria = True
+    workers = 0
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=self.DEFAULT_SIZES,
+            help='Cantidades de filas a generar (default: 1000 10000 100000)'
+        )
+        parser.add_argument(
+            '--formats',
+            nargs='+',
+            choices=self.DEFAULT_FORMATS,
+            default=self.DEFAULT_FORMATS,
+            help='Formatos de archivo a medir'
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=str(self.DEFAULT_OUTPUT),
+            help='Historial JSON donde se agregan los resultados'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=2025,
+            help='Semilla del generador (mismos archivos entre corridas)'
+        )
+        parser.add_argument(
+            '--label',
+            type=str,
+            default='',
+            help='Etiqueta libre para identificar la corrida en el historial'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=0,
+            help='Procesos de la etapa de normalización (como import_comisiones --workers)'
+        )
+        parser.add_argument(
+            '--no-memory',
+            action='store_true',
+            help='No medir memoria (tracemalloc agrega overhead al tiempo)'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=20.0,
+            help='Porcentaje de aumento de tiempo a partir del cual se marca una regresión'
+        )
+        parser.add_argument(
+            '--fail-on-regression',
+            action='store_true',
+            help='Termina con error si hay regresiones respecto de la corrida anterior'
+        )
+
+    def handle(self, *args, **options):
+        self.medir_memoria = not options['no_memory']
+        self.workers = options['workers']
+        output = Path(options['output'])
+
+        if 'xlsx' in options['formats']:
+            try:
+                import openpyxl  # type: ignore[import-not-found]  # noqa: F401
+            except ImportError as exc:
+                raise CommandError(
+                    'Para medir archivos .xlsx, instala openpyxl:\n'
+                    'pip install openpyxl'
+                ) from exc
+
+        corrida = {
+            'fecha': timezone.now().isoformat(),
+            'label': options['label'],
+            'git': self.git_revision(),
+            'vendor': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'seed': options['seed'],
+            'memoria': self.medir_memoria,
+            'workers': self.workers,
+            'resultados': [],
+        }
+
+        # Base de datos de test: nunca se tocan los datos reales
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with tempfile.TemporaryDirectory(prefix='benchmark-import-') as tmpdir:
+                for filas in options['sizes']:
+                    for formato in options['formats']:
+                        path = Path(tmpdir) / f'oferta_{filas}.{formato}'
+                        self.generar_archivo(path, formato, filas, options['seed'])
+                        resultado = self.medir(path, formato, filas)
+                        corrida['resultados'].append(resultado)
+                        self.print_resultado(resultado)
+                        self.limpiar_tablas()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        historial = self.cargar_historial(output)
+        regresiones = self.comparar(corrida, historial, options['threshold'])
+        historial.append(corrida)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(historial, indent=2, ensure_ascii=False), encoding='utf-8')
+        self.stdout.write(f'\n💾 Resultados agregados a {output}')
+
+        if regresiones and options['fail_on_regression']:
+            raise CommandError(f'{len(regresiones)} regresiones detectadas')
+
+    def generar_archivo(self, path, formato, filas, seed):
+        """Genera el archivo sintético (no forma parte de la medición)."""
+        self.stdout.write(f'\n🧪 Generando {formato.upper()} de {filas} filas...')
+        datos = sintetico.filas_sinteticas(filas, seed=seed)
+        if formato == 'csv':
+            sintetico.escribir_csv(path, datos)
+        else:
+            sintetico.escribir_xlsx(path, datos)
+
+    def medir(self, path, formato, filas):
+        """Importa el archivo fase por fase y retorna las métricas."""
+        cmd = import_comisiones.Command()
+        cmd.stdout = StringIO()
+        cmd.stderr = StringIO()
+        cmd.ciclo_import = 'CPO'
+        fases = {}
+
+        with self.fase(fases, 'read'):
+            reader = cmd.read_csv if formato == 'csv' else cmd.read_excel
+            data = list(reader(path))
+
+        with self.fase(fases, 'dedupe'):
+            analizador = DuplicateAnalyzer()
+            unicas = (row for row in data if not analizador.add(row))
+            registros = list(normalizacion.normalizar_filas(unicas, cmd.ciclo_import, workers=self.workers))
+            dup_info = analizador.result()
+        del data
+
+        with self.fase(fases, 'write'):
+            with transaction.atomic():
+                cmd.docente_index = DocenteIndex()
+                stats = cmd.bulk_upsert(registros, update_existing=False)
+
+        with self.fase(fases, 'cleanup'):
+            cmd.cleanup_comisiones_duplicadas(cmd.claves_importadas)
+
+        return {
+            'formato': formato,
+            'filas': filas,
+            'tamano_bytes': path.stat().st_size,
+            'fases': fases,
+            'total_segundos': round(sum(f['segundos'] for f in fases.values()), 4),
+            'total_queries': sum(f['queries'] for f in fases.values()),
+            'stats': stats,
+            'duplicados_exactos': len(dup_info['exactos']),
+            'comisiones': Comision.objects.count(),
+        }
+
+    @contextmanager
+    def fase(self, fases, nombre):
+        """Mide tiempo, queries y pico de memoria del bloque."""
+        queries = 0
+
+        def contar(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        if self.medir_memoria:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        try:
+            with connection.execute_wrapper(contar):
+                yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            pico = None
+            if self.medir_memoria:
+                _, pico = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            fases[nombre] = {
+                'segundos': round(segundos, 4),
+                'queries': queries,
+                'memoria_pico_mb': round(pico / 1024 / 1024, 2) if pico is not None else None,
+            }
+
+    def limpiar_tablas(self):
+        Comision.objects.all().delete()
+        Docente.objects.all().delete()
+
+    def git_revision(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                cwd=settings.BASE_DIR, text=True, stderr=subprocess.DEVNULL,
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def cargar_historial(self, output):
+        if not output.exists():
+            return []
+        try:
+            historial = json.loads(output.read_text(encoding='utf-8'))
+        except json.JSONDecodeError as exc:
+            raise CommandError(f'El historial {output} no es un JSON válido: {exc}') from exc
+        if not isinstance(historial, list):
+            raise CommandError(f'El historial {output} debe ser una lista de corridas')
+        return historial
+
+    def comparar(self, corrida, historial, threshold):
+        """
+        Compara contra la última corrida del mismo motor de base de datos.
+
+        Marca regresión si el tiempo total sube más de `threshold` % o si
+        crece la cantidad de queries (que no depende de la máquina).
+        """
+        anterior = next(
+            (c for c in reversed(historial) if c.get('vendor') == corrida['vendor']),
+            None,
+        )
+        if anterior is None:
+            return []
+
+        previos = {(r['formato'], r['filas']): r for r in anterior.get('resultados', [])}
+        regresiones = []
+        self.stdout.write(
+            f"\n📈 Comparación con la corrida del {anterior.get('fecha', '?')} ({anterior.get('git') or 'sin git'}):"
+        )
+        for resultado in corrida['resultados']:
+            previo = previos.get((resultado['formato'], resultado['filas']))
+            if previo is None:
+                continue
+            nombre = f"{resultado['formato'].upper()} {resultado['filas']}"
+            delta = self.porcentaje(previo['total_segundos'], resultado['total_segundos'])
+            linea = f"   • {nombre}: {previo['total_segundos']}s → {resultado['total_segundos']}s ({delta:+.1f}%)"
+            problemas = []
+            if delta > threshold:
+                problemas.append('más lento')
+            if resultado['total_queries'] > previo['total_queries']:
+                problemas.append(f"queries {previo['total_queries']} → {resultado['total_queries']}")
+            if problemas:
+                regresiones.append(nombre)
+                linea += f"  ⚠️  {', '.join(problemas)}"
+            self.stdout.write(linea)
+        if not any((r['formato'], r['filas']) in previos for r in corrida['resultados']):
+            self.stdout.write('   (sin resultados comparables)')
+        return regresiones
+
+    @staticmethod
+    def porcentaje(antes, despues):
+        if not antes:
+            return 0.0
+        return (despues - antes) / antes * 100
+
+    def print_resultado(self, resultado):
+        self.stdout.write(
+            f"📊 {resultado['formato'].upper()} {resultado['filas']} filas: "
+            f"{resultado['total_segundos']}s, {resultado['total_queries']} queries, "
+            f"{resultado['comisiones']} comisiones"
+        )
+        for nombre in FASES:
+            fase = resultado['fases'][nombre]
+            memoria = f", {fase['memoria_pico_mb']} MB" if fase['memoria_pico_mb'] is not None else ''
+            self.stdout.write(f"   • {nombre:<8} {fase['segundos']:>8.3f}s  {fase['queries']:>5} queries{memoria}")
@@ -4,10 +4,13 @@ Management command para importar comisiones desde CSV/Excel.
 Uso:
     python manage.py import_comisiones ruta/al/archivo.csv
     python manage.py import_comisiones ruta/al/archivo.xlsx --dry-run
+    python manage.py import_comisiones ruta/al/archivo.csv --diff --deactivate-missing --ciclo CPO
+    python manage.py import_comisiones ruta/al/archivo.csv -v 2   # detalle por comisión
+    python manage.py import_comisiones ruta/al/archivo.csv --backend orm   # forzar el ORM en PostgreSQL
 
 Formatos soportados:
-    - CSV (separado por comas)
-    - Excel (.xlsx)
+    - CSV (separado por comas o punto y coma)
+    - Excel (.xlsx / .xls)
 
 Columnas esperadas:
     - Período lectivo
@@ -20,22 +23,62 @@ Columnas esperadas:
     - Sede (opcional, útil para práctico profesional y centros externos)
     - Ciclo (CPO/CPC) → ahora se requiere indicar el ciclo en la ejecución
 """
+import codecs
 import csv
-import re
+import itertools
+from contextlib import nullcontext
 from pathlib import Path
 from collections import defaultdict
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.db.models import F, Q, Value, Window
+from django.db.models.functions import Coalesce, Length, RowNumber
+from django.utils import timezone
+from dataclasses import asdict
+from academic.importacion import CAMPOS_CONTENIDO, DuplicateAnalyzer, campos_modificados, hash_contenido
+from academic.importacion import normalizacion, staging
+from academic.importacion.plan import ImportPlan, resumir
+from academic.importacion.eventos import ImportEventLog
 from academic.models import Docente, Comision
+from academic.utils import DocenteIndex, catalogo_modificado
 
 
 class Command(BaseCommand):
     help = 'Importa comisiones y docentes desde un archivo CSV o Excel'
 
-    ORIENTACIONES_INTERNAS = {
-        'GENERAL', 'PENAL', 'NOTARIAL', 'AMBIENTAL', 'INT.PUBLICO', 'INT. PUBLICO',
-        'INMIG./REFUG.', 'VIOLENCIA DE GENERO', 'VIOLENCIA DE GÉNERO', 'CIVIL', 'EMPRESARIAL'
-    }
+    # Tamaño de lote para bulk_create/bulk_update/delete
+    BATCH_SIZE = 500
+
+    # Cada cuántas filas leídas se emite un evento de progreso
+    PROGRESS_EVERY = 500
+
+    # Las líneas por comisión/docente sólo se muestran con --verbosity 2
+    verbosity = 1
+
+    # Lectura de CSV en streaming: muestra para detectar formato y tamaño de bloque
+    CSV_SAMPLE_SIZE = 64 * 1024
+    CSV_CHUNK_SIZE = 64 * 1024
+    CSV_ENCODINGS = ['utf-8-sig', 'utf-8', 'iso-8859-1', 'cp1252']
+
+    # Filas que se inspeccionan en Excel para encontrar el header
+    EXCEL_HEADER_SCAN_ROWS = 50
+
+    # Campos que se sobrescriben al crear/actualizar una comisión desde el archivo
+    UPSERT_FIELDS = [
+        'codigo_actividad', 'nombre', 'modalidad', 'recomendacion_raw',
+        'sede', 'es_centro_externo', 'ciclo', 'activa',
+    ]
+
+    # Escritura: 'auto' usa COPY + staging en PostgreSQL y el ORM en el resto
+    BACKENDS = ['auto', 'orm', 'copy']
+    backend = 'auto'
+
+    # Modo plan (--dry-run): calcula el plan en memoria sin escribir
+    solo_plan = False
+    estado = None
+
+    # ImportEventLog de la ejecución (handle lo crea; lectores sueltos, al decodificar)
+    events = None
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -53,6 +96,28 @@ class Command(BaseCommand):
             action='store_true',
             help='Actualiza comisiones existentes en lugar de omitirlas'
         )
+        parser.add_argument(
+            '--diff',
+            action='store_true',
+            help='Compara el hash de cada comisión y sólo escribe las nuevas o modificadas'
+        )
+        parser.add_argument(
+            '--deactivate-missing',
+            action='store_true',
+            help='Con --diff y --ciclo: marca inactivas las comisiones del cuatrimestre/ciclo que ya no están en el archivo'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=0,
+            help='Procesos para normalizar filas en paralelo (0 = en el proceso actual)'
+        )
+        parser.add_argument(
+            '--backend',
+            choices=self.BACKENDS,
+            default='auto',
+            help='Escritura: auto (COPY + staging en PostgreSQL, ORM en SQLite), orm o copy'
+        )
         parser.add_argument(
             '--ciclo',
             type=str,
@@ -67,155 +132,293 @@ class Command(BaseCommand):
         file_path = Path(options['file_path'])
         dry_run = options['dry_run']
         update_existing = options['update_existing']
+        diff = options.get('diff', False)
+        deactivate_missing = options.get('deactivate_missing', False)
+        workers = options.get('workers') or 0
         ciclo = (options.get('ciclo') or '').strip().upper()
+        self.verbosity = options.get('verbosity', 1)
+        # Uso programático (ImportJob): eventos de progreso/advertencias/errores
+        self.events = options.get('events') or ImportEventLog()
 
         if ciclo and ciclo not in {'CPO', 'CPC'}:
             raise CommandError('El ciclo debe ser CPO o CPC si se especifica.')
 
+        if deactivate_missing and not diff:
+            raise CommandError('--deactivate-missing sólo puede usarse junto con --diff.')
+        if deactivate_missing and not ciclo:
+            raise CommandError('--deactivate-missing requiere --ciclo: sin ciclo desactivaría todo el cuatrimestre.')
+
+        self.backend = options.get('backend') or 'auto'
+        self.usar_copy()
         self.ciclo_import = ciclo
+        self.solo_plan = dry_run
+        self.estado = None
+
+        data = self.open_reader(file_path)
+        stats = self.empty_stats()
+        registros, analizador = self.read_registros(data, ciclo, stats, workers=workers)
+
+        # Detectar duplicados en el archivo
+        dup_info = analizador.result()
+        self.report_duplicates(dup_info)
+
+        self.events.progress(analizador.filas, etapa='escritura')
+
+        # --dry-run sólo planifica: lee el estado actual una vez y calcula en
+        # memoria lo que se escribiría, sin transacción ni locks de escritura
+        with nullcontext() if dry_run else transaction.atomic():
+            # Escritura en lote: cantidad constante de queries sin importar las filas
+            self.docente_index = DocenteIndex()
+            self.diff_report = None
+            if diff:
+                result = self.diff_upsert(registros, deactivate_missing)
+            else:
+                result = self.bulk_upsert(registros, update_existing)
+            for key, value in result.items():
+                if key in stats:
+                    stats[key] += value
+
+        # Consolidar duplicados: mismo código + docente + cuatrimestre + sede
+        # nos quedamos con el horario más descriptivo (string más largo)
+        # para evitar fichas duplicadas con horarios parciales en el front.
+        if not dry_run:
+            self.events.progress(analizador.filas, etapa='consolidacion')
+            consolidadas = self.cleanup_comisiones_duplicadas(self.claves_importadas)
+            # bulk_create/bulk_update no disparan signals
+            if consolidadas or self.plan.hay_cambios():
+                transaction.on_commit(catalogo_modificado)
 
-        # Verificar que el archivo existe
+        # Guardar resultado para usos programáticos (API, tests, etc.)
+        self.last_run_result = {
+            'stats': stats,
+            'duplicates': dup_info,
+            'dry_run': dry_run,
+            'filas': analizador.filas,
+            'diff': self.diff_report,
+            'plan': self.plan.as_dict(),
+        }
+
+        self.events.summary(stats, dry_run=dry_run, filas=analizador.filas)
+
+        # Mostrar resumen
+        if dry_run:
+            self.print_plan(self.plan)
+        self.print_summary(stats, dry_run)
+
+    def open_reader(self, file_path):
+        """Valida el archivo y retorna el generador de filas según su extensión."""
         if not file_path.exists():
             raise CommandError(f'El archivo {file_path} no existe')
 
-        # Determinar el tipo de archivo
         if file_path.suffix.lower() == '.csv':
-            data = self.read_csv(file_path)
-        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-            data = self.read_excel(file_path)
-        else:
-            raise CommandError(f'Formato no soportado: {file_path.suffix}')
+            return self.read_csv(file_path)
+        if file_path.suffix.lower() in ['.xlsx', '.xls']:
+            return self.read_excel(file_path)
+        raise CommandError(f'Formato no soportado: {file_path.suffix}')
 
-        # Estadísticas
-        stats = {
+    @staticmethod
+    def empty_stats():
+        """Estadísticas de una importación en cero."""
+        return {
             'docentes_creados': 0,
             'docentes_existentes': 0,
             'comisiones_creadas': 0,
             'comisiones_actualizadas': 0,
             'comisiones_omitidas': 0,
+            'comisiones_sin_cambios': 0,
+            'comisiones_desactivadas': 0,
             'duplicados_exactos_omitidos': 0,
             'variaciones_detectadas': 0,
             'errores': 0,
         }
 
-        # Detectar duplicados en el archivo
-        dup_info = self.detect_duplicates(data)
-        
-        # Mostrar advertencias
+    def read_registros(self, data, ciclo, stats, workers=0):
+        """
+        Lee, analiza duplicados y normaliza las filas en una sola pasada.
+
+        El lector es un generador: el analizador de duplicados se alimenta
+        mientras se lee y las filas únicas pasan por lotes a la etapa de
+        normalización (pura, opcionalmente en un pool de procesos). No toca
+        la base de datos. Retorna (registros tipados, analizador).
+        """
+        analizador = DuplicateAnalyzer()
+
+        def filas_unicas():
+            for row in data:
+                # Identificador único: código + docente + horario + sede.
+                # Si ya apareció es un duplicado exacto: sólo se procesa la primera aparición.
+                duplicada = analizador.add(row)
+                if analizador.filas % self.PROGRESS_EVERY == 0:
+                    self.events.progress(analizador.filas)
+                if duplicada:
+                    stats['duplicados_exactos_omitidos'] += 1
+                    continue
+                yield row
+
+        registros = list(normalizacion.normalizar_filas(filas_unicas(), ciclo, workers=workers))
+        self.events.progress(analizador.filas)
+        return registros, analizador
+
+    def report_duplicates(self, dup_info, archivo=None):
+        """Muestra las advertencias de duplicados y las emite como eventos."""
+        extra = {'archivo': archivo} if archivo else {}
         if dup_info['warnings']:
-            self.stdout.write('\n⚠️  DUPLICADOS DETECTADOS EN EL ARCHIVO:')
+            titulo = f' ({archivo})' if archivo else ''
+            self.stdout.write(f'\n⚠️  DUPLICADOS DETECTADOS EN EL ARCHIVO{titulo}:')
             for warning in dup_info['warnings']:
                 self.stdout.write(f"   {warning}")
             self.stdout.write('')
+        for warning in dup_info['warnings']:
+            self.events.warning(warning, origen='duplicados', **extra)
+        for error in dup_info['errores']:
+            self.events.error(error, origen='duplicados', **extra)
 
-        with transaction.atomic():
-            procesadas = set()  # Rastrear comisiones ya procesadas (código + docente + horario)
-            
-            for row in data:
-                # Verificar si esta combinación ya fue procesada
-                codigo_comision = (row.get('Comisión') or '').strip()
-                docente_nombre = (row.get('Docente') or '').strip()
-                horario = (row.get('Horario') or '').strip()
-                sede = (row.get('Sede') or '').strip()
-                
-                # Identificador único: código + docente + horario + sede
-                identificador = f"{codigo_comision}|{docente_nombre}|{horario}|{sede}"
-                
-                if identificador and identificador in dup_info['exactos']:
-                    if identificador in procesadas:
-                        # Ya procesamos esta combinación exacta
-                        stats['duplicados_exactos_omitidos'] += 1
-                        continue
-                    procesadas.add(identificador)
-                elif codigo_comision and codigo_comision in dup_info['variaciones']:
-                    # Para variaciones, permitir que se procesen (múltiples horarios válidos)
-                    if identificador in procesadas:
-                        stats['variaciones_detectadas'] += 1
-                        continue
-                    procesadas.add(identificador)
-                
-                result = self.process_row(row, update_existing)
-                if result:
-                    for key, value in result.items():
-                        if key in stats:
-                            stats[key] += value
-
-            # Si es dry-run, hacer rollback
-            if dry_run:
-                transaction.set_rollback(True)
+    def usar_copy(self):
+        """
+        True si la escritura va por COPY + tabla de staging (importacion.staging).
 
-        # Consolidar duplicados: mismo código + docente + cuatrimestre + sede
-        # nos quedamos con el horario más descriptivo (string más largo)
-        # para evitar fichas duplicadas con horarios parciales en el front.
-        if not dry_run:
-            self.cleanup_comisiones_duplicadas()
+        'auto' lo elige cuando la conexión es PostgreSQL; en SQLite se usa
+        siempre el ORM. Ambos caminos escriben el mismo plan.
+        """
+        if self.backend == 'copy' and not staging.disponible():
+            raise CommandError('--backend copy requiere PostgreSQL.')
+        return self.backend == 'copy' or (self.backend == 'auto' and staging.disponible())
 
-        # Guardar resultado para usos programáticos (API, tests, etc.)
-        self.last_run_result = {
-            'stats': stats,
-            'duplicates': dup_info,
-            'dry_run': dry_run,
-        }
+    def write_comisiones(self, eliminar, modificadas, nuevas):
+        """
+        Escribe el plan de bulk_upsert/diff_upsert: borra, actualiza y crea.
 
-        # Mostrar resumen
-        self.print_summary(stats, dry_run)
+        Con el ORM son DELETE por lote + bulk_update + bulk_create; en
+        PostgreSQL, un COPY a staging y tres sentencias set-based.
+        """
+        campos = self.UPSERT_FIELDS + ['horario', 'hash_contenido', 'search_texto', 'ultima_actualizacion_scraping', 'modificado']
+        if self.usar_copy():
+            staging.StagingWriter().escribir_comisiones(eliminar, modificadas, nuevas, campos)
+            return
+
+        # Borrar antes de escribir para no chocar con unique_together
+        for i in range(0, len(eliminar), self.BATCH_SIZE):
+            Comision.objects.filter(id_comision__in=eliminar[i:i + self.BATCH_SIZE]).delete()
+        if modificadas:
+            Comision.objects.bulk_update(modificadas, campos, batch_size=self.BATCH_SIZE)
+        if nuevas:
+            Comision.objects.bulk_create(nuevas, batch_size=self.BATCH_SIZE)
 
     def read_csv(self, file_path):
-        """Lee un archivo CSV y retorna una lista de diccionarios."""
+        """
+        Lee un CSV en streaming y genera un diccionario por fila.
+
+        El archivo se lee una sola vez: con los primeros CSV_SAMPLE_SIZE bytes
+        se detectan encoding, línea de header ("Período lectivo") y
+        delimitador, y luego se decodifica el resto por bloques.
+        """
         self.stdout.write(f'📄 Leyendo CSV: {file_path}')
-        
-        # Intentar diferentes encodings
-        encodings = ['utf-8-sig', 'utf-8', 'iso-8859-1', 'cp1252']
-        data = None
-        encoding_usado = None
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    # Leer primeras líneas para detectar headers
-                    lines = f.readlines()
-                    
-                    # Buscar la línea que contiene "Período lectivo" (es el header)
-                    header_line_idx = None
-                    for i, line in enumerate(lines):
-                        if 'Período lectivo' in line or 'Periodo lectivo' in line:
-                            header_line_idx = i
-                            break
-                    
-                    if header_line_idx is None:
-                        # Si no encuentra el header, asumir que está en línea 0
-                        header_line_idx = 0
-                
-                # Ahora leer correctamente
-                with open(file_path, 'r', encoding=encoding) as f:
-                    # Saltar líneas hasta el header
-                    for _ in range(header_line_idx):
-                        f.readline()
-                    
-                    # Detectar el delimitador
-                    sample = f.read(1024)
-                    f.seek(0)
-                    for _ in range(header_line_idx):
-                        f.readline()
-                    
-                    delimiter = ',' if sample.count(',') > sample.count(';') else ','
-                    
-                    reader = csv.DictReader(f, delimiter=delimiter)
-                    data = list(reader)
-                    encoding_usado = encoding
+
+        with open(file_path, 'rb') as raw:
+            sample = raw.read(self.CSV_SAMPLE_SIZE)
+            encoding = self.detect_encoding(sample)
+
+            # Buscar la línea que contiene "Período lectivo" (es el header)
+            sample_lines = codecs.getincrementaldecoder(encoding)(errors='replace').decode(sample).split('\n')
+            header_line_idx = 0  # Si no encuentra el header, asumir que está en línea 0
+            for i, line in enumerate(sample_lines):
+                if self.is_header_line(line):
+                    header_line_idx = i
                     break
-                    
+
+            # Detectar el delimitador sobre la línea de header
+            header_line = sample_lines[header_line_idx] if sample_lines else ''
+            delimiter = ';' if header_line.count(';') > header_line.count(',') else ','
+
+            lines = self.iter_lines(raw, sample, encoding)
+            for _ in range(header_line_idx):
+                next(lines, None)
+
+            reader = csv.reader(lines, delimiter=delimiter)
+            fieldnames = [(name or '').strip() for name in next(reader, [])]
+            total = 0
+            for row in csv.DictReader(lines, fieldnames=fieldnames, delimiter=delimiter):
+                total += 1
+                yield row
+
+        self.stdout.write(f'✅ {total} filas leídas (encoding: {encoding}, delimitador: "{delimiter}")\n')
+
+    def detect_encoding(self, sample):
+        """Retorna el primer encoding de CSV_ENCODINGS que decodifica la muestra."""
+        for encoding in self.CSV_ENCODINGS:
+            try:
+                # final=False: la muestra puede cortar un carácter multibyte al final
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                return encoding
             except (UnicodeDecodeError, UnicodeError):
                 continue
-        
-        if data is None:
-            raise CommandError(f'No se pudo leer el archivo con ningún encoding')
-        
-        self.stdout.write(f'✅ {len(data)} filas leídas (encoding: {encoding_usado})\n')
-        return data
+        raise CommandError('No se pudo leer el archivo con ningún encoding')
+
+    def iter_lines(self, raw, sample, encoding):
+        """
+        Lee el archivo por bloques y genera líneas completas decodificadas.
+
+        Corta sólo en b'\n' (conservando '\r\n') para que csv maneje los
+        saltos de línea dentro de campos entre comillas; en los encodings de
+        CSV_ENCODINGS ese byte no forma parte de otro carácter. Cada línea se
+        decodifica en modo estricto (ver decode_line).
+        """
+        pendiente = b''
+        chunk = sample
+        numero = 0
+        while chunk:
+            pendiente += chunk
+            *completas, pendiente = pendiente.split(b'\n')
+            for line in completas:
+                numero += 1
+                texto, encoding = self.decode_line(line + b'\n', encoding, numero)
+                if texto is not None:
+                    yield texto
+            chunk = raw.read(self.CSV_CHUNK_SIZE)
+        if pendiente:
+            texto, encoding = self.decode_line(pendiente, encoding, numero + 1)
+            if texto is not None:
+                yield texto
+
+    def decode_line(self, line, encoding, numero):
+        """
+        Decodifica una línea sin reemplazar bytes inválidos.
+
+        Si la línea no es válida en `encoding` (la muestra no alcanzó para
+        detectarlo, ej: acentos en cp1252 después de 64 KB en ASCII) se
+        reintenta con el resto de CSV_ENCODINGS y se sigue con el que
+        funcione. Si ninguno sirve, la línea se reporta como error y se
+        omite. Retorna (texto o None, encoding para las líneas siguientes).
+        """
+        if self.events is None:
+            self.events = ImportEventLog()
+        try:
+            return line.decode(encoding), encoding
+        except UnicodeDecodeError as exc:
+            error = exc
+        for alternativo in self.CSV_ENCODINGS:
+            if alternativo == encoding:
+                continue
+            try:
+                texto = line.decode(alternativo)
+            except UnicodeDecodeError:
+                continue
+            self.events.warning(
+                f'Línea {numero}: no es {encoding}, se lee como {alternativo}',
+                linea=numero, encoding=alternativo,
+            )
+            return texto, alternativo
+        self.events.error(f'Línea {numero}: no se pudo decodificar ({error.reason})', linea=numero)
+        return None, encoding
 
     def read_excel(self, file_path):
-        """Lee un archivo Excel (xlsx/xls) y retorna una lista de diccionarios."""
+        """
+        Lee un archivo Excel (xlsx/xls) en streaming y genera un diccionario por fila.
+
+        .xlsx se abre con openpyxl en modo read-only (values_only) y .xls con
+        xlrd on_demand, de modo que sólo se carga la hoja activa y fila a fila.
+        El header se detecta igual que en CSV (fila con "Período lectivo").
+        """
         suffix = file_path.suffix.lower()
         self.stdout.write(f'📊 Leyendo Excel: {file_path}')
 
@@ -228,15 +431,14 @@ class Command(BaseCommand):
                     'pip install xlrd'
                 ) from exc
 
-            book = xlrd.open_workbook(file_path)
-            sheet = book.sheet_by_index(0)
-            headers = sheet.row_values(0)
-            data = []
-            for row_idx in range(1, sheet.nrows):
-                row_values = sheet.row_values(row_idx)
-                data.append(dict(zip(headers, row_values)))
-            self.stdout.write(f'✅ {len(data)} filas leídas\n')
-            return data
+            book = xlrd.open_workbook(file_path, on_demand=True)
+            try:
+                sheet = book.sheet_by_index(0)
+                rows = (sheet.row_values(row_idx) for row_idx in range(sheet.nrows))
+                yield from self.iter_excel_rows(rows)
+            finally:
+                book.release_resources()
+            return
 
         try:
             import openpyxl  # type: ignore[import-not-found]
@@ -246,110 +448,127 @@ class Command(BaseCommand):
                 'pip install openpyxl'
             ) from exc
 
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb.active
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            yield from self.iter_excel_rows(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+
+    def iter_excel_rows(self, rows):
+        """
+        Convierte filas de valores de una hoja en diccionarios.
+
+        Busca el header dentro de las primeras EXCEL_HEADER_SCAN_ROWS filas
+        (si no aparece, usa la primera) y omite filas completamente vacías,
+        como hace csv.DictReader.
+        """
+        rows = iter(rows)
+        muestra = []
+        for row in rows:
+            muestra.append(row)
+            if len(muestra) >= self.EXCEL_HEADER_SCAN_ROWS:
+                break
+        if not muestra:
+            return
 
-        # Primera fila son los headers
-        headers = [cell.value for cell in ws[1]]
+        header_idx = 0
+        for i, row in enumerate(muestra):
+            if self.is_header_line(' '.join(str(v) for v in row if v is not None)):
+                header_idx = i
+                break
 
-        # Convertir a lista de diccionarios
-        data = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            data.append(dict(zip(headers, row)))
+        headers = [self.cell_to_str(v) for v in muestra[header_idx]]
+        total = 0
+        for row in itertools.chain(muestra[header_idx + 1:], rows):
+            values = [self.cell_to_str(v) for v in row]
+            if not any(values):
+                continue
+            total += 1
+            yield dict(zip(headers, values))
 
-        self.stdout.write(f'✅ {len(data)} filas leídas\n')
-        return data
+        self.stdout.write(f'✅ {total} filas leídas\n')
+
+    @staticmethod
+    def cell_to_str(value):
+        """Normaliza el valor de una celda a texto (los números enteros sin '.0')."""
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value).strip()
+
+    @staticmethod
+    def is_header_line(text):
+        """Indica si la línea/fila es el header (contiene "Período lectivo")."""
+        return 'Período lectivo' in text or 'Periodo lectivo' in text
 
     def detect_duplicates(self, data):
         """
-        Detecta duplicados dentro del mismo archivo.
-        
-        Identificador único = código comisión + docente + horario
+        Detecta duplicados dentro del mismo archivo (ver DuplicateAnalyzer).
+
+        Identificador único = código comisión + docente + horario + sede
         Esto permite múltiples horarios para la misma comisión (VÁLIDO)
         pero detecta duplicados exactos (INVÁLIDO).
-        
-        Retorna diccionario con:
-        - exactos: combinaciones (código|docente|horario) que aparecen múltiples veces
-        - variaciones: misma comisión pero diferente docente o horario
-        - warnings: lista de mensajes de advertencia
-        - errores: problemas serios (ej: múltiples docentes)
-        """
-        # Agrupar por identificador único completo
-        duplicados_por_id = defaultdict(list)
-        comisiones_por_codigo = defaultdict(set)
-        resultado = {'exactos': set(), 'variaciones': set(), 'warnings': [], 'errores': []}
-        
-        for idx, row in enumerate(data, 1):
-            codigo = (row.get('Comisión') or '').strip()
-            docente = (row.get('Docente') or '').strip()
-            horario = (row.get('Horario') or '').strip()
-            modalidad = (row.get('Modalidad') or '').strip()
-            sede = (row.get('Sede') or '').strip()
-            actividad = (row.get('Actividad') or '').strip()
-            
-            if not codigo:
-                continue
-            
-            # ID único para esta instancia de comisión
-            id_unico = f"{codigo}|{docente}|{horario}|{sede}"
-            
-            # Registrar para análisis de duplicados exactos
-            duplicados_por_id[id_unico].append({
-                'fila': idx,
-                'docente': docente,
-                'horario': horario,
-                'modalidad': modalidad,
-                'actividad': actividad,
-            })
-            
-            # Registrar docentes para esta comisión (detectar múltiples docentes)
-            comisiones_por_codigo[codigo].add(docente)
-        
-        # ANÁLISIS 1: Detectar duplicados exactos (mismo ID unico aparece múltiples veces)
-        for id_unico, instancias in duplicados_por_id.items():
-            if len(instancias) > 1:
-                resultado['exactos'].add(id_unico)
-                codigo = id_unico.split('|')[0]
-                filas = [str(inst['fila']) for inst in instancias]
-                resultado['warnings'].append(
-                    f"Comisión {codigo} (docente: {instancias[0]['docente']}, horario: {instancias[0]['horario']}, sede: {sede or 'N/D'}) "
-                    f"aparece {len(instancias)} veces (idénticas, filas: {', '.join(filas)})"
-                )
-        
-        # ANÁLISIS 2: Detectar si misma comisión tiene múltiples docentes (ERROR)
-        for codigo, docentes in comisiones_por_codigo.items():
-            if len(docentes) > 1:
-                resultado['errores'].append(
-                    f"Comisión {codigo} asignada a múltiples docentes: {', '.join(sorted(docentes))}"
-                )
-                # Marcar como variación para mostrar advertencia
-                resultado['variaciones'].add(codigo)
-        
-        # ANÁLISIS 3: Detectar variaciones (mismo código, diferente horario/docente, pero válido)
-        for codigo, docentes in comisiones_por_codigo.items():
-            if len(docentes) == 1:
-                # Un solo docente, revisar si hay múltiples horarios
-                docente_unico = list(docentes)[0]
-                horarios = set()
-                for id_unico in duplicados_por_id.keys():
-                    partes = id_unico.split('|')
-                    if partes[0] == codigo and partes[1] == docente_unico:
-                        horarios.add(partes[2])
-                
-                if len(horarios) > 1:
-                    resultado['variaciones'].add(codigo)
-                    resultado['warnings'].append(
-                        f"Comisión {codigo} ({docente_unico}) tiene {len(horarios)} horarios diferentes: "
-                        f"{', '.join(sorted(horarios))}"
-                    )
-        
-        return resultado
+        """
+        return DuplicateAnalyzer.analyze(data)
 
-    def process_row(self, row, update_existing):
+    def parse_row(self, row):
+        """Normaliza una fila sin tocar la base de datos (ver importacion.normalizacion)."""
+        return normalizacion.normalizar_fila(row, self.ciclo_import)
+
+    def load_estado(self, cuatrimestres):
         """
-        Procesa una fila del CSV/Excel y crea/actualiza los modelos.
-        
-        Retorna un diccionario con estadísticas de la operación.
+        Comisiones existentes de los cuatrimestres, agrupadas por
+        código+docente+cuatrimestre+sede y en orden de id (una query).
+
+        Al escribir se recarga en cada llamada (ve lo que escribió el archivo
+        anterior de un lote). En modo plan (--dry-run) se conserva entre
+        llamadas y los planes se aplican sobre él en memoria.
+        """
+        if not self.solo_plan or self.estado is None:
+            self.estado = defaultdict(list)
+            self.estado_cuatrimestres = set()
+        faltantes = set(cuatrimestres) - self.estado_cuatrimestres
+        if faltantes:
+            qs = Comision.objects.filter(cuatrimestre__in=faltantes).select_related('docente')
+            for com in qs.order_by('id_comision'):
+                self.estado[(com.codigo, com.docente_id, com.cuatrimestre, com.sede)].append(com)
+            self.estado_cuatrimestres |= faltantes
+        return self.estado
+
+    @staticmethod
+    def resumen(com, nombres, **extra):
+        """Resumen de una comisión para el plan (docente: nombre del archivo o de la base)."""
+        docente = nombres.get(com.docente_id)
+        if docente is None and Comision.docente.is_cached(com) and com.docente:
+            docente = com.docente.nombre_completo
+        return resumir(com.codigo, docente or '', com.cuatrimestre, com.sede, **extra)
+
+    def bulk_upsert(self, registros, update_existing):
+        """
+        Crea/actualiza docentes y comisiones en lote.
+
+        Calcula el plan (plan_upsert) y lo escribe con write_comisiones (ORM
+        o COPY + staging). En modo plan (--dry-run) no escribe. Retorna un
+        diccionario con estadísticas de la operación y deja el plan en
+        self.plan.
+        """
+        stats, operaciones = self.plan_upsert(registros, update_existing)
+        if not self.solo_plan:
+            self.write_comisiones(
+                operaciones['eliminar'], operaciones['modificadas'], operaciones['nuevas']
+            )
+        return stats
+
+    def plan_upsert(self, registros, update_existing):
+        """
+        Reproduce en memoria, en el orden del archivo, la lógica que antes se
+        ejecutaba fila a fila (get_or_create + filter + save + delete).
+
+        Retorna (stats, operaciones) donde operaciones tiene los pks a
+        borrar y las Comision a actualizar y crear; el resumen legible
+        queda en self.plan (ImportPlan).
         """
         stats = {
             'docentes_creados': 0,
@@ -358,214 +577,446 @@ class Command(BaseCommand):
             'comisiones_actualizadas': 0,
             'comisiones_omitidas': 0,
         }
+        self.claves_importadas = set()
+        self.plan = ImportPlan()
+        operaciones = {'eliminar': [], 'modificadas': [], 'nuevas': []}
+        if not registros:
+            return stats, operaciones
 
-        # 1. PARSEAR DOCENTE
-        docente_nombre_completo = (row.get('Docente') or '').strip()
-        if not docente_nombre_completo:
-            return stats  # Omitir filas sin docente
-
-        # Separar nombre y apellido
-        # Asumimos formato: "APELLIDO NOMBRE" o "APELLIDO NOMBRE1 NOMBRE2"
-        partes = docente_nombre_completo.split()
-        if len(partes) >= 2:
-            apellido = partes[0]
-            nombre = ' '.join(partes[1:])
-        else:
-            apellido = docente_nombre_completo
-            nombre = ''
-
-        # Buscar o crear docente
-        docente, created = Docente.objects.get_or_create(
-            nombre_completo__iexact=docente_nombre_completo,
-            defaults={
-                'nombre': nombre.title(),
-                'apellido': apellido.title(),
-                'nombre_completo': docente_nombre_completo.title(),
-            }
-        )
+        self.resolve_docentes(registros, stats)
+        con_comision = [r for r in registros if r.comision]
+        if not con_comision:
+            return stats, operaciones
 
-        if created:
-            stats['docentes_creados'] += 1
-            self.stdout.write(f'  👤 Docente creado: {docente.nombre_completo}')
-        else:
-            stats['docentes_existentes'] += 1
+        # Cargar una sola vez las comisiones que pueden coincidir,
+        # agrupadas por código+docente+cuatrimestre+sede
+        estado = self.load_estado({r.comision.cuatrimestre for r in con_comision})
+        nombres = {r.docente_id: r.docente_nombre_completo for r in con_comision}
 
-        # 2. PARSEAR COMISIÓN
-        actividad = (row.get('Actividad') or '').strip()
-        codigo_comision = (row.get('Comisión') or '').strip()
-        
-        if not actividad or not codigo_comision:
-            return stats  # Omitir filas incompletas
-
-        # Extraer código de actividad (si existe)
-        # Formato: "205 (PRI) - DERECHO ROMANO" o "DERECHO ROMANO"
-        match = re.match(r'^(\S+)\s+\([^)]+\)\s*-\s*(.+)$', actividad)
-        if match:
-            codigo_actividad = match.group(1)
-            nombre_actividad = match.group(2).strip()
-        else:
-            codigo_actividad = ''
-            nombre_actividad = actividad
-
-        # Modalidad y sede (para práctico profesional)
-        modalidad = (row.get('Modalidad') or '').strip()
-        sede = (row.get('Sede') or '').strip()
-        es_centro_externo = self.is_centro_externo(sede, row)
-        ciclo = self.ciclo_import
-        
-        # Horario
-        horario = (row.get('Horario') or '').strip()
-        
-        # Recomendación (raw, sin procesar)
-        recomendacion_raw = (row.get('RECOMENDACIÓN') or '').strip()
-        
-        # Período lectivo (para extraer cuatrimestre)
-        periodo = (row.get('Período lectivo') or '').strip()
-        cuatrimestre = self.extract_cuatrimestre(periodo)
+        nuevas = []          # Comisiones a crear (en orden de aparición)
+        ids_nuevas = set()   # id() de nuevas
+        descartadas = set()  # id() de nuevas que luego se consolidaron en otra
+        modificadas = {}     # id() -> Comision existente a actualizar
+        eliminar = {}        # id() -> Comision duplicada a borrar
+        antes = {}           # id() -> valores de la comisión antes de actualizarla
+        omitidas = {}        # claves existentes que no se actualizan (en orden del archivo)
 
-        # El identificador único CORRECTO es: código + docente + horario + cuatrimestre
-        # Esto permite múltiples horarios para la misma comisión
-        
-        # Consolidar por código+docente+cuatrimestre+sede: mantener horario más descriptivo
-        existentes = list(Comision.objects.filter(
-            codigo=codigo_comision,
-            docente=docente,
-            cuatrimestre=cuatrimestre,
-            sede=sede,
-        ))
-
-        # Si no se quiere actualizar y ya hay uno, omitir
-        if existentes and not update_existing:
-            stats['comisiones_omitidas'] += 1
-            return stats
+        for registro in con_comision:
+            datos = registro.comision
+            docente_id = registro.docente_id
+            horario = datos.horario
+            key = (datos.codigo, docente_id, datos.cuatrimestre, datos.sede)
 
-        # Elegir target (máxima longitud de horario entre existentes y el nuevo)
-        if existentes:
-            candidato = max(existentes + [Comision(horario=horario or '')], key=lambda c: len(c.horario or ''))
-            target = candidato if candidato.id_comision else existentes[0]
-            target.horario = candidato.horario or horario
-            created = False
-        else:
-            target = Comision(
-                codigo=codigo_comision,
-                docente=docente,
-                cuatrimestre=cuatrimestre,
-                sede=sede,
-                horario=horario,
-            )
-            created = True
-
-        # Actualizar campos comunes
-        target.codigo_actividad = codigo_actividad
-        target.nombre = nombre_actividad[:200]
-        target.modalidad = modalidad if modalidad in ['Presencial', 'Remota', 'Híbrida'] else None
-        target.recomendacion_raw = recomendacion_raw
-        target.sede = sede
-        target.es_centro_externo = es_centro_externo
-        target.ciclo = ciclo
-        target.activa = True
-        target.save()
-
-        # Eliminar duplicados restantes si los hay
-        if existentes:
-            for item in existentes:
-                if item.id_comision != target.id_comision:
-                    item.delete()
-
-        if created:
-            stats['comisiones_creadas'] += 1
-            self.stdout.write(
-                f'  ✅ Comisión creada: {codigo_comision} - {nombre_actividad[:50]}...'
+            # Consolidar por código+docente+cuatrimestre+sede: mantener horario más descriptivo
+            existentes = estado[key]
+            self.claves_importadas.add((datos.codigo, docente_id, datos.cuatrimestre or '', datos.sede))
+
+            # Si no se quiere actualizar y ya hay uno, omitir
+            if existentes and not update_existing:
+                stats['comisiones_omitidas'] += 1
+                self.plan.omitir.append(resumir(
+                    datos.codigo, registro.docente_nombre_completo, datos.cuatrimestre, datos.sede
+                ))
+                omitidas[key] = None
+                continue
+
+            # Elegir target (máxima longitud de horario entre existentes y el nuevo)
+            if existentes:
+                nuevo = Comision(horario=horario or '')
+                candidato = max(existentes + [nuevo], key=lambda c: len(c.horario or ''))
+                target = candidato if candidato is not nuevo else existentes[0]
+                if id(target) not in ids_nuevas and id(target) not in antes:
+                    antes[id(target)] = {campo: getattr(target, campo) for campo in CAMPOS_CONTENIDO + ['activa']}
+                target.horario = candidato.horario or horario
+                created = False
+
+                # Marcar para eliminar los duplicados restantes
+                for item in existentes:
+                    if item is target:
+                        continue
+                    if id(item) in ids_nuevas:
+                        descartadas.add(id(item))
+                    else:
+                        eliminar[id(item)] = item
+                        modificadas.pop(id(item), None)
+            else:
+                target = Comision(
+                    codigo=datos.codigo,
+                    docente_id=docente_id,
+                    cuatrimestre=datos.cuatrimestre,
+                    sede=datos.sede,
+                    horario=horario,
+                )
+                nuevas.append(target)
+                ids_nuevas.add(id(target))
+                created = True
+
+            # Actualizar campos comunes
+            target.codigo_actividad = datos.codigo_actividad
+            target.nombre = datos.nombre[:200]
+            target.modalidad = datos.modalidad
+            target.recomendacion_raw = datos.recomendacion_raw
+            target.sede = datos.sede
+            target.es_centro_externo = datos.es_centro_externo
+            target.ciclo = datos.ciclo
+            target.activa = True
+            target.hash_contenido = target.calcular_hash_contenido()
+            target.search_texto = target.calcular_search_texto(registro.docente_nombre_completo)
+            estado[key] = [target]
+            if id(target) not in ids_nuevas:
+                modificadas[id(target)] = target
+
+            if created:
+                stats['comisiones_creadas'] += 1
+                if self.verbosity >= 2:
+                    self.stdout.write(
+                        f"  ✅ Comisión creada: {datos.codigo} - {datos.nombre[:50]}..."
+                    )
+            else:
+                stats['comisiones_actualizadas'] += 1
+                if self.verbosity >= 2:
+                    self.stdout.write(f"  📝 Comisión actualizada: {datos.codigo}")
+
+        # bulk_update no dispara auto_now: se setea explícitamente
+        ahora = timezone.now()
+        for com in modificadas.values():
+            com.ultima_actualizacion_scraping = com.modificado = ahora
+
+        nuevas = [c for c in nuevas if id(c) not in descartadas]
+        self.plan.crear = [self.resumen(c, nombres) for c in nuevas]
+        for com in modificadas.values():
+            previo = antes[id(com)]
+            campos = campos_modificados(com, previo)
+            if not previo['activa']:
+                campos.append('activa')
+            self.plan.actualizar.append(self.resumen(com, nombres, campos=campos))
+        self.plan.eliminar = [self.resumen(c, nombres) for c in eliminar.values()]
+
+        # Grupos omitidos con duplicados: los limpiará la consolidación final
+        # (horario más largo, a igual largo el id más bajo)
+        for key in omitidas:
+            grupo = estado[key]
+            if len(grupo) < 2:
+                continue
+            orden = sorted(
+                range(len(grupo)),
+                key=lambda i: (-len(grupo[i].horario or ''), grupo[i].pk is None, grupo[i].pk or 0, i),
             )
-        else:
-            stats['comisiones_actualizadas'] += 1
-            self.stdout.write(f'  📝 Comisión actualizada: {codigo_comision}')
+            self.plan.consolidar.extend(self.resumen(grupo[i], nombres) for i in orden[1:])
+            if self.solo_plan:
+                estado[key] = [grupo[orden[0]]]
+
+        operaciones['eliminar'] = sorted(c.pk for c in eliminar.values() if c.pk)
+        operaciones['modificadas'] = list(modificadas.values())
+        operaciones['nuevas'] = nuevas
+        return stats, operaciones
+
+    def diff_upsert(self, registros, deactivate_missing=False):
+        """
+        Importación diferencial: sólo escribe comisiones nuevas o modificadas.
 
+        Calcula el plan (plan_diff) y, salvo en modo plan (--dry-run), lo
+        escribe. Deja en self.diff_report las listas
+        agregadas/modificadas/desactivadas y en self.plan el plan completo.
+        """
+        stats, operaciones = self.plan_diff(registros, deactivate_missing)
+        if self.solo_plan:
+            return stats
+
+        self.write_comisiones(operaciones['eliminar'], operaciones['modificadas'], operaciones['nuevas'])
+        if operaciones['nuevas']:
+            self.stdout.write(f"  ✅ Comisiones creadas: {len(operaciones['nuevas'])}")
+
+        ids = operaciones['desactivar']
+        ahora = timezone.now()
+        for i in range(0, len(ids), self.BATCH_SIZE):
+            Comision.objects.filter(id_comision__in=ids[i:i + self.BATCH_SIZE]).update(
+                activa=False, ultima_actualizacion_scraping=ahora, modificado=ahora
+            )
+        if ids:
+            self.stdout.write(f'  💤 Comisiones desactivadas: {len(ids)}')
         return stats
 
-    def extract_cuatrimestre(self, periodo_text):
+    def plan_diff(self, registros, deactivate_missing=False):
         """
-        Extrae el cuatrimestre del texto del período.
-        
-        Ejemplos:
-            "PRIMER CUATRIMESTRE ABOGACÍA 2025" -> "1C2025"
-            "SEGUNDO BIMESTRE ABOGACÍA 2025" -> "2B2025"
+        Plan de la importación diferencial.
+
+        Las filas del archivo se consolidan por código+docente+cuatrimestre+sede
+        (horario más largo, resto de los campos de la última fila) y su hash se
+        compara con Comision.hash_contenido. Las comisiones sin cambios no se
+        tocan (no se actualizan ultima_actualizacion_scraping ni modificado). Con
+        deactivate_missing, las comisiones activas del mismo cuatrimestre y
+        ciclo (obligatorio) que no aparecen en el archivo pasan a activa=False.
+
+        Retorna (stats, operaciones) como plan_upsert, más 'desactivar' (pks).
         """
-        # Buscar año
-        year_match = re.search(r'20\d{2}', periodo_text)
-        year = year_match.group(0) if year_match else ''
-        
-        # Buscar cuatrimestre/bimestre
-        if 'PRIMER' in periodo_text.upper():
-            periodo = '1'
-        elif 'SEGUNDO' in periodo_text.upper():
-            periodo = '2'
-        else:
-            periodo = '1'
-        
-        if 'CUATRIMESTRE' in periodo_text.upper():
-            tipo = 'C'
-        elif 'BIMESTRE' in periodo_text.upper():
-            tipo = 'B'
-        else:
-            tipo = 'C'
-        
-        return f"{periodo}{tipo}{year}" if year else ''
+        stats = {
+            'docentes_creados': 0,
+            'docentes_existentes': 0,
+            'comisiones_creadas': 0,
+            'comisiones_actualizadas': 0,
+            'comisiones_sin_cambios': 0,
+            'comisiones_desactivadas': 0,
+        }
+        self.claves_importadas = set()
+        self.plan = ImportPlan()
+        self.diff_report = {'agregadas': self.plan.crear, 'modificadas': self.plan.actualizar,
+                            'desactivadas': self.plan.desactivar}
+        operaciones = {'eliminar': [], 'modificadas': [], 'nuevas': [], 'desactivar': []}
+        if deactivate_missing and not self.ciclo_import:
+            raise CommandError('deactivate_missing requiere el ciclo del archivo.')
+        if not registros:
+            return stats, operaciones
 
-    def is_centro_externo(self, sede_value, row):
-        """Determina si la comisión corresponde a un centro externo.
+        self.resolve_docentes(registros, stats)
+
+        # Estado deseado según el archivo, una entrada por clave
+        deseadas = {}
+        for registro in registros:
+            if not registro.comision:
+                continue
+            datos = asdict(registro.comision)
+            key = (datos['codigo'], registro.docente_id, datos['cuatrimestre'], datos['sede'])
+            previa = deseadas.get(key)
+            if previa and len(previa['horario'] or '') >= len(datos['horario'] or ''):
+                datos['horario'] = previa['horario']
+            datos['docente_id'] = registro.docente_id
+            datos['docente'] = registro.docente_nombre_completo
+            deseadas[key] = datos
+            self.claves_importadas.add((datos['codigo'], registro.docente_id, datos['cuatrimestre'] or '', datos['sede']))
+        if not deseadas:
+            return stats, operaciones
+
+        # Comisión vigente por clave: la de horario más largo (igual que la consolidación)
+        # y el resto del grupo se borra antes de escribir (unique_together incluye horario)
+        cuatrimestres = {key[2] for key in deseadas}
+        estado = self.load_estado(cuatrimestres)
+        nombres = {datos['docente_id']: datos['docente'] for datos in deseadas.values()}
+        existentes = {}
+        eliminar = []
+        sobrantes = []
+        for key, grupo in estado.items():
+            if key[2] not in cuatrimestres:
+                continue
+            if key not in deseadas:
+                sobrantes.extend(grupo)
+                continue
+            for com in grupo:
+                actual = existentes.get(key)
+                if actual is None:
+                    existentes[key] = com
+                elif len(com.horario or '') > len(actual.horario or ''):
+                    existentes[key] = com
+                    eliminar.append(actual)
+                else:
+                    eliminar.append(com)
+
+        nuevas = []
+        modificadas = []
+        ahora = timezone.now()
+        for key, datos in deseadas.items():
+            digest = hash_contenido(datos)
+            com = existentes.get(key)
+            resumen = resumir(datos['codigo'], datos['docente'], datos['cuatrimestre'], datos['sede'])
+            if com is None:
+                com = Comision(
+                    codigo=datos['codigo'],
+                    docente_id=datos['docente_id'],
+                    cuatrimestre=datos['cuatrimestre'],
+                    sede=datos['sede'],
+                    horario=datos['horario'],
+                    codigo_actividad=datos['codigo_actividad'],
+                    nombre=datos['nombre'][:200],
+                    modalidad=datos['modalidad'],
+                    recomendacion_raw=datos['recomendacion_raw'],
+                    es_centro_externo=datos['es_centro_externo'],
+                    ciclo=datos['ciclo'],
+                    activa=True,
+                    hash_contenido=digest,
+                )
+                com.search_texto = com.calcular_search_texto(datos['docente'])
+                nuevas.append(com)
+                estado[key] = [com]
+                self.plan.crear.append(resumen)
+                stats['comisiones_creadas'] += 1
+                continue
+
+            estado[key] = [com]
+            if (com.hash_contenido or com.calcular_hash_contenido()) == digest and com.activa:
+                self.plan.sin_cambios += 1
+                stats['comisiones_sin_cambios'] += 1
+                continue
+
+            cambios = campos_modificados(com, datos)
+            if not com.activa:
+                cambios.append('activa')
+            com.horario = datos['horario']
+            com.codigo_actividad = datos['codigo_actividad']
+            com.nombre = datos['nombre'][:200]
+            com.modalidad = datos['modalidad']
+            com.recomendacion_raw = datos['recomendacion_raw']
+            com.es_centro_externo = datos['es_centro_externo']
+            com.ciclo = datos['ciclo']
+            com.activa = True
+            com.hash_contenido = digest
+            com.search_texto = com.calcular_search_texto(datos['docente'])
+            com.ultima_actualizacion_scraping = com.modificado = ahora
+            modificadas.append(com)
+            self.plan.actualizar.append({**resumen, 'campos': cambios})
+            stats['comisiones_actualizadas'] += 1
+            if self.verbosity >= 2:
+                self.stdout.write(f"  📝 Comisión modificada: {datos['codigo']} ({', '.join(cambios)})")
+
+        self.plan.eliminar = [self.resumen(c, nombres) for c in eliminar]
+
+        if deactivate_missing:
+            ciclo = self.ciclo_import
+            desactivar = sorted(
+                (com for com in sobrantes if com.activa and com.ciclo == ciclo),
+                key=lambda com: (com.pk is None, com.pk or 0),
+            )
+            for com in desactivar:
+                self.plan.desactivar.append(self.resumen(com, {}))
+                if self.solo_plan:
+                    com.activa = False
+            stats['comisiones_desactivadas'] = len(desactivar)
+            operaciones['desactivar'] = [com.pk for com in desactivar if com.pk]
+
+        operaciones['eliminar'] = [com.pk for com in eliminar if com.pk]
+        operaciones['modificadas'] = modificadas
+        operaciones['nuevas'] = nuevas
+        return stats, operaciones
+
+    def resolve_docentes(self, registros, stats):
+        """
+        Resuelve los docentes de todos los registros contra el DocenteIndex.
 
-        Reglas:
-        - Si existe una columna 'Centro externo'/'Centros externos' con valor afirmativo → True
-        - Si la sede no está en la lista de orientaciones internas conocidas → probablemente externo
+        Crea los faltantes en lote (en modo plan sólo les reserva un id
+        provisorio) y deja en cada registro 'docente_id'. Actualiza stats
+        de docentes por fila, igual que get_or_create (la primera aparición
+        de un docente nuevo cuenta como creado, el resto como existente).
         """
-        afirmativo = {'si', 'sí', 'yes', 'true', '1', 'externo', 'externa'}
-        centro_col = (row.get('Centro externo') or row.get('Centros externos') or '').strip().lower()
-        if centro_col in afirmativo:
-            return True
+        index = self.docente_index
+        pendientes = {}
+        for registro in registros:
+            key = registro.docente_key
+            if key in index or key in pendientes:
+                stats['docentes_existentes'] += 1
+                continue
+            nombre_completo = registro.docente_nombre_completo.title()
+            docente = Docente(
+                nombre=registro.docente_nombre.title(),
+                apellido=registro.docente_apellido.title(),
+                nombre_completo=nombre_completo,
+                nombre_normalizado=key,
+            )
+            # bulk_create no llama a save(): search_texto se calcula acá
+            docente.search_texto = docente.calcular_search_texto()
+            pendientes[key] = docente
+            stats['docentes_creados'] += 1
 
-        sede_norm = (sede_value or '').strip().upper()
-        if not sede_norm:
-            return False
+        self.plan.docentes_nuevos = [d.nombre_completo for d in pendientes.values()]
+        if self.solo_plan:
+            index.reserve_missing(list(pendientes.values()))
+        else:
+            writer = staging.StagingWriter() if self.usar_copy() else None
+            creados = index.create_missing(list(pendientes.values()), writer=writer)
+            if self.verbosity >= 2:
+                for docente in creados:
+                    self.stdout.write(f'  👤 Docente creado: {docente.nombre_completo}')
 
-        if sede_norm in self.ORIENTACIONES_INTERNAS:
-            return False
+        for registro in registros:
+            registro.docente_id = index.get_by_key(registro.docente_key)
 
-        # Si la sede es un nombre institucional (colegio, defensoría, universidad, etc.) lo marcamos como externo
-        palabras_externas = ['COLEGIO', 'DEFENSORIA', 'UNIVERSIDAD', 'HOSPITAL', 'TRIBUNAL', 'CENTRO']
-        if any(p in sede_norm for p in palabras_externas):
-            return True
+    def extract_cuatrimestre(self, periodo_text):
+        """Ej: "PRIMER CUATRIMESTRE ABOGACÍA 2025" -> "1C2025"."""
+        return normalizacion.extract_cuatrimestre(periodo_text)
 
-        # Por defecto, si no es orientación conocida, lo tratamos como externo
-        return True
+    def is_centro_externo(self, sede_value, row):
+        """Determina si la comisión corresponde a un centro externo."""
+        return normalizacion.is_centro_externo(sede_value, row)
 
     # -------------------------------------------------------------
     # Limpieza de duplicados (mismo código+docente+cuatrimestre+sede)
     # -------------------------------------------------------------
-    def cleanup_comisiones_duplicadas(self):
+    def cleanup_comisiones_duplicadas(self, claves=None):
+        """
+        Elimina duplicados por código+docente+cuatrimestre+sede conservando
+        el horario más largo.
+
+        claves: conjunto de (codigo, docente_id, cuatrimestre, sede) que tocó
+        la importación (escritos u omitidos); sólo se revisan esos grupos. Con None se revisa
+        toda la tabla. El ranking se calcula en SQL con ROW_NUMBER() y los
+        perdedores se borran con un DELETE por lote (en PostgreSQL, con las
+        claves copiadas a staging, en un único DELETE). Retorna la cantidad
+        de comisiones eliminadas.
+        """
         from academic.models import Comision  # Import local para evitar ciclos
 
-        grupos = {}
-        for com in Comision.objects.all():
-            key = (com.codigo, com.docente, com.cuatrimestre or '', com.sede or '')
-            grupos.setdefault(key, []).append(com)
+        if claves is not None and not claves:
+            return 0
 
-        eliminadas = 0
-        for _key, items in grupos.items():
-            if len(items) <= 1:
-                continue
+        if claves is not None and self.usar_copy():
+            # PostgreSQL: claves a staging y un único DELETE con ROW_NUMBER()
+            eliminadas = staging.StagingWriter().consolidar(claves)
+            if eliminadas:
+                self.stdout.write(f"🧹 Comisiones duplicadas consolidadas: {eliminadas}")
+            return eliminadas
+
+        ranking = Window(
+            expression=RowNumber(),
+            partition_by=[F('codigo'), F('docente_id'), Coalesce('cuatrimestre', Value('')), F('sede')],
+            order_by=[Coalesce(Length('horario'), 0).desc(), F('id_comision').asc()],
+        )
 
-            items_sorted = sorted(items, key=lambda c: len(c.horario or ''), reverse=True)
-            keep = items_sorted[0]
-            to_delete = items_sorted[1:]
+        if claves is None:
+            lotes = [Comision.objects.all()]
+        else:
+            # Filtrar por columnas trae grupos completos; luego se descartan
+            # en Python los grupos que esta importación no escribió.
+            por_cuatrimestre = defaultdict(set)
+            for codigo, _docente_id, cuatrimestre, _sede in claves:
+                por_cuatrimestre[cuatrimestre or ''].add(codigo)
+            lotes = []
+            for cuatrimestre, codigos in por_cuatrimestre.items():
+                codigos = sorted(codigos)
+                filtro_cuatrimestre = Q(cuatrimestre=cuatrimestre)
+                if not cuatrimestre:
+                    filtro_cuatrimestre |= Q(cuatrimestre__isnull=True)
+                for i in range(0, len(codigos), self.BATCH_SIZE):
+                    lotes.append(Comision.objects.filter(
+                        filtro_cuatrimestre, codigo__in=codigos[i:i + self.BATCH_SIZE]
+                    ))
 
-            ids = [c.id_comision for c in to_delete]
+        eliminadas = 0
+        for qs in lotes:
+            perdedores = (
+                qs.annotate(posicion=ranking)
+                .filter(posicion__gt=1)
+                .values_list('id_comision', 'codigo', 'docente_id', 'cuatrimestre', 'sede')
+            )
+            ids = [
+                pk for pk, codigo, docente_id, cuatrimestre, sede in perdedores
+                if claves is None or (codigo, docente_id, cuatrimestre or '', sede) in claves
+            ]
             if ids:
                 Comision.objects.filter(id_comision__in=ids).delete()
                 eliminadas += len(ids)
 
         if eliminadas:
             self.stdout.write(f"🧹 Comisiones duplicadas consolidadas: {eliminadas}")
+        return eliminadas
+
+    def print_plan(self, plan):
+        """Imprime los totales del plan de un dry-run."""
+        totales = plan.totales()
+        self.stdout.write('\n📝 PLAN (no se escribió nada):')
+        self.stdout.write(f"   Docentes a crear:        {totales['docentes_nuevos']}")
+        for accion in ('crear', 'actualizar', 'omitir', 'eliminar', 'consolidar', 'desactivar'):
+            self.stdout.write(f"   Comisiones a {accion + ':':<12} {totales[accion]}")
+        if self.verbosity >= 2:
+            for entrada in plan.actualizar:
+                self.stdout.write(f"   📝 {entrada['codigo']} {entrada['docente']}: {', '.join(entrada['campos']) or '-'}")
 
     def print_summary(self, stats, dry_run):
         """Imprime un resumen de la importación."""
@@ -585,6 +1036,9 @@ class Command(BaseCommand):
         self.stdout.write(f"   • Creadas: {stats['comisiones_creadas']}")
         self.stdout.write(f"   • Actualizadas: {stats['comisiones_actualizadas']}")
         self.stdout.write(f"   • Omitidas: {stats['comisiones_omitidas']}")
+        if stats['comisiones_sin_cambios'] or stats['comisiones_desactivadas']:
+            self.stdout.write(f"   • Sin cambios: {stats['comisiones_sin_cambios']}")
+            self.stdout.write(f"   • Desactivadas: {stats['comisiones_desactivadas']}")
         self.stdout.write('')
         
         # Mostrar estadísticas de duplicados
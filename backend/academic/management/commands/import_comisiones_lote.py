@@ -0,0 +1,321 @@
+"""
+Management command para importar varios archivos de comisiones en lote.
+
+Uso:
+    python manage.py import_comisiones_lote ofertas/
+    python manage.py import_comisiones_lote "ofertas/*_1C2026*.csv" --update-existing
+    python manage.py import_comisiones_lote ofertas.zip --ciclo CPO
+    python manage.py import_comisiones_lote cpo.xlsx:CPO cpc.xlsx:CPC
+
+Fuentes aceptadas (se pueden combinar):
+    - Directorio: todos los .csv/.xlsx/.xls que contiene
+    - Glob: patrón de archivos
+    - .zip: los .csv/.xlsx/.xls que contiene
+    - Archivo suelto
+
+Ciclo de cada archivo (en este orden):
+    1. Sufijo explícito "archivo.csv:CPC" (o el mapa `ciclos` en uso programático)
+    2. CPO/CPC en el nombre del archivo (ej: MADRE_CPO_1C2026.csv)
+    3. --ciclo
+
+A diferencia de correr import_comisiones una vez por archivo, los archivos
+se leen en paralelo (hilos), se comparte una sola resolución de docentes,
+la escritura de todos los archivos ocurre en una única transacción y la
+consolidación de duplicados corre una sola vez al final.
+"""
+import glob
+import re
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from academic.importacion.eventos import ImportEventLog
+from academic.importacion.plan import ImportPlan
+from academic.management.commands import import_comisiones
+from academic.utils import DocenteIndex, catalogo_modificado
+
+EXTENSIONES = {'.csv', '.xlsx', '.xls'}
+CICLOS = {'CPO', 'CPC'}
+
+_CICLO_EN_NOMBRE = re.compile(r'(?<![A-Z])(CPO|CPC)(?![A-Z])')
+
+
+def ciclo_desde_nombre(nombre):
+    """Detecta CPO/CPC en el nombre de un archivo ('' si no aparece o es ambiguo)."""
+    encontrados = set(_CICLO_EN_NOMBRE.findall(Path(nombre).stem.upper()))
+    return encontrados.pop() if len(encontrados) == 1 else ''
+
+
+class Command(BaseCommand):
+    help = 'Importa en lote varios archivos de comisiones (directorio, glob o zip)'
+
+    # Límite de tamaño descomprimido de un .zip (protege contra zip bombs)
+    MAX_ZIP_BYTES = 200 * 1024 * 1024
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'sources',
+            nargs='+',
+            help='Directorios, globs, archivos .zip o archivos sueltos (opcional ":CPO"/":CPC" al final)'
+        )
+        parser.add_argument(
+            '--ciclo',
+            type=str,
+            choices=sorted(CICLOS),
+            required=False,
+            help='Ciclo por defecto para los archivos que no lo indican'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Simula la importación sin guardar en la base de datos'
+        )
+        parser.add_argument(
+            '--update-existing',
+            action='store_true',
+            help='Actualiza comisiones existentes en lugar de omitirlas'
+        )
+        parser.add_argument(
+            '--diff',
+            action='store_true',
+            help='Compara el hash de cada comisión y sólo escribe las nuevas o modificadas'
+        )
+        parser.add_argument(
+            '--deactivate-missing',
+            action='store_true',
+            help='Con --diff: marca inactivas las comisiones del cuatrimestre/ciclo de cada archivo que ya no están (todos deben tener ciclo)'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='Archivos que se leen en paralelo'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=0,
+            help='Procesos para normalizar filas de cada archivo (ver import_comisiones --workers)'
+        )
+        parser.add_argument(
+            '--backend',
+            choices=import_comisiones.Command.BACKENDS,
+            default='auto',
+            help='Escritura: auto (COPY + staging en PostgreSQL, ORM en SQLite), orm o copy'
+        )
+
+    def handle(self, *args, **options):
+        self.last_run_result = None
+        dry_run = options['dry_run']
+        update_existing = options['update_existing']
+        diff = options.get('diff', False)
+        deactivate_missing = options.get('deactivate_missing', False)
+        ciclo_default = (options.get('ciclo') or '').strip().upper()
+        # Uso programático (ImportJob): ciclo por nombre de archivo y eventos
+        ciclos = {nombre: (ciclo or '').upper() for nombre, ciclo in (options.get('ciclos') or {}).items()}
+        self.events = options.get('events') or ImportEventLog()
+        self.verbosity = options.get('verbosity', 1)
+
+        if ciclo_default and ciclo_default not in CICLOS:
+            raise CommandError('El ciclo debe ser CPO o CPC si se especifica.')
+        if any(ciclo not in CICLOS | {''} for ciclo in ciclos.values()):
+            raise CommandError('Los ciclos por archivo deben ser CPO o CPC.')
+        if deactivate_missing and not diff:
+            raise CommandError('--deactivate-missing sólo puede usarse junto con --diff.')
+
+        with tempfile.TemporaryDirectory(prefix='import-lote-') as tmpdir:
+            archivos = self.resolver_archivos(options['sources'], Path(tmpdir))
+            if not archivos:
+                raise CommandError('No se encontraron archivos .csv/.xlsx/.xls para importar')
+            for archivo in archivos:
+                archivo['ciclo'] = (
+                    archivo['ciclo'] or ciclos.get(archivo['nombre'])
+                    or ciclo_desde_nombre(archivo['nombre']) or ciclo_default
+                )
+            sin_ciclo = [archivo['nombre'] for archivo in archivos if not archivo['ciclo']]
+            if deactivate_missing and sin_ciclo:
+                raise CommandError(
+                    f"--deactivate-missing requiere el ciclo de cada archivo (--ciclo, ruta:CPO o nombre): "
+                    f"sin ciclo {', '.join(sin_ciclo)}"
+                )
+
+            self.stdout.write(f'📦 Importando {len(archivos)} archivos')
+            for archivo in archivos:
+                self.stdout.write(f"   • {archivo['nombre']} (ciclo: {archivo['ciclo'] or 'N/D'})")
+            leidos = self.leer_archivos(archivos, options.get('threads') or 4, options.get('workers') or 0)
+
+        filas = sum(leido['filas'] for leido in leidos)
+        self.events.progress(filas, etapa='escritura')
+
+        # Un solo escritor: comparte el índice de docentes entre archivos
+        escritor = import_comisiones.Command()
+        escritor.stdout = self.stdout
+        escritor.stderr = self.stderr
+        escritor.verbosity = self.verbosity
+        escritor.events = self.events
+        escritor.backend = options.get('backend') or 'auto'
+        escritor.usar_copy()
+        # --dry-run: un solo plan en memoria que acumula el efecto de cada archivo
+        escritor.solo_plan = dry_run
+        claves = set()
+        plan = ImportPlan()
+
+        with nullcontext() if dry_run else transaction.atomic():
+            escritor.docente_index = DocenteIndex()
+            for leido in leidos:
+                escritor.ciclo_import = leido['ciclo']
+                if diff:
+                    result = escritor.diff_upsert(leido['registros'], deactivate_missing)
+                    leido['diff'] = escritor.diff_report
+                else:
+                    result = escritor.bulk_upsert(leido['registros'], update_existing)
+                for key, value in result.items():
+                    if key in leido['stats']:
+                        leido['stats'][key] += value
+                leido['plan'] = escritor.plan.as_dict()
+                plan.merge(escritor.plan)
+                claves |= escritor.claves_importadas
+                del leido['registros']
+
+        # Consolidación única al final, sólo sobre los grupos que tocó el lote
+        if not dry_run:
+            self.events.progress(filas, etapa='consolidacion')
+            if escritor.cleanup_comisiones_duplicadas(claves) or plan.hay_cambios():
+                transaction.on_commit(catalogo_modificado)
+
+        stats = import_comisiones.Command.empty_stats()
+        for leido in leidos:
+            for key, value in leido['stats'].items():
+                stats[key] += value
+
+        self.last_run_result = {
+            'stats': stats,
+            'archivos': leidos,
+            'dry_run': dry_run,
+            'filas': filas,
+            'plan': plan.as_dict(),
+        }
+        self.events.summary(stats, dry_run=dry_run, filas=filas, archivos=len(leidos))
+
+        for leido in leidos:
+            s = leido['stats']
+            self.stdout.write(
+                f"📄 {leido['nombre']}: {leido['filas']} filas, {s['comisiones_creadas']} creadas, "
+                f"{s['comisiones_actualizadas']} actualizadas, {s['comisiones_omitidas']} omitidas"
+            )
+        if dry_run:
+            escritor.print_plan(plan)
+        escritor.print_summary(stats, dry_run)
+
+    def resolver_archivos(self, sources, tmpdir):
+        """
+        Expande las fuentes en una lista de archivos {path, nombre, ciclo}.
+
+        Los .zip se extraen en tmpdir. El orden es el de las fuentes y,
+        dentro de cada una, alfabético (la escritura respeta ese orden).
+        """
+        archivos = []
+        for source in sources:
+            ciclo = ''
+            ruta, sep, sufijo = source.rpartition(':')
+            if sep and sufijo.upper() in CICLOS:
+                source, ciclo = ruta, sufijo.upper()
+
+            path = Path(source)
+            if path.is_dir():
+                encontrados = sorted(p for p in path.iterdir() if p.suffix.lower() in EXTENSIONES)
+            elif glob.has_magic(source):
+                encontrados = sorted(
+                    Path(p) for p in glob.glob(source) if Path(p).suffix.lower() in EXTENSIONES | {'.zip'}
+                )
+            elif path.exists():
+                encontrados = [path]
+            else:
+                raise CommandError(f'El archivo {source} no existe')
+
+            for encontrado in encontrados:
+                if encontrado.suffix.lower() == '.zip':
+                    for miembro, nombre in self.extraer_zip(encontrado, tmpdir):
+                        archivos.append({'path': miembro, 'nombre': nombre, 'ciclo': ciclo})
+                elif encontrado.suffix.lower() in EXTENSIONES:
+                    archivos.append({'path': encontrado, 'nombre': encontrado.name, 'ciclo': ciclo})
+                else:
+                    raise CommandError(f'Formato no soportado: {encontrado.suffix}')
+        return archivos
+
+    def extraer_zip(self, path, tmpdir):
+        """Extrae los .csv/.xlsx/.xls de un zip; genera (ruta extraída, nombre)."""
+        try:
+            zf = zipfile.ZipFile(path)
+        except zipfile.BadZipFile as exc:
+            raise CommandError(f'{path.name} no es un .zip válido') from exc
+
+        with zf:
+            miembros = sorted(
+                (m for m in zf.infolist()
+                 if not m.is_dir() and Path(m.filename).suffix.lower() in EXTENSIONES
+                 and not Path(m.filename).name.startswith('.') and '__MACOSX' not in m.filename),
+                key=lambda m: m.filename,
+            )
+            if sum(m.file_size for m in miembros) > self.MAX_ZIP_BYTES:
+                raise CommandError(f'{path.name} supera el tamaño máximo descomprimido')
+
+            destino = tmpdir / path.stem
+            destino.mkdir(exist_ok=True)
+            for i, miembro in enumerate(miembros):
+                # Sólo el nombre base: evita rutas fuera de tmpdir ("../")
+                nombre = Path(miembro.filename).name
+                extraido = destino / f'{i:03d}_{nombre}'
+                with zf.open(miembro) as origen, open(extraido, 'wb') as salida:
+                    shutil.copyfileobj(origen, salida)
+                yield extraido, nombre
+
+    def leer_archivos(self, archivos, threads, workers):
+        """
+        Lee, analiza duplicados y normaliza los archivos en paralelo.
+
+        Cada hilo usa su propia instancia del comando (sin tocar la base de
+        datos) y su propio ImportEventLog; los resultados se devuelven en el
+        orden de `archivos` y las advertencias/errores de lectura de cada
+        archivo (ej: líneas que no se pudieron decodificar) pasan a
+        self.events con el nombre del archivo.
+        """
+        def leer(archivo):
+            lector = import_comisiones.Command()
+            lector.stdout = self.stdout
+            lector.stderr = self.stderr
+            lector.events = ImportEventLog()
+            lector.ciclo_import = archivo['ciclo']
+            stats = lector.empty_stats()
+            data = lector.open_reader(archivo['path'])
+            registros, analizador = lector.read_registros(data, archivo['ciclo'], stats, workers=workers)
+            return {
+                'nombre': archivo['nombre'],
+                'ciclo': archivo['ciclo'],
+                'filas': analizador.filas,
+                'registros': registros,
+                'duplicates': analizador.result(),
+                'stats': stats,
+                'events': lector.events,
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, min(threads, len(archivos)))) as pool:
+            futuros = [pool.submit(leer, archivo) for archivo in archivos]
+            leidos = []
+            filas = 0
+            for futuro in futuros:
+                leido = futuro.result()
+                filas += leido['filas']
+                self.events.incorporar(leido.pop('events'), archivo=leido['nombre'])
+                self.events.progress(filas, archivo=leido['nombre'])
+                reporter = import_comisiones.Command()
+                reporter.stdout = self.stdout
+                reporter.events = self.events
+                reporter.report_duplicates(leido['duplicates'], archivo=leido['nombre'])
+                leidos.append(leido)
+        return leidos
@@ -0,0 +1,67 @@
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+def _normalizar(valor):
+    # Copia congelada de academic.utils.normalizar_texto
+    if not valor:
+        return ''
+    texto = unicodedata.normalize('NFKD', str(valor).casefold())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r'\s+', ' ', texto).strip()
+
+
+def poblar_nombre_normalizado(apps, schema_editor):
+    """Completa nombre_normalizado y fusiona docentes que colisionan."""
+    Docente = apps.get_model('academic', 'Docente')
+    Comision = apps.get_model('academic', 'Comision')
+    Recomendacion = apps.get_model('recommendations', 'Recomendacion')
+
+    vistos = {}
+    for docente in Docente.objects.order_by('id_docente'):
+        key = _normalizar(docente.nombre_completo or f"{docente.nombre} {docente.apellido}") or None
+        if key is None:
+            continue
+        survivor_id = vistos.get(key)
+        if survivor_id is None:
+            vistos[key] = docente.id_docente
+            Docente.objects.filter(pk=docente.pk).update(nombre_normalizado=key)
+            continue
+
+        # Duplicado: mover sus comisiones al primero y borrarlo
+        for com in Comision.objects.filter(docente_id=docente.pk):
+            superviviente = Comision.objects.filter(
+                codigo=com.codigo, docente_id=survivor_id, horario=com.horario,
+                cuatrimestre=com.cuatrimestre, sede=com.sede,
+            ).first()
+            if superviviente is not None:
+                # Recomendacion.comision es CASCADE: pasarlas antes de borrar
+                Recomendacion.objects.filter(comision_id=com.pk).update(comision_id=superviviente.pk)
+                com.delete()
+            else:
+                Comision.objects.filter(pk=com.pk).update(docente_id=survivor_id)
+        docente.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0008_comision_ciclo'),
+        ('recommendations', '0003_remove_recomendacion_recommendat_catedra_2611e0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='docente',
+            name='nombre_normalizado',
+            field=models.CharField(blank=True, editable=False, help_text='nombre_completo sin mayúsculas, acentos ni espacios extra (clave de deduplicación)', max_length=200, null=True, verbose_name='Nombre Normalizado'),
+        ),
+        migrations.RunPython(poblar_nombre_normalizado, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='docente',
+            name='nombre_normalizado',
+            field=models.CharField(blank=True, editable=False, help_text='nombre_completo sin mayúsculas, acentos ni espacios extra (clave de deduplicación)', max_length=200, null=True, unique=True, verbose_name='Nombre Normalizado'),
+        ),
+    ]
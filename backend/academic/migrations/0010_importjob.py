@@ -0,0 +1,44 @@
+# Generated by Django 6.0 on 2026-10-17 23:09
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0009_docente_nombre_normalizado'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('archivo', models.FileField(blank=True, help_text='Archivo subido; se elimina al terminar la importación', upload_to='importaciones/', verbose_name='Archivo')),
+                ('nombre_archivo', models.CharField(max_length=255, verbose_name='Nombre del Archivo')),
+                ('ciclo', models.CharField(blank=True, default='', max_length=3, verbose_name='Ciclo (CPO/CPC)')),
+                ('update_existing', models.BooleanField(default=False, verbose_name='Actualizar Existentes')),
+                ('dry_run', models.BooleanField(default=False, verbose_name='Dry Run')),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('en_progreso', 'En Progreso'), ('completado', 'Completado'), ('error', 'Error')], default='pendiente', max_length=20, verbose_name='Estado')),
+                ('filas_procesadas', models.IntegerField(default=0, verbose_name='Filas Procesadas')),
+                ('stats', models.JSONField(blank=True, default=dict, verbose_name='Estadísticas')),
+                ('duplicates', models.JSONField(blank=True, default=dict, verbose_name='Reporte de Duplicados')),
+                ('log', models.JSONField(blank=True, default=list, verbose_name='Log')),
+                ('error', models.TextField(blank=True, default='', verbose_name='Error')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('inicio', models.DateTimeField(blank=True, null=True, verbose_name='Inicio')),
+                ('fin', models.DateTimeField(blank=True, null=True, verbose_name='Fin')),
+                ('usuario', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='importaciones', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Importación',
+                'verbose_name_plural': 'Importaciones',
+                'ordering': ['-fecha_creacion'],
+                'indexes': [models.Index(fields=['estado', '-fecha_creacion'], name='academic_im_estado_049fdf_idx')],
+            },
+        ),
+    ]
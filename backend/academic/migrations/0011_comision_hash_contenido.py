@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-17 23:40
+
+import hashlib
+
+from django.db import migrations, models
+
+# Copia congelada de academic.importacion.contenido
+CAMPOS_CONTENIDO = [
+    'codigo_actividad', 'nombre', 'modalidad', 'recomendacion_raw',
+    'es_centro_externo', 'ciclo', 'horario',
+]
+
+
+def _hash(comision):
+    partes = []
+    for campo in CAMPOS_CONTENIDO:
+        valor = getattr(comision, campo)
+        if campo == 'nombre':
+            valor = (valor or '')[:200]
+        partes.append('' if valor is None else str(valor))
+    return hashlib.sha256('\x1f'.join(partes).encode('utf-8')).hexdigest()
+
+
+def poblar_hash_contenido(apps, schema_editor):
+    """Calcula hash_contenido para las comisiones existentes."""
+    Comision = apps.get_model('academic', 'Comision')
+    lote = []
+    for comision in Comision.objects.only('id_comision', *CAMPOS_CONTENIDO).iterator(chunk_size=500):
+        comision.hash_contenido = _hash(comision)
+        lote.append(comision)
+        if len(lote) >= 500:
+            Comision.objects.bulk_update(lote, ['hash_contenido'])
+            lote = []
+    if lote:
+        Comision.objects.bulk_update(lote, ['hash_contenido'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0010_importjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comision',
+            name='hash_contenido',
+            field=models.CharField(blank=True, default='', editable=False, help_text='sha256 de los campos importables, usado por la importación diferencial', max_length=64, verbose_name='Hash de contenido'),
+        ),
+        migrations.RunPython(poblar_hash_contenido, migrations.RunPython.noop),
+    ]
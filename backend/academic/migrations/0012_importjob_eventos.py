@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0011_comision_hash_contenido'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='contadores',
+            field=models.JSONField(blank=True, default=dict, help_text='Cantidad de eventos por tipo: progress, warning, error, summary', verbose_name='Contadores de Eventos'),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='etapa',
+            field=models.CharField(blank=True, default='', max_length=20, verbose_name='Etapa'),
+        ),
+        migrations.AlterField(
+            model_name='importjob',
+            name='log',
+            field=models.JSONField(blank=True, default=list, help_text='Eventos de advertencia y error (acotado, ver importacion.eventos.MAX_LOG)', verbose_name='Log'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0012_importjob_eventos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='archivos',
+            field=models.JSONField(blank=True, default=list, help_text='Importación en lote: resultado por archivo (nombre, ciclo, filas, stats)', verbose_name='Archivos'),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='ciclos',
+            field=models.JSONField(blank=True, default=dict, help_text='Importación en lote: nombre de archivo -> CPO/CPC (el resto usa ciclo)', verbose_name='Ciclos por Archivo'),
+        ),
+    ]
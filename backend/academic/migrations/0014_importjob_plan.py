@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0013_importjob_lote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='plan',
+            field=models.JSONField(blank=True, default=dict, help_text='Dry-run: qué se crearía, actualizaría, omitiría, borraría o desactivaría', verbose_name='Plan'),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 6.0 on 2026-10-18 04:10
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+# Índices GIN de búsqueda (sólo PostgreSQL); la expresión debe coincidir con
+# la de academic.busqueda.CoincideTokens para que el planner los use
+INDICES_GIN = [
+    ('academic_docente', 'academic_docente_search_gin'),
+    ('academic_comision', 'academic_comision_search_gin'),
+]
+
+
+def _texto_busqueda(*valores):
+    # Copia congelada de academic.utils.texto_busqueda
+    tokens = {}
+    for valor in valores:
+        if not valor:
+            continue
+        texto = unicodedata.normalize('NFKD', str(valor).casefold())
+        texto = ''.join(c for c in texto if not unicodedata.combining(c))
+        tokens.update(dict.fromkeys(re.findall(r'[^\W_]+', texto)))
+    return f" {' '.join(tokens)} " if tokens else ''
+
+
+def poblar_search_texto(apps, schema_editor):
+    """Calcula search_texto para los docentes y comisiones existentes."""
+    Docente = apps.get_model('academic', 'Docente')
+    Comision = apps.get_model('academic', 'Comision')
+
+    nombres = {}
+    lote = []
+    for docente in Docente.objects.iterator(chunk_size=500):
+        nombres[docente.pk] = docente.nombre_completo
+        docente.search_texto = _texto_busqueda(
+            docente.nombre, docente.apellido, docente.nombre_completo, docente.alias_search
+        )
+        lote.append(docente)
+        if len(lote) >= 500:
+            Docente.objects.bulk_update(lote, ['search_texto'])
+            lote = []
+    if lote:
+        Docente.objects.bulk_update(lote, ['search_texto'])
+
+    campos = ['codigo', 'codigo_actividad', 'nombre', 'cuatrimestre', 'sede']
+    lote = []
+    for com in Comision.objects.only('id_comision', 'docente_id', *campos).iterator(chunk_size=500):
+        com.search_texto = _texto_busqueda(
+            *(getattr(com, campo) for campo in campos), nombres.get(com.docente_id)
+        )
+        lote.append(com)
+        if len(lote) >= 500:
+            Comision.objects.bulk_update(lote, ['search_texto'])
+            lote = []
+    if lote:
+        Comision.objects.bulk_update(lote, ['search_texto'])
+
+
+def crear_indices_gin(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for tabla, indice in INDICES_GIN:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {indice} ON {tabla} "
+            f"USING gin (to_tsvector('simple'::regconfig, COALESCE(search_texto, '')))"
+        )
+
+
+def borrar_indices_gin(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _tabla, indice in INDICES_GIN:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {indice}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0014_importjob_plan'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comision',
+            name='search_texto',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Tokens normalizados de código, nombre, cuatrimestre, sede y docente (ver academic.busqueda)', verbose_name='Texto de búsqueda'),
+        ),
+        migrations.AddField(
+            model_name='docente',
+            name='search_texto',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Tokens normalizados de nombre, apellido y alias (ver academic.busqueda)', verbose_name='Texto de búsqueda'),
+        ),
+        migrations.RunPython(poblar_search_texto, migrations.RunPython.noop),
+        migrations.RunPython(crear_indices_gin, borrar_indices_gin),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-18 05:20
+
+from django.db import migrations
+
+# Índices de trigramas para la búsqueda por similitud (sólo PostgreSQL);
+# en el resto de las bases academic.busqueda usa un índice en memoria
+INDICES_TRGM = [
+    ('academic_docente', 'academic_docente_search_trgm'),
+    ('academic_comision', 'academic_comision_search_trgm'),
+]
+
+
+def crear_indices_trgm(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for tabla, indice in INDICES_TRGM:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {indice} ON {tabla} USING gin (search_texto gin_trgm_ops)'
+        )
+
+
+def borrar_indices_trgm(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _tabla, indice in INDICES_TRGM:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {indice}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0015_search_texto'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices_trgm, borrar_indices_trgm),
+    ]
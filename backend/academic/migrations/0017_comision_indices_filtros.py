@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0016_search_trigramas'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comision',
+            index=models.Index(fields=['cuatrimestre', 'ciclo', 'activa'], name='academic_co_cuatrim_7b26c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comision',
+            index=models.Index(fields=['cuatrimestre', 'sede', 'activa'], name='academic_co_cuatrim_559a52_idx'),
+        ),
+    ]
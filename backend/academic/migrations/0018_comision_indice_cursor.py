@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0017_comision_indices_filtros'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comision',
+            index=models.Index(fields=['codigo', 'id_comision'], name='academic_co_codigo_6902e2_idx'),
+        ),
+    ]
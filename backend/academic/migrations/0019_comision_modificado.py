@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 14:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def poblar_modificado(apps, schema_editor):
+    Comision = apps.get_model('academic', 'Comision')
+    Comision.objects.update(modificado=models.F('ultima_actualizacion_scraping'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0018_comision_indice_cursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comision',
+            name='modificado',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Último cambio de lo que muestra la comisión, incluido su docente (Last-Modified)', verbose_name='Modificado'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(poblar_modificado, migrations.RunPython.noop),
+    ]
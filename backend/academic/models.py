@@ -1,7 +1,14 @@
 """
 Modelos relacionados con información académica.
 """
-from django.db import models
+import uuid
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from .importacion import CAMPOS_CONTENIDO, hash_contenido
+from .utils import CatalogoQuerySet, avisar_borrado, normalizar_texto, texto_busqueda
 
 
 class Docente(models.Model):
@@ -13,13 +20,87 @@ class Docente(models.Model):
     apellido = models.CharField(max_length=100, verbose_name="Apellido")
     nombre_completo = models.CharField(max_length=200, verbose_name="Nombre Completo", blank=True)
     alias_search = models.TextField(verbose_name="Alias Search", blank=True, help_text="Para búsquedas")
+    nombre_normalizado = models.CharField(
+        max_length=200,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Nombre Normalizado",
+        help_text="nombre_completo sin mayúsculas, acentos ni espacios extra (clave de deduplicación)"
+    )
+    search_texto = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Texto de búsqueda",
+        help_text="Tokens normalizados de nombre, apellido y alias (ver academic.busqueda)"
+    )
     # Django ORM manager (explícito para type checking)
-    objects: models.Manager['Docente']
-    
+    objects: models.Manager['Docente'] = CatalogoQuerySet.as_manager()
+
+    # Campos que alimentan search_texto
+    CAMPOS_BUSQUEDA = ['nombre', 'apellido', 'nombre_completo', 'alias_search']
+
+    def calcular_search_texto(self) -> str:
+        return texto_busqueda(*(getattr(self, campo) for campo in self.CAMPOS_BUSQUEDA))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        # Valores leídos de la base, para que save() sepa si cambiaron
+        cargados = dict(zip(field_names, values))
+        instancia._busqueda_leida = {c: cargados[c] for c in cls.CAMPOS_BUSQUEDA if c in cargados}
+        return instancia
+
+    def busqueda_modificada(self, update_fields=None) -> bool:
+        """
+        True si se guarda un cambio en CAMPOS_BUSQUEDA respecto de lo leído
+        de la base. Sin lo leído (instancia armada a mano) se asume que sí.
+        """
+        leidos = getattr(self, '_busqueda_leida', None)
+        if leidos is None:
+            return True
+        campos = self.CAMPOS_BUSQUEDA if update_fields is None else set(self.CAMPOS_BUSQUEDA) & set(update_fields)
+        return any(
+            campo in self.__dict__ and (campo not in leidos or leidos[campo] != self.__dict__[campo])
+            for campo in campos
+        )
+
     def save(self, *args, **kwargs):
         if not self.nombre_completo:
             self.nombre_completo = f"{self.nombre} {self.apellido}".strip()
-        super().save(*args, **kwargs)
+        self.nombre_normalizado = normalizar_texto(self.nombre_completo) or None
+        self.search_texto = self.calcular_search_texto()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(self.CAMPOS_BUSQUEDA):
+            kwargs['update_fields'] = {*update_fields, 'search_texto'}
+        # Las comisiones muestran al docente: sólo se tocan si cambió lo que muestran
+        actualizar_comisiones = not self._state.adding and self.busqueda_modificada(update_fields)
+        # En una transacción: la versión nueva (on_commit de post_save) se
+        # publica después de actualizar `modificado` en las comisiones
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if actualizar_comisiones:
+                self.actualizar_search_comisiones()
+        self._busqueda_leida = {c: self.__dict__[c] for c in self.CAMPOS_BUSQUEDA if c in self.__dict__}
+
+    def delete(self, *args, **kwargs):
+        return avisar_borrado(super().delete(*args, **kwargs))  # ver academic.signals
+
+    def actualizar_search_comisiones(self):
+        """
+        Recalcula search_texto de las comisiones (incluye el nombre del
+        docente) y marca `modificado`: el detalle de cada comisión incluye
+        al docente, así que su Last-Modified cambia.
+        """
+        ahora = timezone.now()
+        comisiones = list(self.comisiones.only('id_comision', 'docente', 'search_texto', *Comision.CAMPOS_BUSQUEDA))
+        for com in comisiones:
+            com.search_texto = com.calcular_search_texto(self.nombre_completo)
+            com.modificado = ahora
+        if comisiones:
+            Comision.objects.bulk_update(comisiones, ['search_texto', 'modificado'], batch_size=500)
 
     def __str__(self):
         return self.nombre_completo
@@ -239,6 +320,11 @@ class Comision(models.Model):
         auto_now=True,
         verbose_name="Última Actualización"
     )
+    modificado = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Modificado",
+        help_text="Último cambio de lo que muestra la comisión, incluido su docente (Last-Modified)"
+    )
     activa = models.BooleanField(
         default=True,
         verbose_name="Activa",
@@ -248,9 +334,27 @@ class Comision(models.Model):
         auto_now_add=True,
         verbose_name="Fecha de Creación"
     )
+    hash_contenido = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Hash de contenido",
+        help_text="sha256 de los campos importables, usado por la importación diferencial"
+    )
+    search_texto = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Texto de búsqueda",
+        help_text="Tokens normalizados de código, nombre, cuatrimestre, sede y docente (ver academic.busqueda)"
+    )
     
     # Django ORM manager (explícito para type checking)
-    objects: models.Manager['Comision']
+    objects: models.Manager['Comision'] = CatalogoQuerySet.as_manager()
+
+    # Campos propios que alimentan search_texto (además del nombre del docente)
+    CAMPOS_BUSQUEDA = ['codigo', 'codigo_actividad', 'nombre', 'cuatrimestre', 'sede']
     
     class Meta:
         verbose_name = "Comisión"
@@ -267,8 +371,142 @@ class Comision(models.Model):
             models.Index(fields=['activa']),
             models.Index(fields=['sede']),
             models.Index(fields=['es_centro_externo']),
+            # Filtros combinados de /api/catedras/ (academic.filters.ComisionFilter)
+            models.Index(fields=['cuatrimestre', 'ciclo', 'activa']),
+            models.Index(fields=['cuatrimestre', 'sede', 'activa']),
+            # Orden de la paginación por cursor (config.pagination.CatedrasPaginacion)
+            models.Index(fields=['codigo', 'id_comision']),
         ]
     
+    def calcular_hash_contenido(self) -> str:
+        """Hash de los campos que vienen del archivo de importación."""
+        return hash_contenido({campo: getattr(self, campo) for campo in CAMPOS_CONTENIDO})
+
+    def calcular_search_texto(self, docente_nombre=None) -> str:
+        """
+        Tokens de búsqueda. `docente_nombre` evita leer el docente cuando ya
+        se conoce (importación); por defecto se usa self.docente.
+        """
+        if docente_nombre is None and self.docente_id:
+            docente_nombre = self.docente.nombre_completo
+        return texto_busqueda(*(getattr(self, campo) for campo in self.CAMPOS_BUSQUEDA), docente_nombre)
+
+    def save(self, *args, **kwargs):
+        self.hash_contenido = self.calcular_hash_contenido()
+        self.search_texto = self.calcular_search_texto()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            extra = set()
+            if set(update_fields) & set(CAMPOS_CONTENIDO):
+                extra.add('hash_contenido')
+            if set(update_fields) & {*self.CAMPOS_BUSQUEDA, 'docente', 'docente_id'}:
+                extra.add('search_texto')
+            if extra:
+                kwargs['update_fields'] = {*update_fields, *extra}
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return avisar_borrado(super().delete(*args, **kwargs))  # ver academic.signals
+
     def __str__(self) -> str:
         docente_str = str(self.docente) if self.docente else "Sin Docente"
         return f"{self.codigo} - {self.nombre} ({docente_str})"
+
+
+class ImportJob(models.Model):
+    """
+    Importación de comisiones ejecutada en segundo plano.
+
+    La API guarda el archivo subido, crea el job y lo encola en Celery.
+    El cliente consulta el progreso con el id del job.
+    """
+    ESTADO_CHOICES = [
+        ('pendiente', 'Pendiente'),
+        ('en_progreso', 'En Progreso'),
+        ('completado', 'Completado'),
+        ('error', 'Error'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    archivo = models.FileField(
+        upload_to='importaciones/',
+        blank=True,
+        verbose_name="Archivo",
+        help_text="Archivo subido; se elimina al terminar la importación"
+    )
+    nombre_archivo = models.CharField(max_length=255, verbose_name="Nombre del Archivo")
+    usuario = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='importaciones',
+        verbose_name="Usuario"
+    )
+
+    # Opciones de import_comisiones
+    ciclo = models.CharField(max_length=3, blank=True, default="", verbose_name="Ciclo (CPO/CPC)")
+    update_existing = models.BooleanField(default=False, verbose_name="Actualizar Existentes")
+    dry_run = models.BooleanField(default=False, verbose_name="Dry Run")
+    ciclos = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Ciclos por Archivo",
+        help_text="Importación en lote: nombre de archivo -> CPO/CPC (el resto usa ciclo)"
+    )
+
+    # Estado y progreso
+    estado = models.CharField(
+        max_length=20,
+        choices=ESTADO_CHOICES,
+        default='pendiente',
+        verbose_name="Estado"
+    )
+    filas_procesadas = models.IntegerField(default=0, verbose_name="Filas Procesadas")
+    stats = models.JSONField(default=dict, blank=True, verbose_name="Estadísticas")
+    duplicates = models.JSONField(default=dict, blank=True, verbose_name="Reporte de Duplicados")
+    plan = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Plan",
+        help_text="Dry-run: qué se crearía, actualizaría, omitiría, borraría o desactivaría"
+    )
+    archivos = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Archivos",
+        help_text="Importación en lote: resultado por archivo (nombre, ciclo, filas, stats)"
+    )
+    log = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Log",
+        help_text="Eventos de advertencia y error (acotado, ver importacion.eventos.MAX_LOG)"
+    )
+    contadores = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Contadores de Eventos",
+        help_text="Cantidad de eventos por tipo: progress, warning, error, summary"
+    )
+    etapa = models.CharField(max_length=20, blank=True, default="", verbose_name="Etapa")
+    error = models.TextField(blank=True, default="", verbose_name="Error")
+
+    # Timestamps
+    fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de Creación")
+    inicio = models.DateTimeField(null=True, blank=True, verbose_name="Inicio")
+    fin = models.DateTimeField(null=True, blank=True, verbose_name="Fin")
+
+    # Django ORM manager (explícito para type checking)
+    objects: models.Manager['ImportJob']
+
+    class Meta:
+        verbose_name = "Importación"
+        verbose_name_plural = "Importaciones"
+        ordering = ['-fecha_creacion']
+        indexes = [
+            models.Index(fields=['estado', '-fecha_creacion']),
+        ]
+
+    def __str__(self) -> str:
+        return f"Importación {self.nombre_archivo} ({self.estado})"
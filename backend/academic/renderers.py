@@ -0,0 +1,54 @@
+"""
+Renderers para respuestas en streaming de la app academic.
+
+Las respuestas de streaming (StreamingHttpResponse) no pasan por el
+renderer; estas clases sólo permiten que la negociación de contenido de DRF
+acepte `Accept: application/x-ndjson` / `text/event-stream` / `text/csv`
+(o `?format=ndjson|sse|csv`) y rendericen los errores (400, 404, 403...).
+"""
+import csv
+import io
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (json.dumps(data, ensure_ascii=False) + '\n').encode(self.charset)
+
+
+class EventStreamRenderer(BaseRenderer):
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return f"event: error\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode(self.charset)
+
+
+class CSVRenderer(BaseRenderer):
+    """Exportaciones en CSV (config.exportar); los errores van como filas campo,error."""
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['campo', 'error'])
+        errores = data.items() if isinstance(data, dict) else [('detail', data)]
+        for campo, mensajes in errores:
+            for mensaje in mensajes if isinstance(mensajes, list) else [mensajes]:
+                writer.writerow([campo, mensaje])
+        return buffer.getvalue().encode(self.charset)
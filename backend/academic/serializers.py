@@ -3,16 +3,21 @@ Serializers para la app academic.
 
 Contiene serializers anidados que permiten una representación jerárquica
 de los datos académicos con validación y relaciones documentadas.
+
+Los serializers de docentes y comisiones aceptan ?fields= y ?expand= en
+los GET (ver config.campos).
 """
 from rest_framework import serializers
-from .models import Docente, Comision
+from config.campos import CamposDinamicosMixin
+from .models import Docente, Comision, ImportJob
+from .utils import normalizar_texto
 
 
 # ============================================================================
 # SERIALIZERS BÁSICOS (Sin relaciones anidadas)
 # ============================================================================
 
-class DocenteSerializer(serializers.ModelSerializer):
+class DocenteSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer básico para Docente.
     
@@ -31,8 +36,19 @@ class DocenteSerializer(serializers.ModelSerializer):
         fields = ['id_docente', 'nombre', 'apellido', 'nombre_completo', 'alias_search']
         read_only_fields = ['id_docente', 'nombre_completo']
 
+    def validate(self, attrs):
+        """Evita crear un docente que ya existe con otra capitalización o acentos."""
+        if self.instance is None:
+            nombre_completo = f"{attrs.get('nombre', '')} {attrs.get('apellido', '')}".strip()
+            key = normalizar_texto(nombre_completo)
+            if key and Docente.objects.filter(nombre_normalizado=key).exists():
+                raise serializers.ValidationError(
+                    {'nombre_completo': f'Ya existe un docente llamado "{nombre_completo}".'}
+                )
+        return attrs
+
 
-class ComisionSerializer(serializers.ModelSerializer):
+class ComisionSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer básico para Comisión.
     
@@ -72,7 +88,7 @@ class ComisionSerializer(serializers.ModelSerializer):
 # SERIALIZERS ANIDADOS (Con relaciones incluidas)
 # ============================================================================
 
-class DocenteConComisionesSerializer(serializers.ModelSerializer):
+class DocenteConComisionesSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer ANIDADO para Docente que incluye sus comisiones.
     
@@ -117,7 +133,7 @@ class DocenteConComisionesSerializer(serializers.ModelSerializer):
         read_only_fields = ['id_docente', 'nombre_completo', 'comisiones']
 
 
-class ComisionConDocenteSerializer(serializers.ModelSerializer):
+class ComisionConDocenteSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer ANIDADO para Comisión que incluye datos del docente.
     
@@ -157,3 +173,29 @@ class ComisionConDocenteSerializer(serializers.ModelSerializer):
             'ultima_actualizacion_scraping', 'fecha_creacion'
         ]
         read_only_fields = ['id_comision', 'fecha_creacion', 'ultima_actualizacion_scraping', 'docente']
+
+
+# ============================================================================
+# IMPORTACIONES EN SEGUNDO PLANO
+# ============================================================================
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """
+    Estado y progreso de una importación (GET /api/importaciones/{id}/).
+
+    Mientras estado es 'pendiente' o 'en_progreso' el cliente repite la
+    consulta; al terminar incluye stats y reporte de duplicados. `log` sólo
+    tiene advertencias y errores (acotado); `contadores` tiene el total de
+    eventos por tipo. En importaciones en lote `archivos` trae el resultado
+    de cada archivo y `stats` los totales. En un dry-run `plan` trae el
+    detalle de lo que se escribiría (ver importacion.plan).
+    """
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            'id', 'nombre_archivo', 'ciclo', 'ciclos', 'update_existing', 'dry_run',
+            'estado', 'etapa', 'filas_procesadas', 'stats', 'duplicates', 'plan', 'archivos', 'log', 'contadores', 'error',
+            'fecha_creacion', 'inicio', 'fin',
+        ]
+        read_only_fields = fields
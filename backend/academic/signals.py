@@ -0,0 +1,33 @@
+"""
+Signals de la app academic.
+
+Guardar un docente o una comisión cambia el catálogo: se llama a
+utils.catalogo_modificado() (invalida los índices de búsqueda en memoria e
+incrementa Cache_Metadatos.version) con transaction.on_commit, así la nueva
+versión se publica recién cuando las filas son visibles para los demás (y
+nunca si la transacción se revierte).
+
+Los borrados no usan post_delete: un receiver de post_delete obliga a
+Django a cargar las filas de cada queryset.delete() y lo llamaría una vez
+por fila. Se avisan con utils.avisar_borrado() desde delete() de instancia
+y desde utils.CatalogoQuerySet.delete() (acciones del admin, la limpieza de
+duplicados de la importación), una vez por llamada y mirando las filas
+borradas por CASCADE (también al borrar posts o grupos de scraping). Las
+escrituras en lote de la importación no disparan signals: import_comisiones
+llama a catalogo_modificado() al terminar si escribió algo.
+"""
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Comision, Docente
+from .utils import catalogo_modificado
+
+
+@receiver(post_save, sender=Docente)
+@receiver(post_save, sender=Comision)
+def catalogo_guardado(sender, raw=False, **kwargs):
+    # raw: loaddata; los fixtures no cambian la versión
+    if raw:
+        return
+    transaction.on_commit(catalogo_modificado)
@@ -0,0 +1,107 @@
+"""
+Tareas Celery de la app academic.
+"""
+import io
+import logging
+from pathlib import Path
+
+from celery import shared_task
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from .importacion.eventos import ImportEventLog
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+
+def serializar_duplicados(dup_info):
+    """Convierte el reporte de duplicados (con sets) a algo guardable en JSONField."""
+    return {
+        key: sorted(value) if isinstance(value, set) else value
+        for key, value in (dup_info or {}).items()
+    }
+
+
+@shared_task
+def run_import_job(job_id):
+    """
+    Ejecuta import_comisiones para un ImportJob y guarda el resultado.
+
+    Los eventos del comando se acumulan en un ImportEventLog: en cada evento
+    de progreso se guardan en el job las filas leídas, la etapa, los
+    contadores y el log acotado de advertencias/errores (fuera de la
+    transacción de escritura), así el cliente puede consultarlos con
+    GET /api/importaciones/{id}/ o seguirlos con .../eventos/.
+
+    Si el archivo es un .zip (importación en lote) corre
+    import_comisiones_lote con los ciclos por archivo del job.
+    """
+    from academic.management.commands import import_comisiones, import_comisiones_lote
+
+    job = ImportJob.objects.get(pk=job_id)
+    ImportJob.objects.filter(pk=job.pk).update(estado='en_progreso', inicio=timezone.now())
+
+    def guardar_progreso(evento):
+        if evento.tipo != 'progress':
+            return
+        ImportJob.objects.filter(pk=job.pk).update(
+            filas_procesadas=evento.datos['filas'],
+            etapa=evento.datos['etapa'],
+            log=eventos.log,
+            contadores=eventos.contadores,
+        )
+
+    eventos = ImportEventLog(listeners=[guardar_progreso])
+    path = Path(job.archivo.path)
+    lote = path.suffix.lower() == '.zip'
+    cmd = import_comisiones_lote.Command() if lote else import_comisiones.Command()
+    # La salida de consola no se guarda: el job expone eventos tipados
+    cmd.stdout = io.StringIO()
+    cmd.stderr = io.StringIO()
+
+    campos = {'fin': None}
+    try:
+        opciones = {
+            'dry_run': job.dry_run,
+            'update_existing': job.update_existing,
+            'ciclo': job.ciclo,
+            'events': eventos,
+        }
+        if lote:
+            cmd.handle(sources=[str(path)], ciclos=job.ciclos, **opciones)
+        else:
+            cmd.handle(file_path=str(path), **opciones)
+        result = getattr(cmd, 'last_run_result', {}) or {}
+        campos.update(
+            estado='completado',
+            stats=result.get('stats', {}),
+            duplicates=serializar_duplicados(result.get('duplicates')),
+            plan=result.get('plan') if job.dry_run else {},
+            archivos=[
+                {
+                    'nombre': archivo['nombre'],
+                    'ciclo': archivo['ciclo'],
+                    'filas': archivo['filas'],
+                    'stats': archivo['stats'],
+                    'duplicates': serializar_duplicados(archivo['duplicates']),
+                }
+                for archivo in result.get('archivos', [])
+            ],
+            filas_procesadas=result.get('filas', 0),
+        )
+    except CommandError as exc:
+        eventos.error(str(exc), fatal=True)
+        campos.update(estado='error', error=str(exc))
+    except Exception as exc:  # noqa: BLE001 - el job debe quedar en estado final
+        logger.exception('Error en importación %s', job.pk)
+        eventos.error(f'Error inesperado: {exc}', fatal=True)
+        campos.update(estado='error', error=f'Error inesperado: {exc}')
+    finally:
+        job.archivo.delete(save=False)
+
+    campos['fin'] = timezone.now()
+    campos['log'] = eventos.log
+    campos['contadores'] = eventos.contadores
+    ImportJob.objects.filter(pk=job.pk).update(archivo='', **campos)
+    return str(job.pk)
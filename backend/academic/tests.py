@@ -7,20 +7,23 @@ Cobertura:
 - ViewSets: búsqueda, filtrado, ordenamiento
 - Importación: CSV/Excel
 - Optimización de queries
+- Migraciones de datos
 """
 import tempfile
 from pathlib import Path
 from io import StringIO
 from django.test import TestCase, TransactionTestCase
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.db import connection
-from django.test.utils import override_settings
+from django.test.utils import override_settings, CaptureQueriesContext
 
 from .models import Docente, Comision
+from .management.commands import import_comisiones, import_comisiones_lote
 
 User = get_user_model()
 
@@ -79,6 +82,59 @@ class DocenteModelTest(TestCase):
         self.assertIn(comision1, docente.comisiones.all())
         self.assertIn(comision2, docente.comisiones.all())
 
+    def test_nombre_normalizado_is_unique(self):
+        """Dos docentes con el mismo nombre (sin importar acentos/mayúsculas) no pueden coexistir."""
+        docente = Docente.objects.create(nombre='José', apellido='Pérez')
+        self.assertEqual(docente.nombre_normalizado, 'jose perez')
+
+        with self.assertRaises(Exception):
+            Docente.objects.create(nombre='JOSE', apellido='PEREZ')
+
+
+class NormalizacionTest(TestCase):
+    """Tests de normalizar_texto y DocenteIndex."""
+
+    def test_normalizar_texto(self):
+        from .utils import normalizar_texto
+
+        self.assertEqual(normalizar_texto('  GARCÍA   Juan '), 'garcia juan')
+        self.assertEqual(normalizar_texto('Muñoz'), 'munoz')
+        self.assertEqual(normalizar_texto(None), '')
+
+    def test_docente_index_resolves_without_queries(self):
+        from .utils import DocenteIndex
+
+        docente = Docente.objects.create(nombre='María', apellido='López')
+        index = DocenteIndex()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(index.get('MARIA LOPEZ'), docente.id_docente)
+            self.assertIsNone(index.get('Otro Docente'))
+
+    def test_texto_busqueda(self):
+        from .utils import texto_busqueda, tokenizar
+
+        self.assertEqual(tokenizar('MAT-101 Matemática'), ['mat', '101', 'matematica'])
+        self.assertEqual(texto_busqueda('García', 'J. García', None), ' garcia j ')
+        self.assertEqual(texto_busqueda('', None), '')
+
+    def test_search_texto_se_mantiene_al_guardar(self):
+        docente = Docente.objects.create(nombre='Juan', apellido='García', alias_search='Profe Juan')
+        comision = Comision.objects.create(codigo='MAT-101', nombre='Matemática I', docente=docente)
+        self.assertEqual(docente.search_texto, ' juan garcia profe ')
+        self.assertEqual(comision.search_texto, ' mat 101 matematica i juan garcia ')
+
+        # Cambiar el nombre del docente actualiza las comisiones
+        docente.nombre_completo = 'Juana García'
+        docente.save()
+        comision.refresh_from_db()
+        self.assertIn(' juana ', comision.search_texto)
+
+        comision.nombre = 'Física'
+        comision.save(update_fields=['nombre'])
+        comision.refresh_from_db()
+        self.assertIn(' fisica ', comision.search_texto)
+
 
 class ComisionModelTest(TestCase):
     """Tests del modelo Comision."""
@@ -228,6 +284,9 @@ class DocenteAPITest(APITestCase):
     """Tests del DocenteViewSet."""
     
     def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
         self.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
@@ -315,6 +374,21 @@ class DocenteAPITest(APITestCase):
         self.assertEqual(len(results), 1)
         self.assertIn('Profe Juan', results[0]['alias_search'])
     
+    def test_search_ignores_accents(self):
+        """?search=garcia encuentra "García" (columna normalizada)."""
+        response = self.client.get(f'{self.url_list}?search=GARCIA')
+
+        results = response.data['results']
+        self.assertEqual([r['apellido'] for r in results], ['García'])
+
+    def test_search_multiple_terms_are_and(self):
+        """Varios términos deben coincidir todos (prefijos de palabra)."""
+        response = self.client.get(f'{self.url_list}?search=lop mar')
+        self.assertEqual([r['nombre'] for r in response.data['results']], ['María'])
+
+        response = self.client.get(f'{self.url_list}?search=lop juan')
+        self.assertEqual(response.data['results'], [])
+
     def test_ordering_by_apellido_asc(self):
         """?ordering=apellido ordena ascendente."""
         response = self.client.get(f'{self.url_list}?ordering=apellido')
@@ -358,6 +432,9 @@ class ComisionAPITest(APITestCase):
     """Tests del ComisionViewSet."""
     
     def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
         self.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
@@ -419,11 +496,820 @@ class ComisionAPITest(APITestCase):
         results = response.data['results']
         self.assertEqual(len(results), 2)
 
+    def test_search_by_docente_without_join(self):
+        """La búsqueda por docente usa search_texto de la comisión (sin JOIN)."""
+        # update() no pasa por save(): la comisión conserva los tokens guardados
+        Docente.objects.filter(pk=self.docente.pk).update(apellido='Otro')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'{self.url_list}?search=docente 1c2025')
+
+        self.assertEqual([r['codigo'] for r in response.data['results']], ['MAT-101'])
+        # El JOIN de docente es el select_related de la respuesta, no del filtro
+        sql = next(q['sql'] for q in ctx.captured_queries if 'FROM "academic_comision"' in q['sql'])
+        filtro = sql.split(' WHERE ', 1)[1]
+        self.assertIn('search_texto', filtro)
+        self.assertNotIn('academic_docente', filtro)
+
+    def test_crear_manual_reuses_docente(self):
+        """crear-manual resuelve el docente por nombre normalizado."""
+        response = self.client.post(reverse('catedra-crear-manual'), {
+            'codigo': 'MAT-900',
+            'nombre': 'Matemática Avanzada',
+            'docente_completo': 'TEST DOCENTE',
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Docente.objects.count(), 1)
+        self.assertEqual(response.data['catedra']['docente']['id_docente'], self.docente.id_docente)
+
 
 # ============================================================================
 # TESTS DE IMPORTACIÓN
 # ============================================================================
 
+class ComisionFiltrosTest(APITestCase):
+    """Filtros estructurados de /api/catedras/ (academic.filters.ComisionFilter)."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        docente = Docente.objects.create(nombre='Juan', apellido='García')
+        self.cpo_general = Comision.objects.create(
+            codigo='0620', nombre='Derecho Romano', docente=docente, cuatrimestre='1C2025',
+            ciclo='CPO', sede='General', modalidad='Presencial', ano=2,
+        )
+        self.cpo_penal = Comision.objects.create(
+            codigo='0621', nombre='Derecho Penal', docente=docente, cuatrimestre='1C2025',
+            ciclo='CPO', sede='Penal', modalidad='Remota', ano=3, tipo_catedra='exigente',
+        )
+        self.cpc_inactiva = Comision.objects.create(
+            codigo='0100', nombre='Derecho Civil', docente=docente, cuatrimestre='1C2025',
+            ciclo='CPC', sede='General', activa=False, es_centro_externo=True,
+        )
+        Comision.objects.create(codigo='0700', nombre='Derecho Laboral', docente=docente, cuatrimestre='2C2025', ciclo='CPO')
+        self.url = reverse('catedra-list')
+
+    def ids(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return {c['id_comision'] for c in response.data['results']}
+
+    def test_filtros_exactos_y_combinados(self):
+        self.assertEqual(
+            self.ids({'cuatrimestre': '1C2025', 'ciclo': 'CPO', 'activa': 'true'}),
+            {self.cpo_general.pk, self.cpo_penal.pk},
+        )
+        self.assertEqual(self.ids({'es_centro_externo': 'true'}), {self.cpc_inactiva.pk})
+        self.assertEqual(self.ids({'tipo_catedra': 'exigente'}), {self.cpo_penal.pk})
+        self.assertEqual(self.ids({'ano': 2, 'search': 'romano'}), {self.cpo_general.pk})
+
+    def test_filtros_multiples(self):
+        self.assertEqual(
+            self.ids({'sede__in': 'General,Penal', 'cuatrimestre': '1C2025', 'activa': 'true'}),
+            {self.cpo_general.pk, self.cpo_penal.pk},
+        )
+        self.assertEqual(self.ids({'modalidad__in': 'Remota,Híbrida'}), {self.cpo_penal.pk})
+        self.assertEqual(self.ids({'ano__in': '2,3'}), {self.cpo_general.pk, self.cpo_penal.pk})
+
+    def test_valor_invalido(self):
+        response = self.client.get(self.url, {'ciclo': 'XYZ'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_usa_indice_compuesto(self):
+        """cuatrimestre + ciclo + activa se resuelve con el índice, sin recorrer la tabla."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN es de SQLite')
+        queryset = Comision.objects.filter(cuatrimestre='1C2025', ciclo='CPO', activa=True)
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(str(fila[-1]) for fila in cursor.fetchall())
+        self.assertIn('SEARCH academic_comision USING INDEX academic_co_cuatrim_7b26c7_idx', plan)
+
+
+class RespuestaVersionadaTest(APITestCase):
+    """Cache de list/retrieve por versión del dataset (academic.cache)."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        self.docente = Docente.objects.create(nombre='Juan', apellido='García')
+        self.comision = Comision.objects.create(codigo='0620', nombre='Derecho Romano', docente=self.docente)
+        self.url = reverse('catedra-list')
+
+    def test_acierto_no_usa_orm_ni_serializers(self):
+        primera = self.client.get(self.url, {'ciclo': '', 'ordering': 'codigo'})
+        with self.assertNumQueries(0):
+            segunda = self.client.get(self.url, {'ordering': 'codigo', 'ciclo': ''})
+        self.assertEqual(segunda.status_code, status.HTTP_200_OK)
+        self.assertEqual(segunda.data, primera.data)
+
+        detalle = reverse('docente-detail', args=[self.docente.pk])
+        self.client.get(detalle)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(detalle).data['comisiones'][0]['codigo'], '0620')
+        # Otros parámetros son otra entrada
+        self.assertEqual(self.client.get(self.url, {'ordering': '-codigo'}).status_code, status.HTTP_200_OK)
+
+    def test_clave_no_depende_del_proceso(self):
+        """La clave es versión + firma: invalidar los índices locales no la cambia."""
+        from .busqueda import invalidar
+
+        self.client.get(self.url)
+        invalidar()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_escrituras_suben_la_version(self):
+        from recommendations.models import Cache_Metadatos, Recomendacion
+        from scraping.models import Grupos, Post_Scrapeado
+
+        self.assertEqual(len(self.client.get(self.url).data['results']), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Comision.objects.create(codigo='0621', nombre='Derecho Penal', docente=self.docente)
+        self.assertEqual(len(self.client.get(self.url).data['results']), 2)
+
+        self.docente.apellido = 'Garay'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.docente.save()
+        nombres = [c['docente']['apellido'] for c in self.client.get(self.url).data['results']]
+        self.assertEqual(nombres, ['Garay', 'Garay'])
+
+        version = Cache_Metadatos.get_current_version()
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        post = Post_Scrapeado.objects.create(post_id='p1', grupo=grupo, texto='Muy buena')
+        with self.captureOnCommitCallbacks(execute=True):
+            recomendacion = Recomendacion.objects.create(comision=self.comision, post_origen=post, texto='Muy buena')
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            recomendacion.delete()
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 2)
+
+    def test_borrados_por_lote_suben_la_version(self):
+        """"Eliminar seleccionados" del admin, queryset.delete() y CASCADE desde scraping."""
+        from recommendations.models import Cache_Metadatos, Recomendacion
+        from scraping.models import Grupos, Post_Scrapeado
+
+        with self.captureOnCommitCallbacks(execute=True):
+            otra = Comision.objects.create(codigo='0621', nombre='Derecho Penal', docente=self.docente)
+        self.assertEqual(len(self.client.get(self.url).data['results']), 2)
+
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'admin123'))
+        version = Cache_Metadatos.get_current_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('admin:academic_comision_changelist'), {
+                'action': 'delete_selected', '_selected_action': [otra.pk], 'post': 'yes',
+            })
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 1)
+        self.assertEqual(len(self.client.get(self.url).data['results']), 1)
+
+        # Borrar un grupo borra sus posts y, por CASCADE, sus recomendaciones
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        post = Post_Scrapeado.objects.create(post_id='p1', grupo=grupo, texto='Muy buena')
+        Recomendacion.objects.create(comision=self.comision, post_origen=post, texto='Muy buena')
+        version = Cache_Metadatos.get_current_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Grupos.objects.filter(pk=grupo.pk).delete()
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 1)
+
+        # Un borrado que no toca el catálogo no cambia la versión
+        with self.captureOnCommitCallbacks(execute=True):
+            Grupos.objects.create(nombre='Vacío', url='https://facebook.com/groups/vacio').delete()
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 1)
+
+    def test_la_version_sube_recien_al_confirmar(self):
+        """Con la transacción abierta ni la base ni el cache publican otra versión."""
+        from django.db import transaction
+        from recommendations.models import Cache_Metadatos
+
+        version = Cache_Metadatos.get_cached_version()
+        with self.captureOnCommitCallbacks() as callbacks:
+            Comision.objects.create(codigo='0621', nombre='Derecho Penal', docente=self.docente)
+            Comision.objects.filter(pk=self.comision.pk).delete()
+            self.assertEqual(Cache_Metadatos.get_current_version(), version)
+            self.assertEqual(Cache_Metadatos.get_cached_version(), version)
+        self.assertEqual(len(callbacks), 2)
+
+        # Al confirmar
+        for callback in callbacks:
+            callback()
+        self.assertEqual(Cache_Metadatos.get_current_version(), version + 2)
+        self.assertEqual(Cache_Metadatos.get_cached_version(), version + 2)
+
+        # Una transacción revertida no publica nada
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Comision.objects.create(codigo='0622', nombre='Derecho Civil', docente=self.docente)
+                raise RuntimeError
+        self.assertEqual(callbacks, [])
+        self.assertEqual(Cache_Metadatos.get_cached_version(), version + 2)
+
+    def test_errores_no_se_cachean(self):
+        url = reverse('catedra-detail', args=[999])
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        Comision.objects.create(id_comision=999, codigo='0999', nombre='Nueva', docente=self.docente)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+
+class GetCondicionalTest(APITestCase):
+    """ETag / Last-Modified y 304 (academic.cache.RespuestaVersionadaMixin)."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        self.docente = Docente.objects.create(nombre='Juan', apellido='García')
+        self.comision = Comision.objects.create(codigo='0620', nombre='Derecho Romano', docente=self.docente)
+        self.url = reverse('catedra-list')
+        self.detalle = reverse('catedra-detail', args=[self.comision.pk])
+
+    def test_if_none_match_responde_304_sin_queries(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"') and not etag.startswith('W/'))
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_etag_depende_de_la_url_y_de_la_version(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertNotEqual(self.client.get(self.url, {'ordering': '-codigo'})['ETag'], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Comision.objects.create(codigo='0621', nombre='Derecho Penal', docente=self.docente)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detalle_inexistente_responde_404_y_no_304(self):
+        import time
+        from django.utils.http import http_date
+
+        futuro = http_date(time.time() + 3600)
+        for url in (reverse('catedra-detail', args=[999]), reverse('docente-detail', args=[999])):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='*').status_code, status.HTTP_404_NOT_FOUND)
+            self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=futuro).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_last_modified_del_detalle_es_el_del_objeto(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from django.utils.http import http_date
+
+        # Last-Modified tiene resolución de segundos: la comisión es de antes
+        Comision.objects.filter(pk=self.comision.pk).update(
+            modificado=timezone.now() - timedelta(hours=1)
+        )
+        response = self.client.get(self.detalle)
+        self.comision.refresh_from_db()
+        esperado = http_date(self.comision.modificado.timestamp())
+        self.assertEqual(response['Last-Modified'], esperado)
+
+        # Otra comisión cambia la versión pero no este objeto
+        with self.captureOnCommitCallbacks(execute=True):
+            Comision.objects.create(codigo='0621', nombre='Derecho Penal', docente=self.docente)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detalle, HTTP_IF_MODIFIED_SINCE=esperado)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # El detalle incluye al docente: editarlo cambia la fecha de la comisión
+        self.docente.apellido = 'Garay'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.docente.save()
+        response = self.client.get(self.detalle, HTTP_IF_MODIFIED_SINCE=esperado)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['docente']['apellido'], 'Garay')
+
+    def test_guardar_docente_sin_cambios_no_toca_las_comisiones(self):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        antes = timezone.now() - timedelta(hours=1)
+        Comision.objects.filter(pk=self.comision.pk).update(
+            ultima_actualizacion_scraping=antes, modificado=antes
+        )
+        docente = Docente.objects.get(pk=self.docente.pk)
+        # Ni lectura ni bulk_update de comisiones
+        with CaptureQueriesContext(connection) as queries:
+            docente.save()
+            docente.save(update_fields=['apellido'])
+        self.assertFalse([q for q in queries if 'academic_comision' in q['sql']])
+
+        self.comision.refresh_from_db()
+        self.assertEqual(self.comision.modificado, antes)
+        self.assertEqual(self.comision.ultima_actualizacion_scraping, antes)
+
+        # Un cambio real de nombre actualiza modificado, no la fecha de scraping
+        docente.nombre = 'Juana'
+        docente.save()
+        self.comision.refresh_from_db()
+        self.assertGreater(self.comision.modificado, antes)
+        self.assertEqual(self.comision.ultima_actualizacion_scraping, antes)
+
+
+class DocenteVersionTest(TransactionTestCase):
+    """Docente.save() publica la versión nueva después de actualizar sus comisiones."""
+
+    def test_version_nueva_con_modificado_al_dia(self):
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from . import signals
+
+        antes = timezone.now() - timedelta(hours=1)
+        docente = Docente.objects.create(nombre='Juan', apellido='García')
+        comision = Comision.objects.create(codigo='0620', nombre='Derecho Romano', docente=docente)
+        Comision.objects.filter(pk=comision.pk).update(modificado=antes)
+
+        # Sin transacción abierta (autocommit): lo que ve la base al publicar
+        vistos = []
+        publicar = signals.catalogo_modificado
+        def catalogo_modificado():
+            vistos.append(Comision.objects.values_list('modificado', flat=True).get(pk=comision.pk))
+            return publicar()
+
+        docente.apellido = 'Garay'
+        with mock.patch.object(signals, 'catalogo_modificado', catalogo_modificado):
+            docente.save()
+        self.assertEqual(len(vistos), 1)
+        self.assertGreater(vistos[0], antes)
+
+
+class CursorPaginacionCatedrasTest(APITestCase):
+    """Paginación por cursor de /api/catedras/ (config.pagination)."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        docente = Docente.objects.create(nombre='Juan', apellido='García')
+        # Códigos repetidos en distintos cuatrimestres: empates del primer campo
+        for n in range(12):
+            Comision.objects.create(codigo=f'{n % 5:04d}', nombre=f'Materia {n}', docente=docente, cuatrimestre=f'{n}C')
+        self.url = reverse('catedra-list')
+
+    def recorrer(self, params):
+        """pks de todas las páginas siguiendo `next`."""
+        pks, url = [], f"{self.url}?{params}"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            self.assertNotIn('count', response.data)
+            pks += [c['id_comision'] for c in response.data['results']]
+            url = response.data['next']
+        return pks
+
+    def test_recorre_todo_en_orden_estable(self):
+        esperado = list(Comision.objects.order_by('codigo', 'id_comision').values_list('pk', flat=True))
+        self.assertEqual(self.recorrer('page_size=5'), esperado)
+
+        # Con ?ordering= de un campo con empates se desempata por id_comision
+        pks = self.recorrer('page_size=2&ordering=-activa')
+        self.assertEqual(pks, sorted(esperado, reverse=True))
+
+    def test_page_size_tiene_tope(self):
+        docente = Docente.objects.get()
+        Comision.objects.bulk_create([
+            Comision(codigo=f'9{n:03d}', nombre='Relleno', docente=docente) for n in range(100)
+        ])
+        response = self.client.get(self.url, {'page_size': 1000})
+        self.assertEqual(len(response.data['results']), 100)
+        self.assertIsNotNone(response.data['next'])
+        response = self.client.get(self.url, {'page_size': 3})
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_pagina_profunda_filtra_por_posicion(self):
+        """La página siguiente es WHERE codigo > ... LIMIT, sin COUNT ni OFFSET."""
+        Comision.objects.exclude(codigo='0000').update(codigo='9999')
+        docente = Docente.objects.get()
+        Comision.objects.bulk_create([
+            Comision(codigo=f'5{n:03d}', nombre='Relleno', docente=docente) for n in range(10)
+        ])
+        siguiente = self.client.get(self.url, {'page_size': 4}).data['next']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(siguiente)
+        self.assertEqual([c['codigo'] for c in response.data['results']], ['5001', '5002', '5003', '5004'])
+        sql = ' '.join(q['sql'] for q in queries.captured_queries if 'academic_comision' in q['sql'])
+        self.assertIn('"codigo" >', sql)
+        self.assertNotIn('COUNT(', sql.upper())
+        self.assertNotIn('OFFSET', sql.upper())
+
+    def test_busqueda_rankeada_en_una_pagina(self):
+        response = self.client.get(self.url, {'q': 'materia', 'umbral': 0.1, 'limite': 8, 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 8)
+        self.assertIsNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+
+class CamposDinamicosTest(APITestCase):
+    """?fields= / ?expand= en docentes y comisiones (config.campos)."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        # Datos confirmados: la versión nueva queda publicada en el cache
+        with self.captureOnCommitCallbacks(execute=True):
+            self.docente = Docente.objects.create(nombre='Juan', apellido='García', alias_search='Profe Juan')
+            for codigo in ('0620', '0621', '0622'):
+                Comision.objects.create(codigo=codigo, nombre='Derecho Romano', docente=self.docente, horario='Lunes 10')
+        self.url = reverse('catedra-list')
+        self.detalle_docente = reverse('docente-detail', args=[self.docente.pk])
+
+    def get(self, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.data, [q['sql'] for q in queries.captured_queries]
+
+    def test_fields_acota_json_y_columnas(self):
+        data, queries = self.get(self.url, {'fields': 'id_comision,codigo,docente.apellido', 'page_size': 2})
+        self.assertEqual(data['results'][0], {
+            'id_comision': data['results'][0]['id_comision'], 'codigo': '0620', 'docente': {'apellido': 'García'},
+        })
+        [sql] = queries
+        self.assertIn('"academic_docente"."apellido"', sql)
+        for columna in ('alias_search', 'horario', 'recomendacion_raw', 'search_texto'):
+            self.assertNotIn(columna, sql)
+
+        # El cursor sigue funcionando sin codigo en ?fields= (se carga igual)
+        data, queries = self.get(self.url, {'fields': 'nombre', 'page_size': 2})
+        self.assertEqual(data['results'], [{'nombre': 'Derecho Romano'}] * 2)
+        self.assertEqual(len(queries), 1)
+        siguiente, queries = self.get(data['next'], {})
+        self.assertEqual(len(siguiente['results']), 1)
+        self.assertEqual(len(queries), 1)
+
+    def test_expand_vacio_devuelve_ids_sin_join(self):
+        data, [sql] = self.get(self.url, {'expand': ''})
+        self.assertEqual(data['results'][0]['docente'], self.docente.pk)
+        self.assertNotIn('JOIN', sql)
+
+        data, queries = self.get(self.detalle_docente, {'fields': 'nombre_completo,comisiones', 'expand': ''})
+        self.assertEqual(data, {'nombre_completo': 'Juan García', 'comisiones': sorted(
+            Comision.objects.values_list('pk', flat=True)
+        )})
+        self.assertNotIn('horario', queries[-1])
+
+    def test_detalle_con_comisiones_acotadas(self):
+        data, queries = self.get(self.detalle_docente, {'fields': 'apellido,comisiones.codigo'})
+        self.assertEqual(data, {'apellido': 'García', 'comisiones': [
+            {'codigo': '0620'}, {'codigo': '0621'}, {'codigo': '0622'},
+        ]})
+        self.assertEqual(len(queries), 2)  # docente + comisiones (prefetch)
+        self.assertNotIn('alias_search', queries[0])
+        self.assertNotIn('horario', queries[1])
+
+    def test_parametros_invalidos(self):
+        for params in ({'fields': 'codigo,inexistente'}, {'expand': 'codigo'}, {'fields': 'docente..nombre'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_escrituras_ignoran_los_parametros(self):
+        user = User.objects.create_user(username='admin', password='x', is_staff=True)
+        self.client.force_authenticate(user)
+        response = self.client.patch(
+            f"{reverse('catedra-detail', args=[Comision.objects.first().pk])}?fields=codigo",
+            {'nombre': 'Derecho Romano II'}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['nombre'], 'Derecho Romano II')
+        self.assertIn('horario', response.data)
+
+
+class ExportacionTest(APITestCase):
+    """Exportación en streaming de comisiones y recomendaciones (config.exportar)."""
+
+    def setUp(self):
+        from recommendations.models import Recomendacion
+        from scraping.models import Grupos, Post_Scrapeado
+
+        self.client = APIClient()
+        self.docente = Docente.objects.create(nombre='Juan', apellido='García')
+        for n in range(5):
+            Comision.objects.create(
+                codigo=f'06{n:02d}', nombre='Derecho Romano', docente=self.docente,
+                cuatrimestre='1C2025' if n % 2 else '2C2025', ciclo='CPO',
+            )
+        Comision.objects.create(codigo='0700', nombre='Derecho Laboral', cuatrimestre='1C2025')
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        post = Post_Scrapeado.objects.create(post_id='p1', grupo=grupo, texto='Muy buena')
+        for comision in Comision.objects.filter(codigo__in=['0600', '0700']):
+            Recomendacion.objects.create(
+                comision=comision, post_origen=post, texto=f'Sobre {comision.codigo}',
+                sentimiento='positivo' if comision.codigo == '0600' else 'negativo',
+                docent_perf={'claridad': 4},
+            )
+        self.url = reverse('catedra-exportar')
+
+    def leer(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson_con_docente_y_filtros_del_listado(self):
+        import json
+
+        response = self.client.get(self.url, {'cuatrimestre': '1C2025'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertIn('comisiones.ndjson', response['Content-Disposition'])
+        filas = [json.loads(linea) for linea in self.leer(response).splitlines()]
+        self.assertEqual([f['codigo'] for f in filas], ['0601', '0603', '0700'])
+        self.assertEqual(filas[0]['docente__apellido'], 'García')
+        self.assertIsNone(filas[2]['docente__nombre_completo'])
+
+        # ?search= y ?ordering= como en /api/catedras/
+        texto = self.leer(self.client.get(self.url, {'search': 'laboral'}))
+        self.assertEqual([json.loads(l)['codigo'] for l in texto.splitlines()], ['0700'])
+        texto = self.leer(self.client.get(self.url, {'ordering': '-codigo', 'fields': 'codigo'}))
+        self.assertEqual(texto.splitlines()[0], '{"codigo": "0700"}')
+
+    def test_csv_con_columnas_pedidas(self):
+        import csv
+
+        response = self.client.get(self.url, {'format': 'csv', 'fields': 'codigo,docente__apellido,activa'})
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        filas = list(csv.reader(self.leer(response).splitlines()))
+        self.assertEqual(filas[0], ['codigo', 'docente__apellido', 'activa'])
+        self.assertEqual(filas[1], ['0600', 'García', 'true'])
+        self.assertEqual(filas[-1], ['0700', '', 'true'])
+        self.assertEqual(len(filas), 7)
+
+        response = self.client.get(self.url, {'format': 'csv', 'fields': 'codigo,search_texto'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(b'fields', response.content)
+
+    def test_memoria_acotada_por_lotes(self):
+        """Una sola consulta con values(): sin modelos ni serializers por fila, en bloques de chunk_size."""
+        from unittest import mock
+        from .views import ComisionViewSet
+
+        with mock.patch.object(ComisionViewSet, 'chunk_size', 2), CaptureQueriesContext(connection) as queries:
+            bloques = list(self.client.get(self.url).streaming_content)
+        self.assertEqual(len(bloques), 3)  # 2 + 2 + 2 filas
+        self.assertEqual(sum(b.count(b'\n') for b in bloques), 6)
+        consultas = [q['sql'] for q in queries.captured_queries if 'academic_comision' in q['sql']]
+        self.assertEqual(len(consultas), 1)
+        self.assertIn('LEFT OUTER JOIN "academic_docente"', consultas[0])
+
+    def test_recomendaciones(self):
+        import csv
+
+        url = reverse('recomendacion-exportar')
+        texto = self.leer(self.client.get(url, {'format': 'csv', 'comision__codigo': '0600'}))
+        [encabezado, fila] = list(csv.reader(texto.splitlines()))
+        datos = dict(zip(encabezado, fila))
+        self.assertEqual(datos['comision__codigo'], '0600')
+        self.assertEqual(datos['sentimiento'], 'positivo')
+        self.assertEqual(datos['docent_perf'], '{"claridad": 4}')
+
+        texto = self.leer(self.client.get(url, {'sentimiento__in': 'positivo,negativo', 'fields': 'texto'}))
+        self.assertEqual(texto.splitlines(), ['{"texto": "Sobre 0600"}', '{"texto": "Sobre 0700"}'])
+
+
+class BusquedaTrigramasTest(APITestCase):
+    """Búsqueda por similitud (?q=) sobre docentes y comisiones."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        self.garcia = Docente.objects.create(nombre='Juan', apellido='García')
+        self.lopez = Docente.objects.create(nombre='María', apellido='López')
+        self.fernandez = Docente.objects.create(nombre='Pedro', apellido='Fernández')
+        self.civil = Comision.objects.create(codigo='CIVIL-1', nombre='Derecho Civil', docente=self.lopez)
+        self.penal = Comision.objects.create(codigo='PENAL-1', nombre='Derecho Penal', docente=self.garcia)
+        self.url_docentes = reverse('docente-list')
+        self.url_comisiones = reverse('catedra-list')
+
+    def test_similitud_como_pg_trgm(self):
+        """Mismos valores que strict_word_similarity de pg_trgm."""
+        from .busqueda import similitud
+
+        self.assertAlmostEqual(similitud(['word'], ['two', 'words']), 4 / 7)
+        self.assertAlmostEqual(similitud(['garsia'], ['garcia']), 0.4)
+        self.assertEqual(similitud(['zzz'], ['garcia']), 0.0)
+
+    def test_q_tolera_errores_de_tipeo(self):
+        response = self.client.get(f'{self.url_docentes}?q=fernandes')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r['apellido'] for r in response.data['results']], ['Fernández'])
+
+    def test_q_ordena_por_similitud(self):
+        Docente.objects.create(nombre='Ana', apellido='Garcilaso')
+        response = self.client.get(f'{self.url_docentes}?q=garcia&umbral=0.2')
+
+        apellidos = [r['apellido'] for r in response.data['results']]
+        self.assertEqual(apellidos[:2], ['García', 'Garcilaso'])
+
+    def test_umbral_y_limite(self):
+        response = self.client.get(f'{self.url_docentes}?q=garsia&umbral=0.9')
+        self.assertEqual(response.data['count'], 0)
+
+        Docente.objects.create(nombre='Ana', apellido='Garcilaso')
+        response = self.client.get(f'{self.url_docentes}?q=garcia&umbral=0.2&limite=1')
+        self.assertEqual([r['apellido'] for r in response.data['results']], ['García'])
+
+    def test_parametros_invalidos(self):
+        for query in ('umbral=0', 'umbral=abc', 'limite=0', 'limite=x'):
+            response = self.client.get(f'{self.url_docentes}?q=garcia&{query}')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_q_en_comisiones_combina_docente_y_materia(self):
+        response = self.client.get(f'{self.url_comisiones}?q=civl lopes')
+
+        self.assertEqual([r['codigo'] for r in response.data['results']], ['CIVIL-1'])
+
+    def test_q_respeta_otros_filtros(self):
+        response = self.client.get(f'{self.url_comisiones}?search=penal&q=derecho')
+
+        self.assertEqual([r['codigo'] for r in response.data['results']], ['PENAL-1'])
+
+    def test_indice_se_reconstruye_al_cambiar_la_tabla(self):
+        from .busqueda import indice_para
+
+        indice = indice_para(Docente.objects.all())
+        self.assertIs(indice_para(Docente.objects.all()), indice)
+
+        Docente.objects.create(nombre='Rosa', apellido='Quiroga')
+        response = self.client.get(f'{self.url_docentes}?q=kiroga')
+        self.assertEqual([r['apellido'] for r in response.data['results']], ['Quiroga'])
+        self.assertIsNot(indice_para(Docente.objects.all()), indice)
+
+        # Una edición que no cambia la firma se ve por el signal post_save
+        self.lopez.apellido = 'Lopes'
+        self.lopez.save()
+        response = self.client.get(f'{self.url_docentes}?q=lopes&umbral=0.9')
+        self.assertEqual([r['apellido'] for r in response.data['results']], ['Lopes'])
+
+
+class SugerenciasTest(APITestCase):
+    """Typeahead /api/sugerencias/ desde el índice de prefijos en memoria."""
+
+    def setUp(self):
+        self.client = APIClient()
+        # Datos confirmados: invalida el índice en memoria del test anterior
+        with self.captureOnCommitCallbacks(execute=True):
+            self.garcia = Docente.objects.create(nombre='Juan', apellido='García', alias_search='Profe Juan')
+            self.garay = Docente.objects.create(nombre='Ana', apellido='Garay')
+            for codigo, cuatrimestre in (('205-0620', '1C2025'), ('205-0620', '2C2025'), ('205-0016', '1C2025')):
+                Comision.objects.create(
+                    codigo=codigo, codigo_actividad='205', nombre='Derecho Romano',
+                    docente=self.garcia, cuatrimestre=cuatrimestre,
+                )
+            Comision.objects.create(codigo='2X8-0100', codigo_actividad='2X8', nombre='Derecho de Daños', docente=self.garay)
+        self.url = reverse('sugerencia-list')
+
+    def test_indice_prefijos_top_k(self):
+        from .busqueda.sugerencias import IndicePrefijos, Sugerencia, claves
+
+        self.assertEqual(claves('García Juan'), ['garcia juan', 'juan'])
+        indice = IndicePrefijos([
+            (Sugerencia('docente', i, nombre, popularidad=p), claves(nombre))
+            for i, (nombre, p) in enumerate([('Garay Ana', 1), ('García Juan', 3), ('Gómez Luis', 5)])
+        ])
+        self.assertEqual([s.texto for s in indice.buscar('ga', k=5)], ['García Juan', 'Garay Ana'])
+        self.assertEqual([s.texto for s in indice.buscar('garc')], ['García Juan'])
+        self.assertEqual([s.texto for s in indice.buscar('g', k=1)], ['Gómez Luis'])
+        self.assertEqual(indice.buscar('zz'), [])
+
+    def test_sugiere_docentes_materias_y_comisiones(self):
+        response = self.client.get(f'{self.url}?q=gar')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(r['tipo'], r['texto']) for r in response.data['resultados']],
+            [('docente', 'Juan García'), ('docente', 'Ana Garay')],
+        )
+
+        response = self.client.get(f'{self.url}?q=derecho r&tipo=materia')
+        self.assertEqual([r['texto'] for r in response.data['resultados']], ['Derecho Romano'])
+
+        response = self.client.get(f'{self.url}?q=0620&tipo=comision')
+        resultado = response.data['resultados'][0]
+        self.assertEqual((resultado['texto'], resultado['popularidad']), ('205-0620', 2))
+
+    def test_no_consulta_la_base_en_el_camino_caliente(self):
+        self.client.get(f'{self.url}?q=gar')
+        with self.assertNumQueries(0):
+            response = self.client.get(f'{self.url}?q=juan&k=3')
+        self.assertEqual(response.data['resultados'][0]['texto'], 'Juan García')
+
+    def test_se_reconstruye_cuando_cambia_la_version(self):
+        from recommendations.models import Cache_Metadatos
+
+        version = self.client.get(f'{self.url}?q=gar').data['version']
+        with self.captureOnCommitCallbacks(execute=True):
+            Docente.objects.create(nombre='Luis', apellido='Garmendia')
+
+        response = self.client.get(f'{self.url}?q=garm')
+        self.assertGreater(response.data['version'], version)
+        self.assertEqual(response.data['version'], Cache_Metadatos.get_current_version())
+        self.assertEqual([r['texto'] for r in response.data['resultados']], ['Luis Garmendia'])
+
+    def test_parametros_invalidos(self):
+        self.assertEqual(self.client.get(f'{self.url}?q=a&tipo=post').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(f'{self.url}?q=a&k=x').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(f'{self.url}?q=a&k=0').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(f'{self.url}?q=a&k=-3').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_k_se_acota_a_k_max(self):
+        from unittest import mock
+        from .busqueda import sugerencias
+
+        with mock.patch.object(sugerencias.IndiceSugerencias, 'buscar', autospec=True, return_value=[]) as buscar:
+            response = self.client.get(f'{self.url}?q=der&k=1000')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(buscar.call_args.args[-1], sugerencias.K_MAX)
+
+
+class BusquedaUnificadaTest(APITestCase):
+    """/api/search/: comisiones, docentes y recomendaciones en un pedido."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from recommendations.models import Recomendacion
+        from scraping.models import Grupos, Post_Scrapeado
+
+        cache.clear()
+        self.client = APIClient()
+        self.garcia = Docente.objects.create(nombre='Juan', apellido='García')
+        self.romano = Comision.objects.create(
+            codigo='0620', codigo_actividad='205', nombre='Derecho Romano', docente=self.garcia,
+        )
+        Comision.objects.create(codigo='0100', nombre='Derecho de Daños')
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        post = Post_Scrapeado.objects.create(post_id='p1', grupo=grupo, texto='Recomiendo a García')
+        self.recomendacion = Recomendacion.objects.create(
+            comision=self.romano, post_origen=post, texto='García explica muy bien Romano, parciales orales.'
+        )
+        self.url = reverse('search-list')
+
+    def test_mezcla_tipos_por_relevancia(self):
+        response = self.client.get(self.url, {'q': 'García'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['q'], 'garcia')
+        tipos = [(r['tipo'], r['id']) for r in response.data['resultados']]
+        # La comisión también contiene el nombre de su docente: empatan
+        self.assertEqual(set(tipos[:2]), {('docente', self.garcia.pk), ('comision', self.romano.pk)})
+        self.assertEqual(response.data['resultados'][0]['relevancia'], 1.0)
+        self.assertIn(('recomendacion', self.recomendacion.pk), tipos)
+        relevancias = [r['relevancia'] for r in response.data['resultados']]
+        self.assertEqual(relevancias, sorted(relevancias, reverse=True))
+        self.assertTrue(all(0 < r <= 1 for r in relevancias))
+
+    def test_prefijos_errores_de_tipeo_y_limites_por_tipo(self):
+        response = self.client.get(self.url, {'q': 'rom', 'tipo': 'comision'})
+        self.assertEqual([r['id'] for r in response.data['resultados']], [self.romano.pk])
+
+        response = self.client.get(self.url, {'q': 'garsia', 'tipo': 'docente'})
+        self.assertEqual([r['id'] for r in response.data['resultados']], [self.garcia.pk])
+
+        response = self.client.get(self.url, {'q': 'derecho', 'limite': 1, 'limite_comision': 2})
+        self.assertEqual(
+            sorted(r['tipo'] for r in response.data['resultados']), ['comision', 'comision']
+        )
+
+    def test_cache_por_consulta_y_version(self):
+        self.client.get(self.url, {'q': 'Romano'})
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'q': '  ROMANO '})
+        self.assertEqual(response.data['q'], 'romano')
+
+        Comision.objects.create(codigo='0621', nombre='Romano II')
+        response = self.client.get(self.url, {'q': 'romano', 'tipo': 'comision'})
+        self.assertEqual(len(response.data['resultados']), 2)
+
+    def test_parametros_invalidos(self):
+        self.assertEqual(self.client.get(self.url, {'q': 'a', 'tipo': 'post'}).status_code, status.HTTP_400_BAD_REQUEST)
+        # El error nombra el parámetro que mandó el cliente
+        for params, parametro in (
+            ({'limite': 'x'}, 'limite'),
+            ({'limite': 0, 'limite_docente': 3}, 'limite'),
+            ({'limite_docente': -1}, 'limite_docente'),
+            ({'limite': 5, 'limite_comision': 'abc'}, 'limite_comision'),
+        ):
+            response = self.client.get(self.url, {'q': 'a', **params})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['detail'], f'{parametro} debe ser un entero mayor que 0.')
+        self.assertEqual(self.client.get(self.url, {'q': '¿?'}).data['resultados'], [])
+
+
 class ImportComisionesCommandTest(TransactionTestCase):
     """Tests del comando de importación."""
     
@@ -508,6 +1394,889 @@ PRIMER CUATRIMESTRE 2025,TEST,TEST-1,Presencial,NUEVO DOCENTE,Mie 14:00"""
             Path(csv_path).unlink()
 
 
+    def test_import_queries_do_not_grow_with_rows(self):
+        """La escritura en lote usa una cantidad de queries independiente de las filas."""
+        def run(n):
+            lines = ['Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario']
+            for i in range(n):
+                lines.append(
+                    f'PRIMER CUATRIMESTRE 2025,205 (PRI) - MATERIA {i},{i:04d},Presencial,DOCENTE{i} NOMBRE,Lun 07:00'
+                )
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+                f.write('\n'.join(lines))
+                csv_path = f.name
+            try:
+                with CaptureQueriesContext(connection) as ctx:
+                    call_command('import_comisiones', csv_path, stdout=StringIO())
+            finally:
+                Path(csv_path).unlink()
+            Comision.objects.all().delete()
+            Docente.objects.all().delete()
+            return len(ctx.captured_queries)
+
+        # La primera escritura crea la fila de Cache_Metadatos (una sola vez)
+        run(1)
+        self.assertEqual(run(5), run(30))
+
+    def test_import_update_existing_keeps_longest_horario(self):
+        """Con update_existing se consolida por código+docente+cuatrimestre+sede."""
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00 - Jue 07:00"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = f.name
+
+        try:
+            out = StringIO()
+            call_command('import_comisiones', csv_path, update_existing=True, stdout=out)
+
+            self.assertEqual(Docente.objects.count(), 1)
+            self.assertEqual(Comision.objects.count(), 1)
+            self.assertEqual(Comision.objects.get().horario, 'Lun 07:00 - Jue 07:00')
+            self.assertIn('Creadas: 1', out.getvalue())
+            self.assertIn('Actualizadas: 1', out.getvalue())
+        finally:
+            Path(csv_path).unlink()
+
+    def test_import_reuses_docente_ignoring_accents(self):
+        """Un docente existente se reutiliza aunque el archivo no tenga acentos."""
+        garcia = Docente.objects.create(nombre='Juan', apellido='García', nombre_completo='García Juan')
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = f.name
+
+        try:
+            call_command('import_comisiones', csv_path, stdout=StringIO())
+            self.assertEqual(Docente.objects.count(), 1)
+            self.assertEqual(Comision.objects.get().docente, garcia)
+        finally:
+            Path(csv_path).unlink()
+
+    def test_import_fills_search_texto(self):
+        """bulk_create no llama a save(): la importación calcula search_texto."""
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCÍA JUAN,Lun 07:00"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = f.name
+
+        try:
+            call_command('import_comisiones', csv_path, stdout=StringIO())
+            docente = Docente.objects.get()
+            comision = Comision.objects.get()
+            self.assertEqual(docente.search_texto, docente.calcular_search_texto())
+            self.assertEqual(comision.search_texto, comision.calcular_search_texto())
+            self.assertIn(' garcia ', comision.search_texto)
+        finally:
+            Path(csv_path).unlink()
+
+    def test_import_csv_semicolon_latin1_with_preamble(self):
+        """Detecta encoding, header y delimitador ';' leyendo el archivo en streaming."""
+        csv_content = """FACULTAD DE DERECHO;;;;;
+;;;;;
+Período lectivo;Actividad;Comisión;Modalidad;Docente;Horario
+PRIMER CUATRIMESTRE 2025;205 (PRI) - DERECHO ROMANO;0620;Presencial;GARCÍA JUAN;Lun 07:00, Jue 07:00"""
+
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write(csv_content.encode('iso-8859-1'))
+            csv_path = f.name
+
+        try:
+            from .management.commands.import_comisiones import Command
+
+            rows = Command(stdout=StringIO()).read_csv(Path(csv_path))
+            self.assertNotIsInstance(rows, list)
+            rows = list(rows)
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]['Docente'], 'GARCÍA JUAN')
+            self.assertEqual(rows[0]['Horario'], 'Lun 07:00, Jue 07:00')
+        finally:
+            Path(csv_path).unlink()
+
+    def test_import_csv_decodifica_estricto_despues_de_la_muestra(self):
+        """Un acento latin-1 fuera de la muestra no queda como U+FFFD: la línea se relee."""
+        csv_content = (
+            "Periodo lectivo,Actividad,Comision,Modalidad,Docente,Horario\n"
+            "PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,PEREZ ANA,Lun 07:00\n"
+            "PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0621,Presencial,GARCÍA JUAN,Jue 07:00\n"
+        )
+
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            # La muestra (header) es ASCII válido en UTF-8; el acento va después
+            f.write(csv_content.encode('iso-8859-1'))
+            csv_path = f.name
+
+        try:
+            from .management.commands.import_comisiones import Command
+
+            command = Command(stdout=StringIO())
+            command.CSV_SAMPLE_SIZE = command.CSV_CHUNK_SIZE = 16
+            rows = list(command.read_csv(Path(csv_path)))
+            self.assertEqual([row['Docente'] for row in rows], ['PEREZ ANA', 'GARCÍA JUAN'])
+            self.assertEqual(command.events.contadores['warning'], 1)
+            self.assertEqual(command.events.log[0]['linea'], 3)
+        finally:
+            Path(csv_path).unlink()
+
+    def test_import_xlsx_with_preamble(self):
+        """Importa .xlsx en modo read-only detectando el header como en CSV."""
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['FACULTAD DE DERECHO'])
+        ws.append([])
+        ws.append(['Período lectivo', 'Actividad', 'Comisión', 'Modalidad', 'Docente', 'Horario'])
+        ws.append(['PRIMER CUATRIMESTRE 2025', '205 (PRI) - DERECHO ROMANO', 620, 'Presencial', 'GARCÍA JUAN', 'Lun 07:00'])
+        ws.append([None, None, None, None, None, None])
+
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            xlsx_path = f.name
+        wb.save(xlsx_path)
+
+        try:
+            call_command('import_comisiones', xlsx_path, stdout=StringIO())
+
+            comision = Comision.objects.get()
+            self.assertEqual(comision.codigo, '620')
+            self.assertEqual(comision.cuatrimestre, '1C2025')
+            self.assertEqual(comision.docente.nombre_completo, 'García Juan')
+        finally:
+            Path(xlsx_path).unlink()
+
+    def test_cleanup_only_touches_imported_keys(self):
+        """La consolidación posterior sólo revisa los grupos que tocó la importación."""
+        garcia = Docente.objects.create(nombre='Juan', apellido='Garcia', nombre_completo='Garcia Juan')
+        otro = Docente.objects.create(nombre='Ana', apellido='Paz', nombre_completo='Paz Ana')
+        Comision.objects.create(codigo='0620', nombre='Romano', docente=garcia, cuatrimestre='1C2025', horario='Lun')
+        largo = Comision.objects.create(
+            codigo='0620', nombre='Romano', docente=garcia, cuatrimestre='1C2025', horario='Lun - Jue'
+        )
+        Comision.objects.create(codigo='0999', nombre='Otra', docente=otro, cuatrimestre='1C2025', horario='Mar')
+        Comision.objects.create(codigo='0999', nombre='Otra', docente=otro, cuatrimestre='1C2025', horario='Mar - Vie')
+
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = f.name
+
+        try:
+            call_command('import_comisiones', csv_path, stdout=StringIO())
+
+            self.assertEqual(list(Comision.objects.filter(codigo='0620')), [largo])
+            self.assertEqual(Comision.objects.filter(codigo='0999').count(), 2)
+        finally:
+            Path(csv_path).unlink()
+
+    def _write_csv(self, content):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+        self.addCleanup(Path(f.name).unlink)
+        return f.name
+
+    def test_diff_reimport_unchanged_file_does_not_write(self):
+        """Re-importar el mismo archivo en modo diff no escribe comisiones."""
+        csv_path = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Presencial,LOPEZ MARIA,Mie 10:00""")
+        call_command('import_comisiones', csv_path, ciclo='CPO', stdout=StringIO())
+        antes = dict(Comision.objects.values_list('id_comision', 'ultima_actualizacion_scraping'))
+
+        cmd = import_comisiones.Command()
+        cmd.stdout = StringIO()
+        with CaptureQueriesContext(connection) as ctx:
+            cmd.handle(file_path=csv_path, dry_run=False, update_existing=False, ciclo='CPO', diff=True)
+
+        escrituras = [q['sql'] for q in ctx.captured_queries
+                      if q['sql'].lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))]
+        self.assertEqual(escrituras, [])
+        self.assertEqual(cmd.last_run_result['stats']['comisiones_sin_cambios'], 2)
+        self.assertEqual(cmd.last_run_result['diff'], {'agregadas': [], 'modificadas': [], 'desactivadas': []})
+        self.assertEqual(dict(Comision.objects.values_list('id_comision', 'ultima_actualizacion_scraping')), antes)
+
+    def test_diff_reports_added_changed_and_deactivates_missing(self):
+        """El modo diff escribe sólo lo que cambió y desactiva lo que desapareció."""
+        inicial = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Presencial,LOPEZ MARIA,Mie 10:00""")
+        call_command('import_comisiones', inicial, ciclo='CPO', stdout=StringIO())
+        otro_ciclo = Comision.objects.create(
+            codigo='0100', nombre='Otro ciclo', cuatrimestre='1C2025', ciclo='CPC', horario='Vie'
+        )
+
+        nuevo = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Remota,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,73U (PRI) - DERECHO PENAL,0700,Presencial,PAZ ANA,Jue 19:00""")
+        cmd = import_comisiones.Command()
+        cmd.stdout = StringIO()
+        cmd.handle(file_path=nuevo, dry_run=False, update_existing=False, ciclo='CPO',
+                   diff=True, deactivate_missing=True)
+
+        report = cmd.last_run_result['diff']
+        self.assertEqual([c['codigo'] for c in report['agregadas']], ['0700'])
+        self.assertEqual(report['modificadas'], [{
+            'codigo': '0620', 'docente': 'GARCIA JUAN', 'cuatrimestre': '1C2025', 'sede': '', 'campos': ['modalidad'],
+        }])
+        self.assertEqual([c['codigo'] for c in report['desactivadas']], ['0016'])
+        self.assertEqual(Comision.objects.get(codigo='0620').modalidad, 'Remota')
+        self.assertFalse(Comision.objects.get(codigo='0016').activa)
+        otro_ciclo.refresh_from_db()
+        self.assertTrue(otro_ciclo.activa)
+
+        # Si la comisión vuelve a aparecer se reactiva
+        cmd.handle(file_path=inicial, dry_run=False, update_existing=False, ciclo='CPO', diff=True)
+        self.assertTrue(Comision.objects.get(codigo='0016').activa)
+        self.assertEqual(cmd.last_run_result['diff']['modificadas'][-1]['campos'], ['activa'])
+
+    def test_dry_run_plans_in_memory_without_writing(self):
+        """--dry-run calcula el plan sin escribir y coincide con la importación real."""
+        inicial = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Presencial,LOPEZ MARIA,Mie 10:00""")
+        call_command('import_comisiones', inicial, ciclo='CPO', stdout=StringIO())
+        romano = Comision.objects.get(codigo='0620')
+        Comision.objects.create(
+            codigo='0620', docente=romano.docente, cuatrimestre='1C2025', sede='', horario='Lun', nombre='Romano'
+        )
+
+        nuevo = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Remota,GARCIA JUAN,Lun 07:00 - Jue 07:00
+PRIMER CUATRIMESTRE 2025,73U (PRI) - DERECHO PENAL,0700,Presencial,PAZ ANA,Jue 19:00""")
+        cmd = import_comisiones.Command()
+        cmd.stdout = StringIO()
+        with CaptureQueriesContext(connection) as ctx:
+            cmd.handle(file_path=nuevo, dry_run=True, update_existing=True, ciclo='CPO')
+
+        sentencias = [q['sql'].lstrip().upper() for q in ctx.captured_queries]
+        self.assertFalse([q for q in sentencias if q.startswith(('INSERT', 'UPDATE', 'DELETE', 'SAVEPOINT'))])
+        plan = cmd.last_run_result['plan']
+        self.assertEqual(plan['docentes']['crear'], ['Paz Ana'])
+        self.assertEqual([c['codigo'] for c in plan['comisiones']['crear']], ['0700'])
+        self.assertEqual(plan['comisiones']['actualizar'], [{
+            'codigo': '0620', 'docente': 'GARCIA JUAN', 'cuatrimestre': '1C2025', 'sede': '',
+            'campos': ['modalidad', 'horario'],
+        }])
+        self.assertEqual(list(Comision.objects.filter(codigo='0620').order_by('id_comision').values_list('horario', flat=True)),
+                         ['Lun 07:00', 'Lun'])
+        self.assertEqual(plan['totales']['eliminar'], 1)
+        self.assertEqual(Comision.objects.count(), 3)
+
+        cmd.handle(file_path=nuevo, dry_run=False, update_existing=True, ciclo='CPO')
+        self.assertEqual(cmd.last_run_result['plan'], plan)
+        self.assertEqual(Comision.objects.count(), 3 + 1 - 1)
+
+    def test_deactivate_missing_requires_diff(self):
+        csv_path = self._write_csv("Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario\n")
+        with self.assertRaises(CommandError):
+            call_command('import_comisiones', csv_path, deactivate_missing=True, stdout=StringIO())
+
+    def test_deactivate_missing_requires_ciclo(self):
+        """Sin ciclo, --deactivate-missing desactivaría todo el cuatrimestre: se rechaza."""
+        inicial = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00""")
+        call_command('import_comisiones', inicial, ciclo='CPC', stdout=StringIO())
+
+        nuevo = self._write_csv("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,73U (PRI) - DERECHO PENAL,0700,Presencial,PAZ ANA,Jue 19:00""")
+        with self.assertRaisesMessage(CommandError, '--ciclo'):
+            call_command('import_comisiones', nuevo, diff=True, deactivate_missing=True, stdout=StringIO())
+        self.assertTrue(Comision.objects.get(codigo='0620').activa)
+
+    def test_comision_save_keeps_hash_contenido(self):
+        com = Comision.objects.create(codigo='0620', nombre='Romano', horario='Lun')
+        self.assertEqual(com.hash_contenido, com.calcular_hash_contenido())
+        com.horario = 'Lun - Jue'
+        com.save(update_fields=['horario'])
+        com.refresh_from_db()
+        self.assertEqual(com.hash_contenido, com.calcular_hash_contenido())
+
+
+class ImportComisionesLoteTest(TransactionTestCase):
+    """Tests del comando import_comisiones_lote (varios archivos)."""
+
+    HEADER = 'Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario\n'
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def _write(self, nombre, filas):
+        path = self.dir / nombre
+        path.write_text(self.HEADER + '\n'.join(filas), encoding='utf-8')
+        return path
+
+    def test_directory_import_shares_docentes_and_infers_ciclo(self):
+        from unittest import mock
+
+        self._write('MADRE_CPO_1C2025.csv', [
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00',
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00',
+        ])
+        self._write('MADRE_CPC_1C2025.csv', [
+            'PRIMER CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Presencial,GARCIA JUAN,Mie 10:00',
+            'PRIMER CUATRIMESTRE 2025,73U (PRI) - DERECHO PENAL,0700,Presencial,PAZ ANA,Jue 19:00',
+        ])
+
+        cleanup = import_comisiones.Command.cleanup_comisiones_duplicadas
+        with mock.patch.object(import_comisiones.Command, 'cleanup_comisiones_duplicadas',
+                               autospec=True, side_effect=cleanup) as consolidacion:
+            cmd = import_comisiones_lote.Command()
+            cmd.stdout = StringIO()
+            cmd.handle(sources=[str(self.dir)], dry_run=False, update_existing=False, threads=2)
+
+        # Una sola consolidación, sobre las claves de todos los archivos
+        self.assertEqual(consolidacion.call_count, 1)
+        self.assertEqual(len(consolidacion.call_args.args[1]), 3)
+
+        result = cmd.last_run_result
+        self.assertEqual([a['nombre'] for a in result['archivos']], ['MADRE_CPC_1C2025.csv', 'MADRE_CPO_1C2025.csv'])
+        self.assertEqual([a['ciclo'] for a in result['archivos']], ['CPC', 'CPO'])
+        self.assertEqual(result['filas'], 4)
+        self.assertEqual(result['stats']['comisiones_creadas'], 3)
+        self.assertEqual(result['stats']['duplicados_exactos_omitidos'], 1)
+        # GARCIA JUAN aparece en los dos archivos: se crea una sola vez
+        self.assertEqual(result['stats']['docentes_creados'], 2)
+        self.assertEqual(Docente.objects.count(), 2)
+        self.assertEqual(Comision.objects.get(codigo='0620').ciclo, 'CPO')
+        self.assertEqual(Comision.objects.get(codigo='0016').ciclo, 'CPC')
+
+    def test_zip_with_explicit_ciclo_and_dry_run(self):
+        import zipfile
+
+        origen = self._write('oferta.csv', [
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00',
+        ])
+        zip_path = self.dir / 'ofertas.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.write(origen, 'carpeta/oferta.csv')
+            zf.writestr('__MACOSX/carpeta/._oferta.csv', 'basura')
+            zf.writestr('LEEME.txt', 'no es una oferta')
+
+        cmd = import_comisiones_lote.Command()
+        cmd.stdout = StringIO()
+        cmd.handle(sources=[f'{zip_path}:CPC'], dry_run=True, update_existing=False, threads=1)
+        self.assertEqual([(a['nombre'], a['ciclo']) for a in cmd.last_run_result['archivos']], [('oferta.csv', 'CPC')])
+        self.assertEqual(cmd.last_run_result['stats']['comisiones_creadas'], 1)
+        self.assertFalse(Comision.objects.exists())
+
+        call_command('import_comisiones_lote', str(zip_path), ciclo='CPO', stdout=StringIO())
+        self.assertEqual(Comision.objects.get().ciclo, 'CPO')
+
+    def test_deactivate_missing_requires_ciclo_per_file(self):
+        self._write('MADRE_CPO_1C2025.csv', [
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00',
+        ])
+        self._write('oferta.csv', [
+            'PRIMER CUATRIMESTRE 2025,73U (PRI) - DERECHO PENAL,0700,Presencial,PAZ ANA,Jue 19:00',
+        ])
+
+        with self.assertRaisesMessage(CommandError, 'oferta.csv'):
+            call_command('import_comisiones_lote', str(self.dir), diff=True, deactivate_missing=True, stdout=StringIO())
+        self.assertFalse(Comision.objects.exists())
+
+    def test_ciclo_desde_nombre(self):
+        self.assertEqual(import_comisiones_lote.ciclo_desde_nombre('MADRE_CPO_1C2026.csv'), 'CPO')
+        self.assertEqual(import_comisiones_lote.ciclo_desde_nombre('oferta-cpc.xlsx'), 'CPC')
+        self.assertEqual(import_comisiones_lote.ciclo_desde_nombre('CPO_y_CPC.csv'), '')
+        self.assertEqual(import_comisiones_lote.ciclo_desde_nombre('XCPOX.csv'), '')
+
+    def test_missing_source_raises(self):
+        with self.assertRaises(CommandError):
+            call_command('import_comisiones_lote', str(self.dir / 'no-existe.csv'), stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('import_comisiones_lote', str(self.dir), stdout=StringIO())
+
+
+class StagingWriterTest(TransactionTestCase):
+    """Escritura por COPY + staging (PostgreSQL) frente al camino ORM."""
+
+    CSV = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario,Sede
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00,
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00 - Jue 07:00,
+PRIMER CUATRIMESTRE 2025,PRÁCTICO PROFESIONAL,0999,Presencial,PAZ ANA,"Mar\ttarde",HOSPITAL DE CLÍNICAS
+SEGUNDO CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Remota,LOPEZ MARIA,Mie 10:00,"""
+
+    def _importar(self, backend, **opciones):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write(self.CSV)
+        self.addCleanup(Path(f.name).unlink)
+        call_command('import_comisiones', f.name, ciclo='CPO', backend=backend, stdout=StringIO(), **opciones)
+        return sorted(
+            Comision.objects.values_list(
+                'codigo', 'docente__nombre_normalizado', 'cuatrimestre', 'sede', 'horario',
+                'nombre', 'modalidad', 'es_centro_externo', 'ciclo', 'activa', 'hash_contenido',
+            )
+        )
+
+    def test_copy_backend_requires_postgres(self):
+        if connection.vendor == 'postgresql':
+            self.skipTest('Sólo aplica fuera de PostgreSQL')
+        with self.assertRaises(CommandError):
+            self._importar('copy')
+
+    def test_formato_texto_copy(self):
+        from datetime import datetime, timezone as dt_timezone
+        from .importacion.staging import _TextoCopy
+
+        archivo = _TextoCopy([
+            [None, True, 'a\tb\\c\nd', datetime(2025, 3, 1, 12, 0, tzinfo=dt_timezone.utc), 7],
+        ])
+        self.assertEqual(
+            archivo.read(5) + archivo.read(),
+            '\\N\tt\ta\\tb\\\\c\\nd\t2025-03-01T12:00:00+00:00\t7\n',
+        )
+        self.assertEqual(archivo.read(), '')
+
+    def test_copy_and_orm_produce_same_rows(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('COPY + staging requiere PostgreSQL')
+
+        orm = self._importar('orm')
+        self._importar('orm', update_existing=True)
+        orm_actualizado = self._importar('orm', update_existing=True)
+        Comision.objects.all().delete()
+        Docente.objects.all().delete()
+
+        copy = self._importar('copy')
+        self.assertEqual(copy, orm)
+        self._importar('copy', update_existing=True)
+        self.assertEqual(self._importar('copy', update_existing=True), orm_actualizado)
+
+
+class NormalizacionFilasTest(TestCase):
+    """Tests de la etapa pura de normalización de filas."""
+
+    ROW = {
+        'Período lectivo': 'SEGUNDO BIMESTRE ABOGACÍA 2025',
+        'Actividad': '205 (PRI) - DERECHO ROMANO',
+        'Comisión': '0620',
+        'Modalidad': 'Virtual',
+        'Docente': '  GARCÍA   JUAN  CARLOS ',
+        'Horario': 'Lun 07:00 ',
+        'Sede': 'COLEGIO PUBLICO',
+    }
+
+    def test_normalizar_fila_returns_typed_record(self):
+        from .importacion.normalizacion import ComisionNormalizada, normalizar_fila
+
+        fila = normalizar_fila(self.ROW, 'CPO')
+
+        self.assertEqual(fila.docente_apellido, 'GARCÍA')
+        self.assertEqual(fila.docente_nombre, 'JUAN CARLOS')
+        self.assertEqual(fila.docente_key, 'garcia juan carlos')
+        self.assertIsNone(fila.docente_id)
+        self.assertEqual(fila.comision, ComisionNormalizada(
+            codigo='0620', codigo_actividad='205', nombre='DERECHO ROMANO', modalidad=None,
+            sede='COLEGIO PUBLICO', es_centro_externo=True, ciclo='CPO', horario='Lun 07:00',
+            recomendacion_raw='', cuatrimestre='2B2025',
+        ))
+
+    def test_normalizar_fila_without_docente_or_comision(self):
+        from .importacion.normalizacion import normalizar_fila
+
+        self.assertIsNone(normalizar_fila({**self.ROW, 'Docente': ' '}))
+        self.assertIsNone(normalizar_fila({**self.ROW, 'Comisión': ''}).comision)
+
+    def test_extract_cuatrimestre_and_centro_externo(self):
+        from .importacion.normalizacion import extract_cuatrimestre, is_centro_externo
+
+        self.assertEqual(extract_cuatrimestre('PRIMER CUATRIMESTRE ABOGACÍA 2025'), '1C2025')
+        self.assertEqual(extract_cuatrimestre('SEGUNDO CUATRIMESTRE 2026'), '2C2026')
+        self.assertEqual(extract_cuatrimestre('CURSO DE VERANO'), '')
+        self.assertFalse(is_centro_externo('Penal', {}))
+        self.assertFalse(is_centro_externo('', {}))
+        self.assertTrue(is_centro_externo('', {'Centro externo': 'Sí'}))
+
+    def test_normalizar_filas_with_process_pool_keeps_order(self):
+        from .importacion import normalizar_filas
+
+        rows = [{**self.ROW, 'Comisión': f'{i:04d}'} for i in range(25)]
+        rows.insert(3, {**self.ROW, 'Docente': ''})
+
+        inline = list(normalizar_filas(rows, 'CPO', batch_size=4))
+        pool = list(normalizar_filas(rows, 'CPO', workers=2, batch_size=4))
+
+        self.assertEqual(len(inline), 25)
+        self.assertEqual(pool, inline)
+
+
+class ImportEventLogTest(TestCase):
+    """Tests del acumulador de eventos de importación."""
+
+    def test_counts_every_event_but_caps_log(self):
+        from .importacion.eventos import ImportEventLog
+
+        recibidos = []
+        eventos = ImportEventLog(max_log=2, listeners=[recibidos.append])
+        eventos.progress(500)
+        eventos.warning('uno')
+        eventos.warning('dos')
+        eventos.error('tres', origen='duplicados')
+        eventos.summary({'comisiones_creadas': 1})
+
+        self.assertEqual(eventos.contadores, {'progress': 1, 'warning': 2, 'error': 1, 'summary': 1})
+        self.assertEqual(eventos.log, [
+            {'tipo': 'warning', 'mensaje': 'uno', 'seq': 0},
+            {'tipo': 'warning', 'mensaje': 'dos', 'seq': 1},
+        ])
+        self.assertTrue(eventos.truncado)
+        self.assertEqual([e.tipo for e in recibidos], ['progress', 'warning', 'warning', 'error', 'summary'])
+
+    def test_incorporar_suma_el_log_de_otro(self):
+        from .importacion.eventos import ImportEventLog
+
+        lector = ImportEventLog(max_log=1)
+        lector.progress(10)
+        lector.error('Línea 3: no se pudo decodificar', linea=3)
+        lector.error('Línea 7: no se pudo decodificar', linea=7)
+
+        recibidos = []
+        eventos = ImportEventLog(listeners=[recibidos.append])
+        eventos.warning('antes')
+        eventos.incorporar(lector, archivo='oferta.csv')
+
+        # Lo guardado se reemite con el archivo; lo que no entró sólo se cuenta
+        self.assertEqual(eventos.log[1], {
+            'tipo': 'error', 'mensaje': 'Línea 3: no se pudo decodificar', 'linea': 3, 'archivo': 'oferta.csv', 'seq': 1,
+        })
+        self.assertEqual(eventos.contadores, {'progress': 0, 'warning': 1, 'error': 2, 'summary': 0})
+        self.assertEqual([e.tipo for e in recibidos], ['warning', 'error'])
+        self.assertTrue(eventos.truncado)
+
+    def test_command_emits_progress_and_summary(self):
+        from .importacion.eventos import ImportEventLog
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00""")
+        self.addCleanup(Path(f.name).unlink)
+
+        recibidos = []
+        out = StringIO()
+        cmd = import_comisiones.Command(stdout=out)
+        cmd.handle(file_path=f.name, dry_run=False, update_existing=False,
+                   events=ImportEventLog(listeners=[recibidos.append]))
+
+        etapas = [e.datos['etapa'] for e in recibidos if e.tipo == 'progress']
+        self.assertEqual(etapas, ['lectura', 'escritura', 'consolidacion'])
+        self.assertEqual(recibidos[-1].tipo, 'summary')
+        self.assertEqual(recibidos[-1].datos['stats']['comisiones_creadas'], 1)
+        self.assertNotIn('Comisión creada', out.getvalue())
+
+        out = StringIO()
+        call_command('import_comisiones', f.name, update_existing=True, verbosity=2, stdout=out)
+        self.assertIn('Comisión actualizada: 0620', out.getvalue())
+
+
+class BenchmarkImportTest(TestCase):
+    """Tests del benchmark de importación (archivos chicos)."""
+
+    def test_filas_sinteticas_are_deterministic_and_realistic(self):
+        from .importacion import sintetico
+
+        filas = list(sintetico.filas_sinteticas(500, seed=1))
+
+        self.assertEqual(filas, list(sintetico.filas_sinteticas(500, seed=1)))
+        claves = [tuple(f.values()) for f in filas]
+        self.assertLess(len(set(claves)), len(claves))  # duplicados exactos
+        self.assertTrue(any(f['Sede'] in sintetico.CENTROS_EXTERNOS for f in filas))
+
+    def test_medir_reports_every_phase(self):
+        from .importacion import sintetico
+        from .management.commands import benchmark_import
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'oferta.csv'
+            sintetico.escribir_csv(path, sintetico.filas_sinteticas(200, seed=1))
+            cmd = benchmark_import.Command(stdout=StringIO())
+            cmd.medir_memoria = True
+            resultado = cmd.medir(path, 'csv', 200)
+
+        self.assertEqual(list(resultado['fases']), benchmark_import.FASES)
+        self.assertEqual(resultado['fases']['read']['queries'], 0)
+        self.assertGreater(resultado['fases']['write']['queries'], 0)
+        self.assertGreater(resultado['fases']['read']['memoria_pico_mb'], 0)
+        self.assertEqual(resultado['comisiones'], Comision.objects.count())
+
+    def test_comparar_flags_query_growth(self):
+        from .management.commands import benchmark_import
+
+        def corrida(queries):
+            return {'vendor': 'sqlite', 'resultados': [
+                {'formato': 'csv', 'filas': 1000, 'total_segundos': 1.0, 'total_queries': queries},
+            ]}
+
+        cmd = benchmark_import.Command(stdout=StringIO())
+        self.assertEqual(cmd.comparar(corrida(30), [corrida(30)], threshold=20), [])
+        self.assertEqual(cmd.comparar(corrida(90), [corrida(30)], threshold=20), ['CSV 1000'])
+
+
+class DuplicateAnalyzerTest(TestCase):
+    """Tests del análisis de duplicados en una sola pasada."""
+
+    def test_detects_exactos_variaciones_y_errores(self):
+        from .importacion import DuplicateAnalyzer
+
+        rows = [
+            {'Comisión': '0620', 'Docente': 'GARCIA JUAN', 'Horario': 'Lun', 'Sede': 'PENAL'},
+            {'Comisión': '0620', 'Docente': 'GARCIA JUAN', 'Horario': 'Lun', 'Sede': 'PENAL'},
+            {'Comisión': '0620', 'Docente': 'GARCIA JUAN', 'Horario': 'Jue', 'Sede': 'PENAL'},
+            {'Comisión': '0016', 'Docente': 'LOPEZ MARIA', 'Horario': 'Mie', 'Sede': ''},
+            {'Comisión': '0016', 'Docente': 'PAZ ANA', 'Horario': 'Mie', 'Sede': ''},
+            {'Comisión': '', 'Docente': 'SIN CODIGO', 'Horario': '', 'Sede': 'CIVIL'},
+        ]
+        analizador = DuplicateAnalyzer()
+        repetidas = [analizador.add(row) for row in rows]
+        resultado = analizador.result()
+
+        self.assertEqual(repetidas, [False, True, False, False, False, False])
+        self.assertEqual(resultado['exactos'], {'0620|GARCIA JUAN|Lun|PENAL'})
+        self.assertEqual(resultado['variaciones'], {'0620', '0016'})
+        self.assertIn('sede: PENAL', resultado['warnings'][0])
+        self.assertIn('filas: 1, 2', resultado['warnings'][0])
+        self.assertIn('2 horarios diferentes: Jue, Lun', resultado['warnings'][1])
+        self.assertEqual(resultado['errores'], ['Comisión 0016 asignada a múltiples docentes: LOPEZ MARIA, PAZ ANA'])
+
+
+class ImportJobAPITest(APITestCase):
+    """
+    Tests de importación en segundo plano (Celery eager en tests).
+
+    La tarea se encola con transaction.on_commit: los pedidos corren dentro
+    de captureOnCommitCallbacks(execute=True) para que el job se ejecute.
+    """
+
+    def test_importar_enqueues_job_and_reports_progress(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from .models import ImportJob
+
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00"""
+        upload = SimpleUploadedFile('oferta.csv', csv_content.encode('utf-8'), content_type='text/csv')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                reverse('catedra-importar'), {'file': upload, 'ciclo': 'CPO'}, format='multipart'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        # Se encola recién al confirmar la transacción que creó el job
+        job = ImportJob.objects.get(pk=response.data['job_id'])
+        self.assertEqual(job.estado, 'pendiente')
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        job.refresh_from_db()
+        self.assertFalse(job.archivo)
+
+        progreso = self.client.get(reverse('importacion-detail', args=[job.pk]))
+        self.assertEqual(progreso.status_code, status.HTTP_200_OK)
+        self.assertEqual(progreso.data['estado'], 'completado')
+        self.assertEqual(progreso.data['filas_procesadas'], 2)
+        self.assertEqual(progreso.data['stats']['comisiones_creadas'], 1)
+        self.assertEqual(progreso.data['stats']['duplicados_exactos_omitidos'], 1)
+        self.assertEqual(progreso.data['duplicates']['exactos'], ['0620|GARCIA JUAN|Lun 07:00|'])
+        self.assertEqual(Comision.objects.get().ciclo, 'CPO')
+        # El log sólo guarda advertencias y errores, no una línea por comisión
+        self.assertEqual([e['tipo'] for e in progreso.data['log']], ['warning'])
+        self.assertEqual(progreso.data['contadores']['warning'], 1)
+        self.assertEqual(progreso.data['contadores']['summary'], 1)
+
+    def test_importar_dry_run_returns_plan(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        csv_content = """Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00"""
+        upload = SimpleUploadedFile('oferta.csv', csv_content.encode('utf-8'), content_type='text/csv')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('catedra-importar'), {'file': upload, 'dry_run': 'true'}, format='multipart'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        progreso = self.client.get(reverse('importacion-detail', args=[response.data['job_id']]))
+        self.assertTrue(progreso.data['dry_run'])
+        self.assertEqual(progreso.data['estado'], 'completado')
+        self.assertEqual(progreso.data['plan']['totales']['crear'], 1)
+        self.assertEqual(progreso.data['plan']['docentes']['crear'], ['Garcia Juan'])
+        self.assertFalse(Comision.objects.exists())
+        self.assertFalse(Docente.objects.exists())
+
+    def test_importar_lote_with_per_file_ciclos(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from .models import ImportJob
+
+        header = 'Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario\n'
+        cpo = SimpleUploadedFile('oferta_a.csv', (header + (
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00'
+        )).encode('utf-8'), content_type='text/csv')
+        cpc = SimpleUploadedFile('oferta_b.csv', (header + (
+            'PRIMER CUATRIMESTRE 2025,2X8 (PRI) - DERECHO DE DAÑOS,0016,Presencial,GARCIA JUAN,Mie 10:00'
+        )).encode('utf-8'), content_type='text/csv')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('catedra-importar-lote'),
+                {'files': [cpo, cpc], 'ciclo': 'CPO', 'ciclos': '{"oferta_b.csv": "CPC"}'},
+                format='multipart',
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['archivos'], 2)
+        job = ImportJob.objects.get(pk=response.data['job_id'])
+        self.assertFalse(job.archivo)
+        progreso = self.client.get(reverse('importacion-detail', args=[job.pk]))
+        self.assertEqual(progreso.data['estado'], 'completado')
+        self.assertEqual(progreso.data['stats']['comisiones_creadas'], 2)
+        self.assertEqual(progreso.data['stats']['docentes_creados'], 1)
+        self.assertEqual([(a['nombre'], a['ciclo']) for a in progreso.data['archivos']],
+                         [('oferta_a.csv', 'CPO'), ('oferta_b.csv', 'CPC')])
+        self.assertEqual(Comision.objects.get(codigo='0016').ciclo, 'CPC')
+
+    def test_importar_lote_reporta_lineas_no_decodificables(self):
+        """Los errores de lectura de cada hilo llegan al log y los contadores del job."""
+        from unittest import mock
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from .models import ImportJob
+
+        # UTF-8 con una línea latin-1 fuera de la muestra: sin latin-1 entre
+        # los CSV_ENCODINGS no decodifica en ninguno y se omite
+        contenido = (
+            'Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario\n'
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,PEREZ ANA,Lun 07:00\n'
+        ).encode('utf-8') + (
+            'PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0621,Presencial,GARCÍA JUAN,Jue 07:00\n'
+        ).encode('iso-8859-1')
+        uploads = [
+            SimpleUploadedFile('oferta_a.csv', contenido, content_type='text/csv'),
+            SimpleUploadedFile('oferta_b.csv', contenido.replace(b'0620', b'0720'), content_type='text/csv'),
+        ]
+
+        Command = import_comisiones.Command
+        with mock.patch.multiple(Command, CSV_SAMPLE_SIZE=16, CSV_CHUNK_SIZE=16, CSV_ENCODINGS=['utf-8-sig', 'utf-8']), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('catedra-importar-lote'), {'files': uploads, 'ciclo': 'CPO'}, format='multipart'
+            )
+
+        job = ImportJob.objects.get(pk=response.data['job_id'])
+        self.assertEqual(job.estado, 'completado')
+        self.assertEqual(job.stats['comisiones_creadas'], 2)
+        errores = [e for e in job.log if e['tipo'] == 'error']
+        self.assertEqual([(e['archivo'], e['linea']) for e in errores], [('oferta_a.csv', 3), ('oferta_b.csv', 3)])
+        self.assertEqual(job.contadores['error'], 2)
+
+    def test_importar_lote_rejects_invalid_ciclos(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile('oferta.csv', b'x', content_type='text/csv')
+        response = self.client.post(
+            reverse('catedra-importar-lote'), {'files': [upload], 'ciclos': '{"oferta.csv": "XYZ"}'}, format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def _importar(self, csv_content):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile('oferta.csv', csv_content.encode('utf-8'), content_type='text/csv')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('catedra-importar'), {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        return response.data['job_id']
+
+    def test_eventos_streams_ndjson(self):
+        import json
+
+        job_id = self._importar("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,PAZ ANA,Lun 07:00""")
+
+        response = self.client.get(reverse('importacion-eventos', args=[job_id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+        eventos = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([e['tipo'] for e in eventos], ['progress', 'error', 'summary'])
+        self.assertIn('múltiples docentes', eventos[1]['mensaje'])
+        self.assertEqual(eventos[-1]['estado'], 'completado')
+        self.assertEqual(eventos[-1]['stats']['comisiones_creadas'], 2)
+
+    def test_eventos_streams_sse(self):
+        job_id = self._importar("""Período lectivo,Actividad,Comisión,Modalidad,Docente,Horario
+PRIMER CUATRIMESTRE 2025,205 (PRI) - DERECHO ROMANO,0620,Presencial,GARCIA JUAN,Lun 07:00""")
+
+        response = self.client.get(
+            reverse('importacion-eventos', args=[job_id]), HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertTrue(response['Content-Type'].startswith('text/event-stream'))
+        contenido = b''.join(response.streaming_content).decode()
+        self.assertTrue(contenido.startswith('retry: 1000\n\nevent: progress\ndata: '))
+        self.assertIn('event: summary\n', contenido)
+
+    def _job_con_log(self, estado, mensajes):
+        from .models import ImportJob
+
+        log = [{'tipo': 'warning', 'mensaje': mensaje, 'seq': seq} for seq, mensaje in enumerate(mensajes)]
+        return ImportJob.objects.create(
+            nombre_archivo='oferta.csv', estado=estado, filas_procesadas=10, etapa='lectura', log=log,
+            contadores={'progress': 1, 'warning': len(log), 'error': 0, 'summary': 0},
+        )
+
+    def test_eventos_reconnect_sends_only_new_entries(self):
+        import json
+
+        job = self._job_con_log('completado', ['uno', 'dos', 'tres'])
+
+        response = self.client.get(
+            reverse('importacion-eventos', args=[job.pk]), HTTP_ACCEPT='text/event-stream', HTTP_LAST_EVENT_ID='0'
+        )
+        contenido = b''.join(response.streaming_content).decode()
+        self.assertIn('id: 1\nevent: warning\n', contenido)
+        self.assertIn('id: 2\nevent: warning\n', contenido)
+        self.assertNotIn('"uno"', contenido)
+
+        response = self.client.get(reverse('importacion-eventos', args=[job.pk]), {'last_event_id': 1})
+        eventos = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([(e['tipo'], e.get('seq')) for e in eventos], [('progress', None), ('warning', 2), ('summary', None)])
+
+        response = self.client.get(reverse('importacion-eventos', args=[job.pk]), {'last_event_id': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_eventos_stream_ends_after_window(self):
+        import json
+        from unittest import mock
+        from .views import ImportJobViewSet
+
+        job = self._job_con_log('en_progreso', ['uno'])
+
+        with mock.patch.object(ImportJobViewSet, 'STREAM_TIMEOUT', 0), CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('importacion-eventos', args=[job.pk]), {'last_event_id': 0})
+            contenido = b''.join(response.streaming_content).decode()
+
+        # Sin summary (el job sigue en curso) y sin releer el log ya enviado
+        self.assertEqual([json.loads(line)['tipo'] for line in contenido.splitlines()], ['progress'])
+        self.assertFalse([q for q in ctx.captured_queries if '"log"' in q['sql']])
+
+    def test_importar_rejects_unsupported_format(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile('oferta.txt', b'hola')
+        response = self.client.post(reverse('catedra-importar'), {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 # ============================================================================
 # TESTS DE OPTIMIZACIÓN DE QUERIES
 # ============================================================================
@@ -516,18 +2285,22 @@ class QueryOptimizationTest(TestCase):
     """Tests de optimización de queries N+1."""
     
     def setUp(self):
-        # Crear docentes con comisiones
-        for i in range(5):
-            docente = Docente.objects.create(
-                nombre=f'Docente{i}',
-                apellido=f'Apellido{i}'
-            )
-            for j in range(3):
-                Comision.objects.create(
-                    codigo=f'C{i}-{j}',
-                    nombre=f'Comisión {i}-{j}',
-                    docente=docente
+        from django.core.cache import cache
+
+        cache.clear()
+        # Crear docentes con comisiones (confirmados: versión publicada en el cache)
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                docente = Docente.objects.create(
+                    nombre=f'Docente{i}',
+                    apellido=f'Apellido{i}'
                 )
+                for j in range(3):
+                    Comision.objects.create(
+                        codigo=f'C{i}-{j}',
+                        nombre=f'Comisión {i}-{j}',
+                        docente=docente
+                    )
     
     def test_list_docentes_no_n_plus_one(self):
         """Listar docentes no causa N+1 queries."""
@@ -551,17 +2324,83 @@ class QueryOptimizationTest(TestCase):
         """Listar comisiones usa select_related para docente."""
         client = APIClient()
         
-        with self.assertNumQueries(2):  # auth + comisiones con JOIN de docente
+        with self.assertNumQueries(1):  # comisiones con JOIN de docente (cursor: sin COUNT)
             response = client.get(reverse('catedra-list'))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+# ============================================================================
+# TESTS DE MIGRACIONES
+# ============================================================================
+
+class MigracionNombreNormalizadoTest(TransactionTestCase):
+    """0009 fusiona docentes duplicados sin perder recomendaciones."""
+
+    antes = [
+        ('academic', '0008_comision_ciclo'),
+        ('recommendations', '0003_remove_recomendacion_recommendat_catedra_2611e0_idx_and_more'),
+    ]
+    despues = [('academic', '0009_docente_nombre_normalizado')]
+
+    def migrar(self, destino):
+        from django.db.migrations.executor import MigrationExecutor  # Import local para evitar ciclos
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(destino)
+        return executor.loader.project_state(destino).apps
+
+    def tearDown(self):
+        # Dejar la base en la última migración para los demás tests
+        from django.db.migrations.executor import MigrationExecutor  # Import local para evitar ciclos
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_recomendaciones_pasan_a_la_comision_superviviente(self):
+        apps = self.migrar(self.antes)
+        Docente = apps.get_model('academic', 'Docente')
+        Comision = apps.get_model('academic', 'Comision')
+        Recomendacion = apps.get_model('recommendations', 'Recomendacion')
+        Grupos = apps.get_model('scraping', 'Grupos')
+        Post_Scrapeado = apps.get_model('scraping', 'Post_Scrapeado')
+
+        grupo = Grupos.objects.create(nombre='Grupo', url='https://facebook.com/groups/test')
+        post = Post_Scrapeado.objects.create(post_id='p1', texto='Recomiendo a Pérez', grupo=grupo)
+        original = Docente.objects.create(nombre='Juan', apellido='Pérez')
+        duplicado = Docente.objects.create(nombre='JUAN', apellido='Perez')
+        datos = {
+            'codigo': '1001', 'horario': 'Lunes 18:00', 'nombre': 'Análisis I',
+            'cuatrimestre': '1C2025', 'sede': 'Centro',
+        }
+        superviviente = Comision.objects.create(docente=original, **datos)
+        repetida = Comision.objects.create(docente=duplicado, **datos)
+        rec_original = Recomendacion.objects.create(comision=superviviente, post_origen=post, texto='Muy buena')
+        rec_duplicada = Recomendacion.objects.create(comision=repetida, post_origen=post, texto='Explica bien')
+
+        apps = self.migrar(self.despues)
+        Docente = apps.get_model('academic', 'Docente')
+        Comision = apps.get_model('academic', 'Comision')
+        Recomendacion = apps.get_model('recommendations', 'Recomendacion')
+
+        self.assertEqual(list(Docente.objects.values_list('pk', flat=True)), [original.pk])
+        self.assertEqual(list(Comision.objects.values_list('pk', flat=True)), [superviviente.pk])
+        self.assertEqual(
+            set(Recomendacion.objects.values_list('pk', 'comision_id')),
+            {(rec_original.pk, superviviente.pk), (rec_duplicada.pk, superviviente.pk)},
+        )
+
+
 # ============================================================================
 # TESTS DE EDGE CASES
 # ============================================================================
 
 class EdgeCasesTest(TestCase):
     """Tests de casos límite."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
     
     def test_docente_with_very_long_nombre(self):
         """Nombre muy largo se maneja correctamente."""
@@ -0,0 +1,205 @@
+"""
+Utilidades compartidas de la app academic.
+
+- normalizar_texto: clave de comparación (sin mayúsculas, acentos ni espacios extra)
+- tokenizar / texto_busqueda: tokens normalizados para las columnas de búsqueda
+- catalogo_modificado: invalida índices en memoria y sube la versión del dataset
+- CatalogoQuerySet / avisar_borrado: catalogo_modificado() en los delete() que tocan el catálogo
+- DocenteIndex: índice en memoria nombre normalizado -> id_docente
+"""
+import re
+import unicodedata
+
+from django.db import models, transaction
+
+_ESPACIOS = re.compile(r'\s+')
+_TOKEN = re.compile(r'[^\W_]+')
+
+
+def normalizar_texto(valor):
+    """
+    Normaliza un texto para comparaciones.
+
+    Ejemplo: "  GARCÍA   Juan " -> "garcia juan"
+    """
+    if not valor:
+        return ''
+    texto = unicodedata.normalize('NFKD', str(valor).casefold())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return _ESPACIOS.sub(' ', texto).strip()
+
+
+def tokenizar(valor):
+    """
+    Tokens normalizados (letras y dígitos) de un texto.
+
+    Ejemplo: "MAT-101 Matemática" -> ["mat", "101", "matematica"]
+    """
+    return _TOKEN.findall(normalizar_texto(valor))
+
+
+def texto_busqueda(*valores):
+    """
+    Contenido de una columna search_texto: tokens únicos de todos los
+    valores, en orden de aparición y rodeados por espacios, de modo que
+    "empieza una palabra con X" es `LIKE '% x%'`.
+
+    Ejemplo: ("García", "J. García") -> " garcia j "
+    """
+    tokens = dict.fromkeys(token for valor in valores for token in tokenizar(valor))
+    return f" {' '.join(tokens)} " if tokens else ''
+
+
+def catalogo_modificado():
+    """
+    Avisa que cambiaron docentes, comisiones o recomendaciones: invalida los
+    índices de búsqueda en memoria (academic.busqueda) y publica una nueva
+    versión del dataset (Cache_Metadatos.version, que usan los clientes, el
+    índice de sugerencias y los caches de respuestas). Lo llaman los
+    signals/delete() de los modelos y la importación al terminar
+    (bulk_create/bulk_update no disparan signals), siempre con
+    transaction.on_commit: dentro de una transacción abierta otro proceso
+    vería la versión nueva con las filas viejas y cachearía la respuesta
+    vieja bajo esa versión.
+    """
+    from academic.busqueda import invalidar  # Import local para evitar ciclos
+    from recommendations.models import Cache_Metadatos
+
+    invalidar()
+    return Cache_Metadatos.increment_version()
+
+
+# Modelos cuyo borrado (directo o por CASCADE) cambia el catálogo
+MODELOS_CATALOGO = ('academic.Docente', 'academic.Comision', 'recommendations.Recomendacion')
+
+
+def avisar_borrado(resultado):
+    """
+    Llama a catalogo_modificado() (al confirmar la transacción) si un
+    delete() borró filas del catálogo.
+
+    `resultado` es lo que devuelven Model.delete() y QuerySet.delete():
+    (total, {'app.Modelo': filas}), con las filas borradas por CASCADE.
+    """
+    _, por_modelo = resultado
+    if any(por_modelo.get(modelo) for modelo in MODELOS_CATALOGO):
+        transaction.on_commit(catalogo_modificado)
+    return resultado
+
+
+class CatalogoQuerySet(models.QuerySet):
+    """
+    QuerySet de los modelos cuyo borrado puede tocar el catálogo (los del
+    catálogo y los que le borran filas por CASCADE). Su delete() (acciones
+    del admin, limpiezas por lote de la importación) avisa una sola vez por
+    llamada, sin post_delete: el borrado sigue siendo por lote.
+    """
+
+    def delete(self):
+        return avisar_borrado(super().delete())
+
+    delete.alters_data = True
+    # Como QuerySet.delete: no se copia al manager (Modelo.objects.delete())
+    delete.queryset_only = True
+
+
+def get_or_create_docente(nombre_completo, nombre='', apellido=''):
+    """
+    Busca o crea un docente por su nombre normalizado.
+
+    Usa la columna única nombre_normalizado, así que dos requests concurrentes
+    con el mismo docente terminan en el mismo registro (get_or_create reintenta
+    la lectura ante IntegrityError).
+    """
+    from academic.models import Docente  # Import local para evitar ciclos
+
+    return Docente.objects.get_or_create(
+        nombre_normalizado=normalizar_texto(nombre_completo),
+        defaults={
+            'nombre': nombre.title(),
+            'apellido': apellido.title(),
+            'nombre_completo': nombre_completo.title(),
+        }
+    )
+
+
+class DocenteIndex:
+    """
+    Índice en memoria de docentes: nombre normalizado -> id_docente.
+
+    Se construye con una sola query al inicio de una importación y luego
+    resuelve cada fila en O(1) sin volver a la base de datos.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self):
+        from academic.models import Docente  # Import local para evitar ciclos
+
+        self._ids = dict(
+            Docente.objects.exclude(nombre_normalizado__isnull=True)
+            .values_list('nombre_normalizado', 'id_docente')
+        )
+        self._provisorios = 0
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def get(self, nombre_completo):
+        """Retorna el id del docente o None si no existe."""
+        return self._ids.get(normalizar_texto(nombre_completo))
+
+    def get_by_key(self, key):
+        """Igual que get() pero con la clave ya normalizada."""
+        return self._ids.get(key)
+
+    def reserve_missing(self, docentes):
+        """
+        Asigna ids provisorios (negativos) a los docentes que no están en el
+        índice, sin escribir. Lo usa el plan de --dry-run: las filas (o los
+        archivos del lote) siguientes los encuentran como existentes, igual
+        que después de create_missing.
+        """
+        nuevos = [d for d in docentes if d.nombre_normalizado not in self._ids]
+        for docente in nuevos:
+            self._provisorios -= 1
+            self._ids[docente.nombre_normalizado] = self._provisorios
+            docente.id_docente = self._provisorios
+        return nuevos
+
+    def create_missing(self, docentes, writer=None):
+        """
+        Inserta los docentes que aún no están en el índice.
+
+        Usa ignore_conflicts sobre nombre_normalizado: si otro proceso creó el
+        mismo docente en paralelo no falla, simplemente se reutiliza su id.
+        Con `writer` (importacion.staging.StagingWriter, PostgreSQL) la
+        inserción va por COPY + INSERT ... ON CONFLICT DO NOTHING.
+        Retorna la lista de docentes que efectivamente no existían.
+        """
+        from academic.models import Docente  # Import local para evitar ciclos
+
+        nuevos = [d for d in docentes if d.nombre_normalizado not in self._ids]
+        if not nuevos:
+            return []
+
+        if writer is not None:
+            self._ids.update(writer.insertar_docentes(nuevos))
+            for docente in nuevos:
+                docente.id_docente = self._ids.get(docente.nombre_normalizado)
+            return nuevos
+
+        Docente.objects.bulk_create(nuevos, batch_size=self.BATCH_SIZE, ignore_conflicts=True)
+
+        keys = [d.nombre_normalizado for d in nuevos]
+        for i in range(0, len(keys), self.BATCH_SIZE):
+            self._ids.update(
+                Docente.objects.filter(nombre_normalizado__in=keys[i:i + self.BATCH_SIZE])
+                .values_list('nombre_normalizado', 'id_docente')
+            )
+        for docente in nuevos:
+            docente.id_docente = self._ids.get(docente.nombre_normalizado)
+        return nuevos
@@ -3,29 +3,81 @@ Views para la app academic.
 
 Incluye ViewSets con capacidades de búsqueda y filtrado avanzado.
 """
-import io
+import json
 import tempfile
+import time
+import zipfile
 from pathlib import Path
-from django.core.management.base import CommandError
-from rest_framework import viewsets, filters, status
+from django.core.files.base import File
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets, mixins, filters, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from .models import Docente, Comision
+from rest_framework.reverse import reverse
+from config.campos import CamposFilter
+from config.exportar import ExportarMixin
+from config.pagination import CatedrasPaginacion
+from .busqueda import NormalizedSearchFilter, TrigramSearchFilter, indice_sugerencias
+from .busqueda import unificada
+from .cache import RespuestaVersionadaMixin
+from .busqueda.sugerencias import K_MAX as K_MAX_SUGERENCIAS, TIPOS as TIPOS_SUGERENCIA
+from .filters import ComisionFilter
+from .models import Docente, Comision, ImportJob
 from .serializers import (
     DocenteSerializer, 
     ComisionSerializer,
     DocenteConComisionesSerializer,
-    ComisionConDocenteSerializer
+    ComisionConDocenteSerializer,
+    ImportJobSerializer,
 )
-from academic.management.commands import import_comisiones
+from .importacion.eventos import MAX_LOG, formatear_ndjson, formatear_sse
+from .renderers import EventStreamRenderer, NDJSONRenderer
+from .tasks import run_import_job
+from .utils import get_or_create_docente
+
+
+def es_verdadero(valor):
+    """Interpreta un checkbox/flag de un form multipart."""
+    return str(valor or '').lower() in {'1', 'true', 'yes', 'si', 'sí', 'on'}
+
+
+def empaquetar_zip(uploads):
+    """
+    Empaqueta archivos subidos en un .zip temporal en disco.
+
+    Se copian por bloques (upload.chunks()), así la memoria no depende del
+    tamaño de los archivos. Al cerrar el File se borra el temporal.
+    """
+    temporal = tempfile.TemporaryFile()
+    with zipfile.ZipFile(temporal, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for upload in uploads:
+            with zf.open(Path(upload.name).name, 'w') as destino:
+                for chunk in upload.chunks():
+                    destino.write(chunk)
+    temporal.seek(0)
+    return File(temporal)
+
+
+def encolar_importacion(job):
+    """
+    Encola run_import_job cuando se confirma la transacción que creó el job.
+
+    Con ATOMIC_REQUESTS o un atomic() externo, un worker podría tomar la
+    tarea antes del commit y no encontrar el ImportJob.
+    """
+    job_id = str(job.id)
+    transaction.on_commit(lambda: run_import_job.delay(job_id))
 
 
 # ============================================================================
 # DOCENTE VIEWSET - Con búsqueda avanzada
 # ============================================================================
 
-class DocenteViewSet(viewsets.ModelViewSet):
+class DocenteViewSet(RespuestaVersionadaMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar docentes con búsqueda avanzada.
     
@@ -40,9 +92,16 @@ class DocenteViewSet(viewsets.ModelViewSet):
     
     2. **Búsqueda avanzada:**
        - ?search=García → Busca por nombre, apellido, alias_search
-       - ?search=Juan G → Búsqueda flexible
+       - ?search=Juan G → Cada término debe ser el comienzo de una palabra
+       - ?q=garsia → Búsqueda por similitud (tolera errores de tipeo),
+         ordenada de más a menos parecido; ?umbral=0.3 y ?limite=50
        - ?ordering=nombre → Ordenar resultados
        - ?ordering=-apellido → Orden descendente
+
+    Las respuestas de lista y detalle quedan en cache por versión del
+    dataset y llevan ETag/Last-Modified para GET condicionales (304); el
+    Last-Modified es el del dataset (ver
+    academic.cache.RespuestaVersionadaMixin).
     
     3. **Ejemplos de uso:**
        ```
@@ -54,6 +113,9 @@ class DocenteViewSet(viewsets.ModelViewSet):
        
        GET /api/docentes/?ordering=apellido
        → Ordena alfabéticamente por apellido
+
+       GET /api/docentes/1/?fields=nombre_completo,comisiones.codigo
+       → Sólo esas columnas (también en el SQL, ver config.campos)
        ```
     
     **Serializers utilizados:**
@@ -65,19 +127,12 @@ class DocenteViewSet(viewsets.ModelViewSet):
     queryset = Docente.objects.all()
     
     # Configuración de filtros de búsqueda
-    # SearchFilter permite buscar en múltiples campos
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    
-    # ¿En qué campos puede buscar el usuario?
-    # ^ = búsqueda exacta al inicio
-    # @ = búsqueda de texto completo (si está disponible en la BD)
-    # Sin prefijo = búsqueda parcial (contiene)
-    search_fields = [
-        'nombre',           # Busca en el nombre
-        'apellido',         # Busca en el apellido
-        'nombre_completo',  # Busca en nombre completo
-        'alias_search',     # Busca en aliases (muy útil!)
-    ]
+    # NormalizedSearchFilter busca en la columna search_texto, que guarda
+    # los tokens (sin mayúsculas ni acentos) de nombre, apellido,
+    # nombre_completo y alias_search (ver Docente.CAMPOS_BUSQUEDA).
+    # TrigramSearchFilter (?q=) reordena por similitud; CamposFilter
+    # (?fields=/?expand=) va último: acota columnas y JOINs del resultado
+    filter_backends = [NormalizedSearchFilter, filters.OrderingFilter, TrigramSearchFilter, CamposFilter]
     
     # ¿Por qué campos se puede ordenar?
     ordering_fields = ['nombre', 'apellido', 'nombre_completo', 'id_docente']
@@ -152,7 +207,7 @@ class DocenteViewSet(viewsets.ModelViewSet):
 # COMISION VIEWSET - Mejorado con serializers anidados
 # ============================================================================
 
-class ComisionViewSet(viewsets.ModelViewSet):
+class ComisionViewSet(ExportarMixin, RespuestaVersionadaMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar comisiones.
     
@@ -168,26 +223,62 @@ class ComisionViewSet(viewsets.ModelViewSet):
     → Busca comisiones con "programacion" en nombre o código
     
     GET /api/catedras/?search=garcia
-    → Busca comisiones donde el docente se llame García
+    → Busca comisiones donde el docente se llame García (con o sin acento)
+
+    GET /api/catedras/?q=civl lopes
+    → Búsqueda por similitud (tolera errores de tipeo), de más a menos parecido
     
     GET /api/catedras/?ordering=codigo
     → Ordena por código de comisión
+
+    GET /api/catedras/?cuatrimestre=1C2025&ciclo=CPO&activa=true
+    GET /api/catedras/?sede__in=General,Penal&modalidad=Presencial
+    → Filtros exactos o múltiples con índice (ver academic.filters.ComisionFilter)
+
+    GET /api/catedras/?page_size=50
+    GET /api/catedras/?cursor=cD0wNjIw...
+    → Paginación por cursor: seguir el link `next` (sin `count`). Con ?q=
+      los resultados rankeados vienen en una sola página (hasta ?limite=)
+
+    GET /api/catedras/?fields=id_comision,codigo,docente.apellido
+    GET /api/catedras/?expand=
+    → Sólo esos campos / docente como id sin anidar (ver config.campos)
+
+    GET /api/catedras/exportar/?format=csv&cuatrimestre=1C2025
+    → Todas las comisiones filtradas con su docente, en streaming (NDJSON o
+      CSV, sin paginar; ver config.exportar)
     ```
+
+    Las respuestas de lista y detalle quedan en cache por versión del
+    dataset y llevan ETag/Last-Modified: con If-None-Match o
+    If-Modified-Since vigentes se responde 304 sin consultar la base (ver
+    academic.cache.RespuestaVersionadaMixin).
     """
     
     queryset = Comision.objects.all()
     
-    # Configuración de búsqueda
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = [
-        'codigo',
-        'nombre',
-        'docente__nombre',      # Busca en el nombre del docente relacionado
-        'docente__apellido',    # Busca en el apellido del docente
-        'cuatrimestre',
+    # Configuración de búsqueda: search_texto ya incluye el nombre del
+    # docente, así que no hace falta el JOIN (ver Comision.CAMPOS_BUSQUEDA).
+    # Los filtros estructurados (DjangoFilterBackend) van primero: acotan
+    # por índice antes de buscar texto
+    # CamposFilter (?fields=/?expand=) va último: acota columnas y JOINs
+    filter_backends = [
+        DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter, TrigramSearchFilter, CamposFilter,
     ]
+    filterset_class = ComisionFilter
+    # Last-Modified del detalle (Docente.save() también lo actualiza)
+    campo_ultima_modificacion = 'modificado'
     ordering_fields = ['codigo', 'nombre', 'activa', 'ano']
-    ordering = ['codigo']
+    ordering = ['codigo', 'id_comision']
+    pagination_class = CatedrasPaginacion
+    # Columnas de /api/catedras/exportar/ (values(), con el docente por JOIN)
+    nombre_exportacion = 'comisiones'
+    campos_exportacion = (
+        'id_comision', 'codigo', 'codigo_actividad', 'nombre', 'numero_catedra', 'horario',
+        'cuatrimestre', 'modalidad', 'sede', 'es_centro_externo', 'ciclo', 'ano', 'activa',
+        'tipo_catedra', 'mencion_fb', 'docente_id', 'docente__nombre', 'docente__apellido',
+        'docente__nombre_completo', 'ultima_actualizacion_scraping',
+    )
     
     def get_serializer_class(self):
         """
@@ -260,14 +351,7 @@ class ComisionViewSet(viewsets.ModelViewSet):
                 docente_apellido = docente_completo
                 docente_nombre = ''
 
-        docente, _created = Docente.objects.get_or_create(
-            nombre_completo__iexact=docente_completo,
-            defaults={
-                'nombre': docente_nombre.title(),
-                'apellido': docente_apellido.title(),
-                'nombre_completo': docente_completo.title(),
-            }
-        )
+        docente, _created = get_or_create_docente(docente_completo, docente_nombre, docente_apellido)
 
         def to_int(value):
             try:
@@ -339,7 +423,14 @@ class ComisionViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'], url_path='importar', permission_classes=[AllowAny])
     def importar(self, request):
-        """Importa comisiones desde CSV/XLS/XLSX cargado vía web."""
+        """
+        Encola la importación de un CSV/XLS/XLSX cargado vía web.
+
+        Responde 202 con el id del job; el progreso y el resultado se
+        consultan en GET /api/importaciones/{job_id}/. Con dry_run=true el
+        job no escribe: deja en `plan` lo que haría la importación
+        (previsualización de la web).
+        """
         upload = request.FILES.get('file')
         if not upload:
             return Response({'detail': 'No se envió archivo.'}, status=status.HTTP_400_BAD_REQUEST)
@@ -352,31 +443,332 @@ class ComisionViewSet(viewsets.ModelViewSet):
         if extension not in {'.csv', '.xlsx', '.xls'}:
             return Response({'detail': 'Formato no soportado. Use CSV, XLS o XLSX.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        update_existing = str(request.data.get('update_existing') or '').lower() in {'1', 'true', 'yes', 'si', 'sí', 'on'}
+        update_existing = es_verdadero(request.data.get('update_existing'))
+        dry_run = es_verdadero(request.data.get('dry_run'))
+
+        job = ImportJob(
+            nombre_archivo=upload.name[:255],
+            ciclo=ciclo,
+            update_existing=update_existing,
+            dry_run=dry_run,
+            usuario=request.user if request.user.is_authenticated else None,
+        )
+        job.archivo.save(f'{job.id}{extension}', upload, save=False)
+        job.save()
+
+        # En producción lo ejecuta un worker; en tests/desarrollo corre eager
+        encolar_importacion(job)
+
+        return Response({
+            'job_id': str(job.id),
+            'estado': job.estado,
+            'progreso_url': reverse('importacion-detail', args=[job.id], request=request),
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=['post'], url_path='importar-lote', permission_classes=[AllowAny])
+    def importar_lote(self, request):
+        """
+        Encola la importación en lote de varios CSV/XLS/XLSX (o un .zip).
+
+        Campos:
+            files:  varios archivos (o uno solo .zip con los archivos)
+            ciclo:  ciclo por defecto (CPO/CPC)
+            ciclos: JSON {"nombre de archivo": "CPO"|"CPC"}; sin entrada, el
+                    ciclo se infiere del nombre (ej: MADRE_CPC.csv) o usa `ciclo`
+
+        Los archivos se guardan como un único .zip y el job corre
+        import_comisiones_lote: lectura en paralelo, una sola transacción y
+        una sola consolidación. Responde 202 igual que /importar/.
+        """
+        uploads = request.FILES.getlist('files') or request.FILES.getlist('file')
+        if not uploads:
+            return Response({'detail': 'No se enviaron archivos.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        ciclo = (request.data.get('ciclo') or '').strip().upper()
+        if ciclo and ciclo not in {'CPO', 'CPC'}:
+            return Response({'detail': 'El ciclo debe ser CPO o CPC.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ciclos = json.loads(request.data.get('ciclos') or '{}')
+        except json.JSONDecodeError:
+            return Response({'detail': 'ciclos debe ser un objeto JSON.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(ciclos, dict) or any(
+            str(valor).strip().upper() not in {'CPO', 'CPC'} for valor in ciclos.values()
+        ):
+            return Response(
+                {'detail': 'ciclos debe mapear nombres de archivo a CPO o CPC.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        ciclos = {str(nombre): str(valor).strip().upper() for nombre, valor in ciclos.items()}
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp:
-            for chunk in upload.chunks():
-                tmp.write(chunk)
-            temp_path = Path(tmp.name)
+        extensiones = {Path(upload.name).suffix.lower() for upload in uploads}
+        if len(uploads) == 1 and extensiones == {'.zip'}:
+            if not zipfile.is_zipfile(uploads[0]):
+                return Response({'detail': 'El .zip no es válido.'}, status=status.HTTP_400_BAD_REQUEST)
+            uploads[0].seek(0)
+            contenido = uploads[0]
+            nombre = uploads[0].name
+        elif extensiones <= {'.csv', '.xlsx', '.xls'}:
+            # Se empaquetan en un .zip: el job recibe un único archivo
+            contenido = empaquetar_zip(uploads)
+            nombre = ', '.join(upload.name for upload in uploads)
+        else:
+            return Response(
+                {'detail': 'Formato no soportado. Use CSV, XLS, XLSX o un único .zip.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        cmd = import_comisiones.Command()
-        log_buffer = io.StringIO()
-        cmd.stdout = log_buffer
-        cmd.stderr = log_buffer
+        update_existing = es_verdadero(request.data.get('update_existing'))
+        dry_run = es_verdadero(request.data.get('dry_run'))
 
+        job = ImportJob(
+            nombre_archivo=nombre[:255],
+            ciclo=ciclo,
+            ciclos=ciclos,
+            update_existing=update_existing,
+            dry_run=dry_run,
+            usuario=request.user if request.user.is_authenticated else None,
+        )
         try:
-            cmd.handle(file_path=str(temp_path), dry_run=False, update_existing=update_existing, ciclo=ciclo)
-            result = getattr(cmd, 'last_run_result', {}) or {}
-        except CommandError as exc:
-            temp_path.unlink(missing_ok=True)
-            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            job.archivo.save(f'{job.id}.zip', contenido, save=False)
         finally:
-            temp_path.unlink(missing_ok=True)
+            contenido.close()
+        job.save()
+
+        encolar_importacion(job)
 
         return Response({
-            'status': 'ok',
-            'stats': result.get('stats', {}),
-            'duplicates': result.get('duplicates', {}),
-            'dry_run': result.get('dry_run', False),
-            'log': [line for line in log_buffer.getvalue().splitlines() if line.strip()],
+            'job_id': str(job.id),
+            'estado': job.estado,
+            'archivos': len(uploads),
+            'progreso_url': reverse('importacion-detail', args=[job.id], request=request),
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+# ============================================================================
+# IMPORT JOB VIEWSET - Progreso de importaciones en segundo plano
+# ============================================================================
+
+class ImportJobViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """
+    Consulta el progreso de una importación encolada.
+
+    **Uso:**
+    ```
+    POST /api/catedras/importar/     → {"job_id": "...", "progreso_url": "..."}
+    POST /api/catedras/importar-lote/ → ídem, con varios archivos o un .zip
+    GET  /api/importaciones/{job_id}/ → estado, filas_procesadas, stats, duplicates
+    GET  /api/importaciones/{job_id}/eventos/ → stream NDJSON (o SSE con
+         Accept: text/event-stream / ?format=sse) de eventos progress,
+         warning, error y un summary final; cada conexión dura hasta
+         STREAM_TIMEOUT y se retoma con Last-Event-ID / ?last_event_id=
+    ```
+    """
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+    permission_classes = [AllowAny]
+
+    # Sondeo del job mientras se transmiten eventos. Cada stream dura a lo
+    # sumo STREAM_TIMEOUT segundos: el cliente se reconecta (SSE: `retry:` y
+    # Last-Event-ID; NDJSON: ?last_event_id=<último seq>) y recibe sólo lo nuevo
+    STREAM_POLL_INTERVAL = 0.5
+    STREAM_TIMEOUT = 30
+    STREAM_RETRY_MS = 1000
+
+    @action(detail=True, methods=['get'], renderer_classes=[NDJSONRenderer, EventStreamRenderer])
+    def eventos(self, request, pk=None):
+        """Transmite los eventos del job a medida que se guardan."""
+        # Sólo se valida que exista: el log se lee por partes en iter_eventos
+        job = get_object_or_404(self.get_queryset().only('pk'), pk=pk)
+        valor = request.headers.get('Last-Event-ID') or request.query_params.get('last_event_id') or '-1'
+        try:
+            ultimo = int(valor)
+        except ValueError:
+            return Response({'detail': 'last_event_id debe ser un entero.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        renderer = request.accepted_renderer
+        sse = renderer.format == 'sse'
+        formatear = formatear_sse if sse else formatear_ndjson
+
+        def contenido():
+            if sse:
+                yield f'retry: {self.STREAM_RETRY_MS}\n\n'
+            for evento in self.iter_eventos(job.pk, desde=ultimo + 1):
+                yield formatear(evento)
+
+        response = StreamingHttpResponse(contenido(), content_type=f'{renderer.media_type}; charset=utf-8')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # sin buffer en nginx
+        return response
+
+    def iter_eventos(self, job_id, desde=0):
+        """
+        Genera los eventos de un job sondeando la base de datos.
+
+        Las entradas del log (advertencias/errores, numeradas con `seq`) sólo
+        crecen: se envían las que tienen seq >= desde, y la columna `log` se
+        relee sólo cuando los contadores indican entradas nuevas. El progreso
+        se envía cuando cambian filas o etapa. Termina con un evento summary
+        cuando el job llega a un estado final, o al vencer STREAM_TIMEOUT.
+        """
+        enviados = max(desde, 0)
+        progreso = None
+        limite = time.monotonic() + self.STREAM_TIMEOUT
+        while True:
+            job = ImportJob.objects.filter(pk=job_id).values(
+                'estado', 'filas_procesadas', 'etapa', 'contadores', 'stats', 'error'
+            ).first()
+            if job is None:
+                return
+
+            if (job['filas_procesadas'], job['etapa']) != progreso:
+                progreso = (job['filas_procesadas'], job['etapa'])
+                yield {'tipo': 'progress', 'mensaje': '', 'filas': progreso[0], 'etapa': progreso[1]}
+
+            contadores = job['contadores'] or {}
+            guardados = min(contadores.get('warning', 0) + contadores.get('error', 0), MAX_LOG)
+            if guardados > enviados:
+                log = ImportJob.objects.filter(pk=job_id).values_list('log', flat=True).first() or []
+                nuevos = log[enviados:]
+                enviados += len(nuevos)
+                yield from nuevos
+
+            if job['estado'] in ('completado', 'error'):
+                yield {
+                    'tipo': 'summary',
+                    'mensaje': job['error'],
+                    'estado': job['estado'],
+                    'stats': job['stats'],
+                    'contadores': job['contadores'],
+                }
+                return
+            if time.monotonic() > limite:
+                return
+            time.sleep(self.STREAM_POLL_INTERVAL)
+
+
+# ============================================================================
+# SUGERENCIAS VIEWSET - Typeahead desde un índice en memoria
+# ============================================================================
+
+class SugerenciasViewSet(viewsets.ViewSet):
+    """
+    Sugerencias mientras se escribe (docentes, materias y códigos de comisión).
+
+    **Uso:**
+    ```
+    GET /api/sugerencias/?q=gar
+    GET /api/sugerencias/?q=derecho r&tipo=materia&k=5
+    GET /api/sugerencias/?q=0620&tipo=comision,materia
+    ```
+
+    **Respuesta:**
+    {
+        "q": "gar",
+        "version": 12,
+        "resultados": [
+            {"tipo": "docente", "id": 3, "texto": "García Juan", "detalle": "", "popularidad": 4},
+            ...
+        ]
+    }
+
+    Responde desde academic.busqueda.sugerencias (índice de prefijos en
+    memoria que sólo se reconstruye cuando cambia Cache_Metadatos.version):
+    sin autenticación ni queries por tecla. Los datos son los del catálogo
+    público de solo lectura.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    K_DEFAULT = 8
+
+    def list(self, request):
+        texto = request.query_params.get('q', '')
+        tipos = [t.strip() for t in request.query_params.get('tipo', '').split(',') if t.strip()]
+        if any(tipo not in TIPOS_SUGERENCIA for tipo in tipos):
+            return Response(
+                {'detail': f"tipo debe ser uno de: {', '.join(TIPOS_SUGERENCIA)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            k = int(request.query_params.get('k', self.K_DEFAULT))
+        except ValueError:
+            k = 0
+        if k < 1:
+            return Response({'detail': 'k debe ser un entero mayor que 0.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        indice = indice_sugerencias()
+        resultados = indice.buscar(texto, tipos or TIPOS_SUGERENCIA, min(k, K_MAX_SUGERENCIAS))
+        return Response({
+            'q': texto,
+            'version': indice.version,
+            'resultados': [sugerencia.as_dict() for sugerencia in resultados],
         })
+
+
+# ============================================================================
+# BÚSQUEDA UNIFICADA - Comisiones, docentes y recomendaciones en un pedido
+# ============================================================================
+
+class BusquedaViewSet(viewsets.ViewSet):
+    """
+    Búsqueda en comisiones, docentes y recomendaciones con una relevancia común.
+
+    **Uso:**
+    ```
+    GET /api/search/?q=garcia romano
+    GET /api/search/?q=romano&tipo=comision,docente&limite=10
+    GET /api/search/?q=parcial&limite=3&limite_recomendacion=10
+    ```
+
+    `limite` es el máximo por tipo (por defecto 5, máximo 50) y
+    `limite_<tipo>` lo cambia para un tipo.
+
+    **Respuesta:**
+    {
+        "q": "garcia romano",
+        "version": 12,
+        "resultados": [
+            {"tipo": "comision", "id": 8, "texto": "0620 - DERECHO ROMANO",
+             "detalle": "GARCIA JUAN · 1C2025", "relevancia": 0.93},
+            ...
+        ]
+    }
+
+    Ver academic.busqueda.unificada: cada tipo usa sus índices y la
+    respuesta queda en cache por consulta normalizada y versión del dataset.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @staticmethod
+    def entero_positivo(valor):
+        """int(valor) si es un entero mayor que 0; None si no."""
+        try:
+            numero = int(valor)
+        except ValueError:
+            return None
+        return numero if numero >= 1 else None
+
+    def list(self, request):
+        params = request.query_params
+        tipos = [t.strip() for t in params.get('tipo', '').split(',') if t.strip()]
+        if any(tipo not in unificada.TIPOS for tipo in tipos):
+            return Response(
+                {'detail': f"tipo debe ser uno de: {', '.join(unificada.TIPOS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limite = self.entero_positivo(params.get('limite', unificada.LIMITE))
+        if limite is None:
+            return Response({'detail': 'limite debe ser un entero mayor que 0.'}, status=status.HTTP_400_BAD_REQUEST)
+        limites = {}
+        for tipo in tipos or unificada.TIPOS:
+            # limite_<tipo> sólo reemplaza a limite si vino en el pedido
+            parametro = f'limite_{tipo}'
+            limite_tipo = self.entero_positivo(params[parametro]) if parametro in params else limite
+            if limite_tipo is None:
+                return Response(
+                    {'detail': f'{parametro} debe ser un entero mayor que 0.'}, status=status.HTTP_400_BAD_REQUEST
+                )
+            limites[tipo] = min(limite_tipo, unificada.LIMITE_MAX)
+        return Response(unificada.buscar(params.get('q', ''), limites))
@@ -0,0 +1,263 @@
+"""
+Campos a pedido en las respuestas de la API: ?fields= y ?expand=.
+
+    GET /api/catedras/?fields=id_comision,codigo,docente.apellido
+    GET /api/catedras/?expand=            → docente como id, sin anidar
+    GET /api/posts/?fields=id,texto&expand=grupo
+
+- ?fields= lista los campos a devolver, separados por coma; `rel.campo`
+  elige campos de una relación anidada (y la anida si hacía falta).
+- ?expand= lista las relaciones a anidar y reemplaza a las que el
+  serializer anida por defecto: las que no figuran vuelven como id (o lista
+  de ids). Las relaciones anidables son los serializers declarados y las de
+  `expandibles` ({campo: Serializer}) del serializer.
+
+Sin parámetros la respuesta es la de siempre. Sólo aplica a GET: las
+escrituras usan el serializer completo.
+
+CamposDinamicosMixin recorta el serializer y CamposFilter lleva esos campos
+al queryset (.only(), select_related y Prefetch), así que se achican tanto
+el JSON como el SQL.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import filters, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+CAMPOS_PARAM = 'fields'
+EXPANDIR_PARAM = 'expand'
+
+
+def parsear_rutas(valor, param):
+    """'a,b.c,b.d' → {'a': None, 'b': {'c': None, 'd': None}} (None: completo)."""
+    arbol = {}
+    for ruta in filter(None, (r.strip() for r in valor.split(','))):
+        partes = ruta.split('.')
+        if not all(partes):
+            raise ValidationError({param: f'Ruta inválida: "{ruta}".'})
+        nodo = arbol
+        for parte in partes[:-1]:
+            if parte in nodo and nodo[parte] is None:
+                break
+            nodo = nodo.setdefault(parte, {})
+        else:
+            nodo[partes[-1]] = None
+    return arbol
+
+
+def parametros(request):
+    """(campos, expandir) de la request; None si el parámetro no vino."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None, None
+    campos, expandir = (
+        parsear_rutas(request.query_params[param], param) if param in request.query_params else None
+        for param in (CAMPOS_PARAM, EXPANDIR_PARAM)
+    )
+    return campos, expandir
+
+
+def _es_anidado(campo):
+    return isinstance(campo, serializers.BaseSerializer)
+
+
+def _opciones_fuente(campo, nombre):
+    # DRF no acepta source igual al nombre del campo
+    return {'source': campo.source} if campo.source != nombre else {}
+
+
+def restringir(serializer, campos=None, expandir=None):
+    """
+    Deja en `serializer` los `campos` pedidos y anida sólo las relaciones de
+    `expandir` (árboles de parsear_rutas; None: sin cambios). Recorre las
+    relaciones anidadas con sus sub-árboles.
+    """
+    fields = serializer.fields
+    opcionales = getattr(serializer, 'expandibles', {})
+    anidables = {nombre for nombre, campo in fields.items() if _es_anidado(campo)} | set(opcionales)
+
+    if expandir is not None and set(expandir) - anidables:
+        desconocidos = ', '.join(sorted(set(expandir) - anidables))
+        raise ValidationError({EXPANDIR_PARAM: f'No se puede expandir: {desconocidos}.'})
+    if campos is not None and set(campos) - set(fields):
+        desconocidos = ', '.join(sorted(set(campos) - set(fields)))
+        raise ValidationError({CAMPOS_PARAM: f'Campos desconocidos: {desconocidos}.'})
+
+    por_defecto = {nombre for nombre, campo in fields.items() if _es_anidado(campo)}
+    expandidos = set(expandir) if expandir is not None else por_defecto
+    expandidos |= {nombre for nombre, sub in (campos or {}).items() if sub is not None}
+    for nombre in anidables:
+        campo = fields.get(nombre)
+        if campo is None:
+            continue
+        if nombre in expandidos and not _es_anidado(campo):
+            fields[nombre] = opcionales[nombre](read_only=True, **_opciones_fuente(campo, nombre))
+        elif nombre not in expandidos and _es_anidado(campo):
+            many = isinstance(campo, serializers.ListSerializer)
+            fields[nombre] = serializers.PrimaryKeyRelatedField(
+                read_only=True, many=many, **_opciones_fuente(campo, nombre)
+            )
+
+    if campos is not None:
+        for nombre in set(fields) - set(campos):
+            fields.pop(nombre)
+
+    for nombre in expandidos & set(fields):
+        campo = fields[nombre]
+        hijo = campo.child if isinstance(campo, serializers.ListSerializer) else campo
+        restringir(
+            hijo,
+            campos.get(nombre) if campos is not None else None,
+            (expandir.get(nombre) or {}) if expandir is not None else None,
+        )
+
+
+class CamposDinamicosMixin:
+    """
+    Serializer con ?fields= / ?expand= (va antes de ModelSerializer):
+
+        class ComisionSerializer(CamposDinamicosMixin, serializers.ModelSerializer)
+
+    Sólo actúa en el serializer raíz, que recibe la request en el context.
+    """
+    # Relaciones que se anidan sólo con ?expand= ({campo: Serializer})
+    expandibles = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        campos, expandir = parametros(self.context.get('request'))
+        if campos is not None or expandir is not None:
+            restringir(self, campos, expandir)
+
+
+# ============================================================================
+# QUERYSET
+# ============================================================================
+
+class PlanConsulta:
+    """Columnas (.only), JOINs (select_related) y Prefetch de un serializer."""
+
+    def __init__(self, modelo, serializer):
+        self.only = set()
+        self.acotable = True
+        self.select_related = []
+        self.prefetch = []
+        self.agregar(modelo, serializer, '')
+
+    def agregar(self, modelo, serializer, prefijo):
+        for campo in serializer.fields.values():
+            if campo.write_only:
+                continue
+            if campo.source == '*':
+                self.acotable = False
+                continue
+            self.agregar_ruta(modelo, campo, campo.source_attrs, prefijo)
+
+    def agregar_ruta(self, modelo, campo, attrs, prefijo):
+        actual = modelo
+        for posicion, attr in enumerate(attrs):
+            try:
+                field = actual._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Propiedad o método: no se sabe qué columnas usa
+                self.acotable = False
+                return
+            ruta = prefijo + attr
+            ultimo = posicion == len(attrs) - 1
+            if field.many_to_many or field.one_to_many:
+                if ultimo:
+                    self.prefetch.append(Prefetch(ruta, queryset=self.sub_queryset(field, campo)))
+                else:
+                    self.acotable = False
+                return
+            if not field.is_relation:
+                self.only.add(ruta)
+                return
+            self.only.add(ruta)
+            if ultimo and not _es_anidado(campo):
+                return
+            self.select_related.append(ruta)
+            if ultimo:
+                self.agregar(field.related_model, campo, ruta + '__')
+                return
+            actual, prefijo = field.related_model, ruta + '__'
+
+    def aplicar_relaciones(self, queryset):
+        # select_related() sin argumentos seguiría todas las FKs
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        return queryset.prefetch_related(*self.prefetch)
+
+    @staticmethod
+    def sub_queryset(field, campo):
+        """Queryset de una relación a muchos con las columnas del serializer anidado."""
+        relacionado = field.related_model
+        queryset = relacionado._default_manager.all()
+        hijo = campo.child if isinstance(campo, serializers.ListSerializer) else None
+        if hijo is None:
+            plan = None
+        else:
+            plan = PlanConsulta(relacionado, hijo)
+            queryset = plan.aplicar_relaciones(queryset)
+        if field.one_to_many and (plan is None or plan.acotable):
+            # La FK hacia el padre hace falta para repartir los objetos
+            columnas = plan.only if plan is not None else set()
+            queryset = queryset.only(field.field.name, *columnas)
+        return queryset
+
+
+class CamposFilter(filters.BaseFilterBackend):
+    """
+    Lleva ?fields= / ?expand= al queryset: .only() con las columnas que usa
+    el serializer recortado, select_related de las relaciones anidadas y
+    Prefetch (también acotados) de las relaciones a muchos.
+
+    Reemplaza el select_related / prefetch_related de la vista, así que va
+    último en filter_backends. Se agregan las columnas del orden, que la
+    paginación por cursor lee de los objetos. Si el serializer usa
+    propiedades o métodos del modelo no se acotan las columnas.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        campos, expandir = parametros(request)
+        if campos is None and expandir is None:
+            return queryset
+        modelo = queryset.model
+        plan = PlanConsulta(modelo, view.get_serializer())
+        queryset = plan.aplicar_relaciones(queryset.select_related(None).prefetch_related(None))
+        if not plan.acotable:
+            return queryset
+        return queryset.only(*plan.only, *self.campos_de_orden(modelo, queryset, view))
+
+    @staticmethod
+    def campos_de_orden(modelo, queryset, view):
+        orden = getattr(view.paginator, 'ordering', None) or ()
+        orden = [orden] if isinstance(orden, str) else list(orden)
+        orden += [o for o in queryset.query.order_by if isinstance(o, str)]
+        nombres = set()
+        for nombre in (o.lstrip('-') for o in orden):
+            try:
+                field = modelo._meta.get_field(nombre)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete:
+                nombres.add(nombre)
+        return nombres
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': CAMPOS_PARAM,
+                'required': False,
+                'in': 'query',
+                'description': 'Campos a devolver separados por coma (rel.campo para relaciones anidadas)',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': EXPANDIR_PARAM,
+                'required': False,
+                'in': 'query',
+                'description': 'Relaciones a anidar separadas por coma (vacío: ninguna)',
+                'schema': {'type': 'string'},
+            },
+        ]
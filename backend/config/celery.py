@@ -0,0 +1,18 @@
+"""
+Aplicación Celery del proyecto.
+
+Worker:
+    celery -A config worker -l info
+
+En desarrollo y tests CELERY_TASK_ALWAYS_EAGER ejecuta las tareas en el
+mismo proceso, sin broker.
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('config')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
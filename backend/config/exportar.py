@@ -0,0 +1,118 @@
+"""
+Exportación completa en streaming: GET /api/<recurso>/exportar/.
+
+    GET /api/catedras/exportar/?format=csv&cuatrimestre=1C2025
+    GET /api/posts/exportar/?grupo=3                    (NDJSON por defecto)
+    GET /api/recomendaciones/exportar/?fields=id,texto,comision__codigo
+
+Un solo pedido devuelve todas las filas que pasan los filtros del listado
+(los mismos filter_backends de la vista), sin paginar. Las filas salen de
+.values() con .iterator(chunk_size): ni modelos ni serializers, y en
+memoria hay como mucho un lote, sea cual sea el tamaño de la tabla.
+
+- Formato: NDJSON (una fila JSON por línea) o CSV con encabezado, por
+  `Accept: application/x-ndjson|text/csv` o ?format=ndjson|csv.
+- Columnas: `campos_exportacion` de la vista (rutas de values(), como
+  docente__apellido); ?fields= elige un subconjunto y su orden.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+from academic.renderers import CSVRenderer, NDJSONRenderer
+
+from .campos import CAMPOS_PARAM, CamposFilter
+
+
+def valor_csv(valor):
+    """Valor de values() como texto de una celda CSV."""
+    if valor is None:
+        return ''
+    if isinstance(valor, bool):
+        return 'true' if valor else 'false'
+    if isinstance(valor, (datetime, date, time)):
+        return valor.isoformat()
+    if isinstance(valor, (dict, list)):
+        return json.dumps(valor, ensure_ascii=False)
+    return valor
+
+
+def generar_lineas(filas, columnas, formato, lote):
+    """
+    Texto de la exportación de a `lote` filas por bloque: el buffer se
+    vacía en cada bloque, así la memoria no crece con la cantidad de filas.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    es_csv = formato == CSVRenderer.format
+    if es_csv:
+        writer.writerow(columnas)
+
+    for numero, fila in enumerate(filas, 1):
+        if es_csv:
+            writer.writerow([valor_csv(fila[columna]) for columna in columnas])
+        else:
+            buffer.write(json.dumps(fila, ensure_ascii=False, cls=DjangoJSONEncoder) + '\n')
+        if numero % lote == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+class ExportarMixin:
+    """
+    Agrega la acción `exportar` (GET /api/<recurso>/exportar/) a un ViewSet.
+
+    La vista define `campos_exportacion` (rutas de values()) y, si sus
+    filtros no ordenan, `orden_exportacion` (conviene una columna con índice
+    para que la base empiece a devolver filas sin ordenar toda la tabla).
+    """
+    campos_exportacion = ()
+    orden_exportacion = ('pk',)
+    # Nombre del archivo descargado (por defecto el basename del router)
+    nombre_exportacion = None
+    # Filas por lectura de la base (.iterator) y por bloque de la respuesta
+    chunk_size = 2000
+
+    @action(detail=False, methods=['get'], renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def exportar(self, request):
+        """Todas las filas filtradas en NDJSON o CSV, en streaming."""
+        columnas = self.columnas_exportacion(request)
+        queryset = self.queryset_exportacion()
+        filas = queryset.values(*columnas).iterator(chunk_size=self.chunk_size)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            generar_lineas(filas, columnas, renderer.format, self.chunk_size),
+            content_type=f'{renderer.media_type}; charset=utf-8',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{self.nombre_exportacion or self.basename}.{renderer.format}"'
+        response['X-Accel-Buffering'] = 'no'  # sin buffer en nginx
+        return response
+
+    def columnas_exportacion(self, request):
+        pedidas = [c.strip() for c in request.query_params.get(CAMPOS_PARAM, '').split(',') if c.strip()]
+        desconocidas = sorted(set(pedidas) - set(self.campos_exportacion))
+        if desconocidas:
+            raise ValidationError({CAMPOS_PARAM: f"Campos desconocidos: {', '.join(desconocidas)}."})
+        return list(dict.fromkeys(pedidas)) or list(self.campos_exportacion)
+
+    def queryset_exportacion(self):
+        """
+        get_queryset() con los filtros de la vista, salvo CamposFilter:
+        las columnas las define values().
+        """
+        queryset = self.get_queryset()
+        for backend in self.filter_backends:
+            if not issubclass(backend, CamposFilter):
+                queryset = backend().filter_queryset(self.request, queryset, self)
+        if not queryset.query.order_by:
+            queryset = queryset.order_by(*self.orden_exportacion)
+        return queryset
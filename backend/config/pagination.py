@@ -0,0 +1,60 @@
+"""
+Paginación por cursor (keyset) para las colecciones grandes.
+
+PageNumberPagination (la global) hace COUNT(*) y OFFSET creciente en cada
+página. Con cursor cada página es
+
+    WHERE <orden> > <posición del último> ORDER BY <orden> LIMIT n + 1
+
+sobre un orden estable con índice, así que la página 1000 cuesta lo mismo
+que la primera. Los links next/previous llevan el cursor opaco (?cursor=)
+y el cliente elige el tamaño con ?page_size= (hasta max_page_size).
+
+DRF ubica el cursor con el primer campo del orden y resuelve los empates
+con un offset; por eso el orden siempre termina en un campo único
+(`desempate`), también cuando el cliente pide ?ordering=.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class CursorPaginacion(CursorPagination):
+    """Base: ?cursor=, ?page_size= (máximo 100) y desempate por pk."""
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    desempate = 'pk'
+    # Anotación de los resultados ya rankeados y acotados (?q= de
+    # academic.busqueda): se devuelven en una sola página, en su orden
+    anotacion_ranking = None
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if all(campo.lstrip('-') != self.desempate for campo in ordering):
+            direccion = '-' if ordering[0].startswith('-') else ''
+            ordering += (f'{direccion}{self.desempate}',)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.anotacion_ranking and self.anotacion_ranking in queryset.query.annotations:
+            self.request = request
+            self.has_next = self.has_previous = False
+            return list(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class PostsPaginacion(CursorPaginacion):
+    """/api/posts/: más nuevos primero (índice fecha_scraping)."""
+    ordering = ('-fecha_scraping',)
+    desempate = 'id'
+
+
+class SesionesPaginacion(CursorPaginacion):
+    """/api/sesiones/: más recientes primero (índice inicio)."""
+    ordering = ('-inicio',)
+    desempate = 'id'
+
+
+class CatedrasPaginacion(CursorPaginacion):
+    """/api/catedras/: por código (índice codigo, id_comision); ?q= en una página."""
+    ordering = ('codigo', 'id_comision')
+    desempate = 'id_comision'
+    anotacion_ranking = 'similitud'
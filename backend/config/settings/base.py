@@ -118,6 +118,10 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# CORS: los clientes (extensión, frontend) leen los validadores para sus
+# GET condicionales (ver academic.cache)
+CORS_EXPOSE_HEADERS = ['ETag', 'Last-Modified']
+
 # Cache Configuration
 CACHES = {
     'default': {
@@ -127,6 +131,13 @@ CACHES = {
     }
 }
 
+# Celery Configuration (importaciones en segundo plano)
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+CELERY_TASK_ALWAYS_EAGER = get_bool_env('CELERY_TASK_ALWAYS_EAGER', False)
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TASK_TRACK_STARTED = True
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
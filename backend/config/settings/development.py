@@ -20,6 +20,9 @@ DATABASES = {
     }
 }
 
+# Celery: sin broker en desarrollo, las tareas corren en el mismo proceso
+CELERY_TASK_ALWAYS_EAGER = get_bool_env('CELERY_TASK_ALWAYS_EAGER', True)
+
 # Configuración de CORS para desarrollo
 CORS_ALLOWED_ORIGINS = [
     'http://localhost:3000',
@@ -1,6 +1,7 @@
 """
 Configuración para el ambiente de TESTING
 """
+import tempfile
 from .base import *
 
 # Clave secreta fija para tests
@@ -18,6 +19,14 @@ DATABASES = {
     }
 }
 
+# Celery en modo eager: las tareas se ejecutan en el mismo proceso
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_BROKER_URL = 'memory://'
+CELERY_RESULT_BACKEND = 'cache+memory://'
+
+# Archivos subidos (importaciones) fuera del repo
+MEDIA_ROOT = Path(tempfile.gettempdir()) / 'recos-test-media'
+
 # Deshabilitar logging excesivo durante tests
 LOGGING = {
     'version': 1,
@@ -20,11 +20,12 @@ from django.urls import path, re_path, include
 from django.views.static import serve
 from rest_framework.routers import DefaultRouter
 
-from academic.views import DocenteViewSet, ComisionViewSet
+from academic.views import DocenteViewSet, ComisionViewSet, ImportJobViewSet, SugerenciasViewSet, BusquedaViewSet
 from scraping.views import (
     GruposViewSet, TareaScrapeoViewSet, 
-    SesionScrapingViewSet, PostScrapeadoViewSet
+    SesionScrapingViewSet, PostScrapeadoViewSet, BusquedaTextoViewSet
 )
+from recommendations.views import RecomendacionViewSet
 from users.views import UserViewSet, UserLoginView, UserLogoutView
 from config.views import DashboardView, CatedrasView, RecommendationsView, ScrapingView, HistoryView
 
@@ -32,10 +33,15 @@ from config.views import DashboardView, CatedrasView, RecommendationsView, Scrap
 router = DefaultRouter()
 router.register(r'docentes', DocenteViewSet, basename='docente')
 router.register(r'catedras', ComisionViewSet, basename='catedra')
+router.register(r'importaciones', ImportJobViewSet, basename='importacion')
+router.register(r'sugerencias', SugerenciasViewSet, basename='sugerencia')
+router.register(r'search', BusquedaViewSet, basename='search')
 router.register(r'grupos', GruposViewSet, basename='grupo')
 router.register(r'tareas', TareaScrapeoViewSet, basename='tarea')
 router.register(r'sesiones', SesionScrapingViewSet, basename='sesion')
 router.register(r'posts', PostScrapeadoViewSet, basename='post')
+router.register(r'busqueda-texto', BusquedaTextoViewSet, basename='busqueda-texto')
+router.register(r'recomendaciones', RecomendacionViewSet, basename='recomendacion')
 router.register(r'users', UserViewSet, basename='user')
 
 
@@ -0,0 +1,58 @@
+# Generated by Django 6.0 on 2026-10-18 07:30
+
+from django.db import migrations
+
+# Búsqueda de texto completo de Recomendacion.texto (ver scraping.busqueda);
+# la configuración busqueda_es de PostgreSQL la crea scraping 0005
+TABLA = 'recommendations_recomendacion'
+
+
+def crear_indice(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        sentencias = [
+            f"ALTER TABLE {TABLA} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('busqueda_es'::regconfig, COALESCE(texto, ''))) STORED",
+            f"CREATE INDEX IF NOT EXISTS {TABLA}_search_gin ON {TABLA} USING gin (search_vector)",
+        ]
+    elif vendor == 'sqlite':
+        fts = f'{TABLA}_fts'
+        sentencias = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(texto, content='{TABLA}', "
+            f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {TABLA} BEGIN "
+            f"INSERT INTO {fts}(rowid, texto) VALUES (new.id, new.texto); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {TABLA} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, texto) VALUES ('delete', old.id, old.texto); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF texto ON {TABLA} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, texto) VALUES ('delete', old.id, old.texto); "
+            f"INSERT INTO {fts}(rowid, texto) VALUES (new.id, new.texto); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    else:
+        return
+    for sql in sentencias:
+        schema_editor.execute(sql)
+
+
+def borrar_indice(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {TABLA}_search_gin')
+        schema_editor.execute(f'ALTER TABLE {TABLA} DROP COLUMN IF EXISTS search_vector')
+    elif vendor == 'sqlite':
+        for sufijo in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {TABLA}_fts_{sufijo}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {TABLA}_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0003_remove_recomendacion_recommendat_catedra_2611e0_idx_and_more'),
+        ('scraping', '0005_busqueda_texto'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indice, borrar_indice),
+    ]
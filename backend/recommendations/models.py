@@ -4,7 +4,12 @@ Modelos para el sistema de recomendaciones.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from django.conf import settings
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from academic.utils import CatalogoQuerySet, avisar_borrado
 
 if TYPE_CHECKING:
     from academic.models import Comision
@@ -122,7 +127,7 @@ class Recomendacion(models.Model):
     )
     
     # Django ORM manager (explícito para type checking)
-    objects: models.Manager['Recomendacion']
+    objects: models.Manager['Recomendacion'] = CatalogoQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Recomendación"
@@ -134,6 +139,9 @@ class Recomendacion(models.Model):
             models.Index(fields=['-votos_utilidad']),
         ]
     
+    def delete(self, *args, **kwargs):
+        return avisar_borrado(super().delete(*args, **kwargs))  # ver recommendations.signals
+
     def __str__(self) -> str:
         comision_codigo = self.comision.codigo if hasattr(self.comision, 'codigo') else str(self.comision)
         return f"{comision_codigo} - {self.sentimiento} ({self.confianza:.2f})"
@@ -168,6 +176,13 @@ class Cache_Metadatos(models.Model):
     
     # Django ORM manager (explícito para type checking)
     objects: models.Manager['Cache_Metadatos']
+
+    # Versión, hash y fecha se guardan también en el cache de Django para
+    # que los caminos calientes (sugerencias, caches de respuestas, ETag)
+    # no lean la base
+    CACHE_KEY = 'cache_metadatos:actual'
+    CACHE_TIMEOUT = 5  # segundos; otros procesos ven el cambio como mucho con este retraso
+    CAMPOS_CACHE = ('version', 'hash', 'ultima_actualizacion')
     
     class Meta:
         verbose_name = "Cache de Metadatos"
@@ -182,11 +197,44 @@ class Cache_Metadatos(models.Model):
         obj, _ = cls.objects.get_or_create(id=1)
         return obj.version
     
+    @classmethod
+    def get_cached_metadatos(cls) -> dict:
+        """
+        {'version', 'hash', 'ultima_actualizacion'} leídos del cache de
+        Django (la base sólo si expiró).
+        """
+        metadatos = cache.get(cls.CACHE_KEY)
+        if metadatos is None:
+            obj, _ = cls.objects.get_or_create(id=1)
+            metadatos = cls._guardar_en_cache(obj.version, obj.hash, obj.ultima_actualizacion)
+        return metadatos
+
+    @classmethod
+    def get_cached_version(cls) -> int:
+        """Versión actual leída del cache de Django (la base sólo si expiró)."""
+        return cls.get_cached_metadatos()['version']
+
+    @classmethod
+    def _guardar_en_cache(cls, version, hash, ultima_actualizacion) -> dict:
+        metadatos = {'version': version, 'hash': hash, 'ultima_actualizacion': ultima_actualizacion}
+        cache.set(cls.CACHE_KEY, metadatos, cls.CACHE_TIMEOUT)
+        return metadatos
+    
     @classmethod
     def increment_version(cls) -> int:
-        """Incrementa la versión actual."""
-        obj, _ = cls.objects.get_or_create(id=1)
-        obj.version += 1
-        obj.save()
-        return obj.version
+        """Incrementa la versión actual (UPDATE atómico, sin carreras entre procesos)."""
+        actualizados = cls.objects.filter(id=1).update(
+            version=F('version') + 1, ultima_actualizacion=timezone.now()
+        )
+        if actualizados:
+            valores = cls.objects.values_list(*cls.CAMPOS_CACHE).get(id=1)
+        else:
+            try:
+                with transaction.atomic():
+                    obj = cls.objects.create(id=1, version=2)
+            except IntegrityError:
+                # Otro proceso la creó en el medio: reintentar el UPDATE
+                return cls.increment_version()
+            valores = (obj.version, obj.hash, obj.ultima_actualizacion)
+        return cls._guardar_en_cache(*valores)['version']
 
@@ -0,0 +1,24 @@
+"""
+Signals de la app recommendations.
+
+Guardar una recomendación cambia el dataset: se llama a
+academic.utils.catalogo_modificado() (nueva Cache_Metadatos.version) al
+confirmar la transacción, igual que con docentes y comisiones. Los borrados (también por CASCADE desde
+comisiones, posts o grupos) se avisan desde delete() y
+CatalogoQuerySet.delete(), sin post_delete (ver academic.signals).
+"""
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from academic.utils import catalogo_modificado
+
+from .models import Recomendacion
+
+
+@receiver(post_save, sender=Recomendacion)
+def recomendacion_guardada(sender, raw=False, **kwargs):
+    # raw: loaddata; los fixtures no cambian la versión
+    if raw:
+        return
+    transaction.on_commit(catalogo_modificado)
@@ -1,3 +1,33 @@
-from django.shortcuts import render
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets
 
-# Create your views here.
+from config.exportar import ExportarMixin
+from .models import Recomendacion
+
+
+class RecomendacionViewSet(ExportarMixin, viewsets.GenericViewSet):
+    """
+    Exportación de recomendaciones.
+
+    **Uso:**
+    ```
+    GET /api/recomendaciones/exportar/
+    GET /api/recomendaciones/exportar/?format=csv&comision__codigo=0620&sentimiento=positivo
+    ```
+
+    Todas las recomendaciones filtradas, en streaming (NDJSON o CSV, ver
+    config.exportar).
+    """
+    queryset = Recomendacion.objects.all()
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'comision': ['exact', 'in'],
+        'comision__codigo': ['exact'],
+        'sentimiento': ['exact', 'in'],
+    }
+    nombre_exportacion = 'recomendaciones'
+    campos_exportacion = (
+        'id', 'comision_id', 'comision__codigo', 'comision__nombre', 'post_origen_id', 'texto',
+        'sentimiento', 'confianza', 'prob_aprobar', 'docent_perf', 'parciales_tipo', 'asistencia',
+        'toma_tp', 'votos_utilidad', 'fecha_creacion',
+    )
@@ -0,0 +1,163 @@
+"""
+Búsqueda de texto completo sobre posts scrapeados y recomendaciones.
+
+Sintaxis de la consulta (la misma en todos los backends):
+    - palabras sueltas: deben aparecer todas (AND)      parcial final
+    - "frase entre comillas": palabras seguidas         "toma parcial"
+    - palabra*: prefijo                                 recuper*
+
+Índices (migraciones scraping 0005 y recommendations 0004):
+    - PostgreSQL: columna generada search_vector = to_tsvector('busqueda_es',
+      texto) con índice GIN; busqueda_es es la configuración 'spanish' con
+      unaccent, así que "examen" encuentra "exámenes". El ranking es
+      ts_rank_cd y el fragmento ts_headline.
+    - SQLite: tabla FTS5 <tabla>_fts (external content) mantenida por
+      triggers, con tokenizer unicode61 sin acentos (sin stemming: usar
+      prefijos). El ranking es bm25 y el fragmento snippet().
+    - Resto: LIKE por término, sin ranking.
+
+Los fragmentos se devuelven como HTML escapado con las coincidencias entre
+<mark></mark>.
+"""
+import html
+import re
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import connections
+
+# Configuración de text search de PostgreSQL (ver scraping 0005)
+CONFIG_PG = 'busqueda_es'
+
+# Marcadores de coincidencia: caracteres de control que no aparecen en los
+# posts, para escapar el fragmento antes de convertirlos en <mark>
+INICIO, FIN = '\x02', '\x03'
+PALABRAS_FRAGMENTO = 24
+
+LIMITE_MAXIMO = 100
+
+# tipo -> (app, modelo) con columna `texto`
+FUENTES = {
+    'post': ('scraping', 'Post_Scrapeado'),
+    'recomendacion': ('recommendations', 'Recomendacion'),
+}
+
+_TERMINO = re.compile(r'"([^"]*)"?|(\S+)')
+_TOKEN = re.compile(r'[^\W_]+')
+
+
+@dataclass(frozen=True)
+class Termino:
+    """Palabra o frase de la consulta; `prefijo` aplica a su última palabra."""
+    tokens: tuple
+    prefijo: bool = False
+
+
+@dataclass(slots=True)
+class Resultado:
+    tipo: str
+    id: int
+    rango: float
+    fragmento: str
+
+
+def parsear_consulta(texto):
+    """
+    Términos de la consulta, en orden y sin repetir.
+
+    Las palabras se pasan a minúsculas pero conservan los acentos: los quita
+    cada índice (unaccent / remove_diacritics). Una palabra con signos en el
+    medio ("d'angelo") queda como frase.
+    """
+    terminos = []
+    for frase, palabra in _TERMINO.findall(texto or ''):
+        crudo = frase if frase or not palabra else palabra
+        tokens = tuple(_TOKEN.findall(crudo.casefold()))
+        if tokens:
+            prefijo = not frase and palabra.endswith('*')
+            terminos.append(Termino(tokens, prefijo))
+    return list(dict.fromkeys(terminos))
+
+
+def tsquery(terminos):
+    """Texto para to_tsquery: frases con <->, prefijos con :*, todo con &."""
+    partes = []
+    for termino in terminos:
+        parte = ' <-> '.join(termino.tokens)
+        partes.append(f'({parte}:*)' if termino.prefijo else f'({parte})')
+    return ' & '.join(partes)
+
+
+def fts5_match(terminos):
+    """Texto para MATCH de FTS5: frases entre comillas, prefijos con *."""
+    partes = []
+    for termino in terminos:
+        parte = '"' + ' '.join(termino.tokens) + '"'
+        partes.append(parte + '*' if termino.prefijo else parte)
+    return ' AND '.join(partes)
+
+
+def resaltar(fragmento):
+    """Escapa el fragmento y convierte los marcadores en <mark>."""
+    escapado = html.escape(fragmento or '', quote=False)
+    return escapado.replace(INICIO, '<mark>').replace(FIN, '</mark>')
+
+
+def buscar(tipo, texto, limite=20, using='default'):
+    """
+    Los `limite` mejores resultados de `tipo` para la consulta `texto`.
+
+    Devuelve [Resultado, ...] de mayor a menor rango ([] si la consulta no
+    tiene términos).
+    """
+    terminos = parsear_consulta(texto)
+    if not terminos:
+        return []
+    modelo = apps.get_model(*FUENTES[tipo])
+    tabla = modelo._meta.db_table
+    limite = max(1, min(int(limite), LIMITE_MAXIMO))
+    conexion = connections[using]
+
+    if conexion.vendor == 'postgresql':
+        # ts_headline es caro: sólo sobre las filas del top
+        sql = f"""
+            SELECT t.id, top.rango,
+                   ts_headline(%s::regconfig, t.texto, top.q, %s)
+            FROM (
+                SELECT f.id, q, ts_rank_cd(f.search_vector, q) AS rango
+                FROM {tabla} f, to_tsquery(%s::regconfig, %s) q
+                WHERE f.search_vector @@ q
+                ORDER BY rango DESC, f.id DESC
+                LIMIT %s
+            ) top
+            JOIN {tabla} t ON t.id = top.id
+            ORDER BY top.rango DESC, t.id DESC
+        """
+        opciones = f'StartSel={INICIO}, StopSel={FIN}, MaxWords={PALABRAS_FRAGMENTO}, MinWords=8, MaxFragments=2'
+        parametros = [CONFIG_PG, opciones, CONFIG_PG, tsquery(terminos), limite]
+    elif conexion.vendor == 'sqlite':
+        sql = f"""
+            SELECT rowid, -bm25({tabla}_fts), snippet({tabla}_fts, 0, %s, %s, '…', %s)
+            FROM {tabla}_fts
+            WHERE {tabla}_fts MATCH %s
+            ORDER BY rank, rowid DESC
+            LIMIT %s
+        """
+        parametros = [INICIO, FIN, PALABRAS_FRAGMENTO, fts5_match(terminos), limite]
+    else:
+        return _buscar_like(modelo, tipo, terminos, limite, using)
+
+    with conexion.cursor() as cursor:
+        cursor.execute(sql, parametros)
+        filas = cursor.fetchall()
+    return [Resultado(tipo, pk, float(rango), resaltar(fragmento)) for pk, rango, fragmento in filas]
+
+
+def _buscar_like(modelo, tipo, terminos, limite, using):
+    queryset = modelo._default_manager.using(using)
+    for termino in terminos:
+        queryset = queryset.filter(texto__icontains=' '.join(termino.tokens))
+    return [
+        Resultado(tipo, pk, 0.0, html.escape(texto[:200], quote=False))
+        for pk, texto in queryset.order_by('-pk').values_list('pk', 'texto')[:limite]
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 6.0 on 2026-10-18 07:30
+
+from django.db import migrations
+
+# Búsqueda de texto completo de Post_Scrapeado.texto (ver scraping.busqueda)
+TABLA = 'scraping_post_scrapeado'
+
+# Configuración 'spanish' que además ignora acentos
+CREAR_CONFIG_PG = """
+CREATE EXTENSION IF NOT EXISTS unaccent;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'busqueda_es') THEN
+        CREATE TEXT SEARCH CONFIGURATION busqueda_es (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION busqueda_es
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+"""
+
+
+def sql_postgres(tabla):
+    # Columna generada: Postgres la mantiene en cada INSERT/UPDATE
+    return [
+        f"ALTER TABLE {tabla} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('busqueda_es'::regconfig, COALESCE(texto, ''))) STORED",
+        f"CREATE INDEX IF NOT EXISTS {tabla}_search_gin ON {tabla} USING gin (search_vector)",
+    ]
+
+
+def sql_sqlite(tabla):
+    # Tabla FTS5 external content: guarda sólo el índice y lee el texto de
+    # la tabla original; los triggers la mantienen al día
+    fts = f'{tabla}_fts'
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(texto, content='{tabla}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabla} BEGIN "
+        f"INSERT INTO {fts}(rowid, texto) VALUES (new.id, new.texto); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabla} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, texto) VALUES ('delete', old.id, old.texto); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF texto ON {tabla} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, texto) VALUES ('delete', old.id, old.texto); "
+        f"INSERT INTO {fts}(rowid, texto) VALUES (new.id, new.texto); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def crear_indice(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(CREAR_CONFIG_PG)
+        sentencias = sql_postgres(TABLA)
+    elif vendor == 'sqlite':
+        sentencias = sql_sqlite(TABLA)
+    else:
+        return
+    for sql in sentencias:
+        schema_editor.execute(sql)
+
+
+def borrar_indice(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {TABLA}_search_gin')
+        schema_editor.execute(f'ALTER TABLE {TABLA} DROP COLUMN IF EXISTS search_vector')
+    elif vendor == 'sqlite':
+        for sufijo in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {TABLA}_fts_{sufijo}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {TABLA}_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraping', '0004_tarea_scrapeo_activa'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indice, borrar_indice),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraping', '0005_busqueda_texto'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post_scrapeado',
+            index=models.Index(fields=['-fecha_scraping', '-id'], name='scraping_po_fecha_s_0faa39_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sesion_scraping',
+            index=models.Index(fields=['-inicio', '-id'], name='scraping_se_inicio_9bb5ad_idx'),
+        ),
+    ]
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.db import models
 
+from academic.utils import CatalogoQuerySet, avisar_borrado
+
 if TYPE_CHECKING:
     from users.models import User
 
@@ -48,14 +50,18 @@ class Grupos(models.Model):
         verbose_name="Última Actualización"
     )
     
-    # Django ORM manager (explícito para type checking)
-    objects: models.Manager['Grupos']
+    # Django ORM manager (explícito para type checking). Borrar un grupo
+    # borra sus posts y, por CASCADE, las recomendaciones que salieron de ellos
+    objects: models.Manager['Grupos'] = CatalogoQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Grupo"
         verbose_name_plural = "Grupos"
         ordering = ['-prioridad', 'nombre']
     
+    def delete(self, *args, **kwargs):
+        return avisar_borrado(super().delete(*args, **kwargs))  # CASCADE a recomendaciones
+
     def __str__(self) -> str:
         return self.nombre  # type: ignore[return-value]
 
@@ -203,6 +209,8 @@ class Sesion_Scraping(models.Model):
         indexes = [
             models.Index(fields=['usuario', '-inicio']),
             models.Index(fields=['estado']),
+            # Orden de la paginación por cursor (config.pagination.SesionesPaginacion)
+            models.Index(fields=['-inicio', '-id']),
         ]
     
     def __str__(self) -> str:
@@ -269,8 +277,9 @@ class Post_Scrapeado(models.Model):
         verbose_name="Fecha de Scraping"
     )
     
-    # Django ORM manager (explícito para type checking)
-    objects: models.Manager['Post_Scrapeado']
+    # Django ORM manager (explícito para type checking). Borrar un post
+    # borra por CASCADE las recomendaciones que salieron de él
+    objects: models.Manager['Post_Scrapeado'] = CatalogoQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Post Scrapeado"
@@ -280,8 +289,13 @@ class Post_Scrapeado(models.Model):
             models.Index(fields=['post_id']),
             models.Index(fields=['procesado']),
             models.Index(fields=['grupo', '-fecha_scraping']),
+            # Orden de la paginación por cursor (config.pagination.PostsPaginacion)
+            models.Index(fields=['-fecha_scraping', '-id']),
         ]
     
+    def delete(self, *args, **kwargs):
+        return avisar_borrado(super().delete(*args, **kwargs))  # CASCADE a recomendaciones
+
     def __str__(self) -> str:
         post_id_short = self.post_id[:20] if len(self.post_id) > 20 else self.post_id  # type: ignore[misc]
         grupo_nombre = self.grupo.nombre if hasattr(self.grupo, 'nombre') else str(self.grupo)
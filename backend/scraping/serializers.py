@@ -1,27 +1,32 @@
 from rest_framework import serializers
+from config.campos import CamposDinamicosMixin
 from .models import Grupos, Tarea_Scrapeo, Sesion_Scraping, Post_Scrapeado
 
-class GruposSerializer(serializers.ModelSerializer):
+class GruposSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Grupos
         fields = '__all__'
 
-class TareaScrapeoSerializer(serializers.ModelSerializer):
+class TareaScrapeoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     grupo_nombre = serializers.ReadOnlyField(source='grupo.nombre')
+    # ?expand=grupo anida el grupo (ver config.campos)
+    expandibles = {'grupo': GruposSerializer}
     
     class Meta:
         model = Tarea_Scrapeo
         fields = '__all__'
 
-class SesionScrapingSerializer(serializers.ModelSerializer):
+class SesionScrapingSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     usuario_nombre = serializers.ReadOnlyField(source='usuario.username')
+    expandibles = {'tarea': TareaScrapeoSerializer}
     
     class Meta:
         model = Sesion_Scraping
         fields = '__all__'
 
-class PostScrapeadoSerializer(serializers.ModelSerializer):
+class PostScrapeadoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     grupo_nombre = serializers.ReadOnlyField(source='grupo.nombre')
+    expandibles = {'grupo': GruposSerializer, 'sesion_scraping': SesionScrapingSerializer}
     
     class Meta:
         model = Post_Scrapeado
@@ -1,3 +1,248 @@
+"""
+Tests para la app Scraping.
+
+Cobertura:
+- Búsqueda de texto completo (scraping.busqueda): sintaxis de la consulta,
+  índice FTS5 mantenido por triggers, ranking y fragmentos
+- BusquedaTextoViewSet (/api/busqueda-texto/)
+- Paginación por cursor de /api/posts/ y /api/sesiones/
+- Campos a pedido (?fields= / ?expand=) en posts y sesiones
+- Exportación en streaming de posts
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from academic.models import Comision, Docente
+from recommendations.models import Recomendacion
+
+from . import busqueda
+from .busqueda import Termino, parsear_consulta
+from .models import Grupos, Post_Scrapeado, Sesion_Scraping, Tarea_Scrapeo
+
+
+# ============================================================================
+# TESTS DE BÚSQUEDA DE TEXTO COMPLETO
+# ============================================================================
+
+class ConsultaTextoTest(TestCase):
+    """Tests de la sintaxis de consulta (independiente de la base)"""
+
+    def test_parsear_palabras_frases_y_prefijos(self):
+        terminos = parsear_consulta('Parcial "toma  Asistencia" recup* parcial')
+        self.assertEqual(terminos, [
+            Termino(('parcial',)),
+            Termino(('toma', 'asistencia')),
+            Termino(('recup',), prefijo=True),
+        ])
+
+    def test_sintaxis_de_cada_backend(self):
+        terminos = parsear_consulta('"toma asistencia" recup* d\'angelo')
+        self.assertEqual(busqueda.tsquery(terminos), "(toma <-> asistencia) & (recup:*) & (d <-> angelo)")
+        self.assertEqual(busqueda.fts5_match(terminos), '"toma asistencia" AND "recup"* AND "d angelo"')
+
+    def test_operadores_no_llegan_al_indice(self):
+        """Los signos de la consulta no pueden inyectar sintaxis de tsquery/FTS5."""
+        self.assertEqual(parsear_consulta('a & !b | c:* NEAR(x)'), [
+            Termino(('a',)), Termino(('b',)), Termino(('c',), prefijo=True), Termino(('near', 'x')),
+        ])
+        self.assertEqual(parsear_consulta('*** "" &'), [])
+
+    def test_resaltar_escapa_html(self):
+        fragmento = f'<b>{busqueda.INICIO}parcial{busqueda.FIN}</b>'
+        self.assertEqual(busqueda.resaltar(fragmento), '&lt;b&gt;<mark>parcial</mark>&lt;/b&gt;')
+
+
+class BusquedaTextoTest(APITestCase):
+    """Tests de la búsqueda sobre posts y recomendaciones"""
+
+    def setUp(self):
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        self.oral = Post_Scrapeado.objects.create(
+            post_id='p1', grupo=grupo, texto='El parcial es oral y toma asistencia todas las clases.'
+        )
+        self.escrito = Post_Scrapeado.objects.create(
+            post_id='p2', grupo=grupo, texto='Parcial escrito. Recuperatorio fácil, parcial corto.'
+        )
+        Post_Scrapeado.objects.create(post_id='p3', grupo=grupo, texto='¿Alguien tiene los apuntes de Romano?')
+        docente = Docente.objects.create(nombre='Juan', apellido='García')
+        comision = Comision.objects.create(codigo='0620', nombre='Derecho Romano', docente=docente)
+        self.recomendacion = Recomendacion.objects.create(
+            comision=comision, post_origen=self.oral, texto='Muy buena docente, el examen es accesible.'
+        )
+
+    def test_buscar_ordena_por_relevancia(self):
+        resultados = busqueda.buscar('post', 'parcial')
+        self.assertEqual([r.id for r in resultados], [self.escrito.pk, self.oral.pk])
+        self.assertIn('<mark>parcial</mark>', resultados[1].fragmento.lower())
+
+    def test_frase_prefijo_y_acentos(self):
+        self.assertEqual([r.id for r in busqueda.buscar('post', '"toma asistencia"')], [self.oral.pk])
+        self.assertEqual(busqueda.buscar('post', '"asistencia toma"'), [])
+        self.assertEqual([r.id for r in busqueda.buscar('post', 'recuper*')], [self.escrito.pk])
+        self.assertEqual([r.id for r in busqueda.buscar('post', 'FACIL')], [self.escrito.pk])
+
+    def test_indice_sigue_ediciones_y_borrados(self):
+        self.oral.texto = 'Ahora el final es escrito'
+        self.oral.save()
+        self.assertEqual([r.id for r in busqueda.buscar('post', 'asistencia')], [])
+        self.assertEqual(len(busqueda.buscar('post', 'escrito')), 2)
+
+        Post_Scrapeado.objects.filter(pk=self.escrito.pk).delete()
+        self.assertEqual([r.id for r in busqueda.buscar('post', 'escrito')], [self.oral.pk])
+
+    def test_endpoint_mezcla_tipos(self):
+        response = self.client.get('/api/busqueda-texto/', {'q': 'examen'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [resultado] = response.data['resultados']
+        self.assertEqual(resultado['tipo'], 'recomendacion')
+        self.assertEqual(resultado['id'], self.recomendacion.pk)
+        self.assertEqual(resultado['comision__codigo'], '0620')
+        self.assertIn('<mark>examen</mark>', resultado['fragmento'])
+
+        response = self.client.get('/api/busqueda-texto/', {'q': 'parcial', 'tipo': 'post', 'limite': 1})
+        self.assertEqual([r['id'] for r in response.data['resultados']], [self.escrito.pk])
+        self.assertEqual(response.data['resultados'][0]['grupo__nombre'], 'Derecho UBA')
+
+    def test_endpoint_valida_parametros(self):
+        for params in ({}, {'q': 'x', 'tipo': 'docente'}, {'q': 'x', 'limite': 'muchos'}):
+            response = self.client.get('/api/busqueda-texto/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+# ============================================================================
+# TESTS DE PAGINACIÓN POR CURSOR
+# ============================================================================
+
+class CursorPaginacionScrapingTest(APITestCase):
+    """Tests de ?cursor= / ?page_size= en posts y sesiones (config.pagination)"""
+
+    def setUp(self):
+        self.grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        Post_Scrapeado.objects.bulk_create([
+            Post_Scrapeado(post_id=f'p{n}', grupo=self.grupo, texto=f'Post {n}') for n in range(9)
+        ])
+        # Fechas repetidas de a tres: el orden se desempata por id
+        ahora = timezone.now()
+        for n, post in enumerate(Post_Scrapeado.objects.order_by('id')):
+            Post_Scrapeado.objects.filter(pk=post.pk).update(fecha_scraping=ahora - timedelta(minutes=n // 3))
+
+    def recorrer(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids += [item['id'] for item in response.data['results']]
+            url = response.data['next']
+        return ids
+
+    def test_posts_mas_nuevos_primero_sin_repetir(self):
+        esperado = list(Post_Scrapeado.objects.order_by('-fecha_scraping', '-id').values_list('id', flat=True))
+        self.assertEqual(self.recorrer('/api/posts/?page_size=2'), esperado)
+
+        # previous vuelve a la página anterior
+        primera = self.client.get('/api/posts/', {'page_size': 4})
+        segunda = self.client.get(primera.data['next'])
+        anterior = self.client.get(segunda.data['previous'])
+        self.assertEqual(anterior.data['results'], primera.data['results'])
+
+    def test_posts_sin_consultas_por_fila(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/posts/', {'page_size': 9})
+        self.assertEqual(len(response.data['results']), 9)
+        self.assertEqual(response.data['results'][0]['grupo_nombre'], 'Derecho UBA')
+        self.assertEqual(len(queries), 1)
+
+    def test_sesiones_mas_recientes_primero(self):
+        usuario = get_user_model().objects.create_user(username='ana', password='x')
+        tarea = Tarea_Scrapeo.objects.create(grupo=self.grupo, keywords=['parcial'], busquedas_pendientes=[])
+        sesiones = [Sesion_Scraping.objects.create(usuario=usuario, tarea=tarea) for _ in range(5)]
+        Sesion_Scraping.objects.update(inicio=timezone.now())
+
+        ids = self.recorrer('/api/sesiones/?page_size=2')
+        self.assertEqual(ids, [sesion.pk for sesion in reversed(sesiones)])
+        response = self.client.get('/api/sesiones/', {'page_size': 1})
+        self.assertEqual(response.data['results'][0]['usuario_nombre'], 'ana')
+
+
+# ============================================================================
+# TESTS DE CAMPOS A PEDIDO (?fields= / ?expand=)
+# ============================================================================
+
+class CamposDinamicosScrapingTest(APITestCase):
+    """Tests de config.campos en posts y sesiones"""
+
+    def setUp(self):
+        self.grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        usuario = get_user_model().objects.create_user(username='ana', password='x')
+        tarea = Tarea_Scrapeo.objects.create(grupo=self.grupo, keywords=['parcial'], busquedas_pendientes=[])
+        self.sesion = Sesion_Scraping.objects.create(usuario=usuario, tarea=tarea)
+        Post_Scrapeado.objects.create(post_id='p1', grupo=self.grupo, sesion_scraping=self.sesion, texto='Parcial oral')
+
+    def get(self, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.data['results'], [q['sql'] for q in queries.captured_queries]
+
+    def test_fields_con_campo_de_relacion(self):
+        [post], [sql] = self.get('/api/posts/', {'fields': 'texto,grupo_nombre'})
+        self.assertEqual(post, {'texto': 'Parcial oral', 'grupo_nombre': 'Derecho UBA'})
+        self.assertIn('"scraping_grupos"."nombre"', sql)
+        self.assertNotIn('"scraping_grupos"."url"', sql)
+        self.assertNotIn('"autor"', sql)
+
+        [post], [sql] = self.get('/api/posts/', {'fields': 'id,texto'})
+        self.assertEqual(set(post), {'id', 'texto'})
+        self.assertNotIn('JOIN', sql)
+
+    def test_expand_anida_relaciones_a_pedido(self):
+        [post], queries = self.get('/api/posts/', {'fields': 'id,grupo,sesion_scraping', 'expand': 'grupo'})
+        self.assertEqual(post['grupo']['nombre'], 'Derecho UBA')
+        self.assertEqual(post['sesion_scraping'], self.sesion.pk)
+        self.assertEqual(len(queries), 1)
+
+        [sesion], queries = self.get('/api/sesiones/', {'fields': 'estado,tarea.grupo_nombre'})
+        self.assertEqual(sesion, {'estado': 'iniciado', 'tarea': {'grupo_nombre': 'Derecho UBA'}})
+        self.assertEqual(len(queries), 1)
+
+        response = self.client.get('/api/posts/', {'expand': 'texto'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+# ============================================================================
+# TESTS DE EXPORTACIÓN
+# ============================================================================
+
+class ExportacionPostsTest(APITestCase):
+    """Tests de GET /api/posts/exportar/ (config.exportar)"""
+
+    def test_exporta_todos_con_filtros_del_listado(self):
+        import csv
+        import json
+
+        grupo = Grupos.objects.create(nombre='Derecho UBA', url='https://facebook.com/groups/derecho')
+        otro = Grupos.objects.create(nombre='Sociales UBA', url='https://facebook.com/groups/sociales')
+        Post_Scrapeado.objects.bulk_create(
+            [Post_Scrapeado(post_id=f'p{n}', grupo=grupo, texto=f'Post {n}') for n in range(30)]
+            + [Post_Scrapeado(post_id='x1', grupo=otro, texto='Otro grupo', procesado=True)]
+        )
+
+        response = self.client.get('/api/posts/exportar/', {'grupo': grupo.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        filas = [json.loads(linea) for linea in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(filas), 30)  # sin paginar
+        self.assertEqual({f['grupo__nombre'] for f in filas}, {'Derecho UBA'})
+        self.assertEqual(filas[0]['id'], max(f['id'] for f in filas))
 
-# Create your tests here.
+        response = self.client.get('/api/posts/exportar/', {'procesado': 'true', 'format': 'csv'})
+        texto = b''.join(response.streaming_content).decode()
+        [encabezado, fila] = list(csv.reader(texto.splitlines()))
+        self.assertEqual(dict(zip(encabezado, fila))['texto'], 'Otro grupo')
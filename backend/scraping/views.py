@@ -1,22 +1,106 @@
-from rest_framework import viewsets
+from django.apps import apps
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+from config.campos import CamposFilter
+from config.exportar import ExportarMixin
+from config.pagination import PostsPaginacion, SesionesPaginacion
+from .busqueda import FUENTES, LIMITE_MAXIMO, buscar
 from .models import Grupos, Tarea_Scrapeo, Sesion_Scraping, Post_Scrapeado
 from .serializers import (
     GruposSerializer, TareaScrapeoSerializer, 
     SesionScrapingSerializer, PostScrapeadoSerializer
 )
 
+# ?fields= / ?expand= (ver config.campos) en todos los listados
+FILTROS = [DjangoFilterBackend, CamposFilter]
+
 class GruposViewSet(viewsets.ModelViewSet):
     queryset = Grupos.objects.all()
     serializer_class = GruposSerializer
+    filter_backends = FILTROS
 
 class TareaScrapeoViewSet(viewsets.ModelViewSet):
-    queryset = Tarea_Scrapeo.objects.all()
+    queryset = Tarea_Scrapeo.objects.select_related('grupo')
     serializer_class = TareaScrapeoSerializer
+    filter_backends = FILTROS
 
 class SesionScrapingViewSet(viewsets.ModelViewSet):
-    queryset = Sesion_Scraping.objects.all()
+    # Paginación por cursor (?cursor=, ?page_size=): ver config.pagination
+    queryset = Sesion_Scraping.objects.select_related('usuario')
     serializer_class = SesionScrapingSerializer
+    pagination_class = SesionesPaginacion
+    filter_backends = FILTROS
 
-class PostScrapeadoViewSet(viewsets.ModelViewSet):
-    queryset = Post_Scrapeado.objects.all()
+class PostScrapeadoViewSet(ExportarMixin, viewsets.ModelViewSet):
+    # Paginación por cursor (?cursor=, ?page_size=): ver config.pagination.
+    # GET /api/posts/exportar/ devuelve todos en streaming (config.exportar)
+    queryset = Post_Scrapeado.objects.select_related('grupo')
     serializer_class = PostScrapeadoSerializer
+    pagination_class = PostsPaginacion
+    filter_backends = FILTROS
+    filterset_fields = ['grupo', 'procesado']
+    campos_exportacion = (
+        'id', 'post_id', 'grupo_id', 'grupo__nombre', 'sesion_scraping_id', 'autor', 'texto',
+        'procesado', 'fecha_post', 'fecha_scraping',
+    )
+    orden_exportacion = ('-fecha_scraping', '-id')
+    nombre_exportacion = 'posts'
+
+
+class BusquedaTextoViewSet(viewsets.ViewSet):
+    """
+    Búsqueda de texto completo en posts scrapeados y recomendaciones.
+
+    **Uso:**
+    ```
+    GET /api/busqueda-texto/?q=parcial oral
+    GET /api/busqueda-texto/?q="toma asistencia" recuper*&tipo=post&limite=50
+    ```
+
+    Palabras sueltas con AND, "frases" y prefijos con * (ver
+    scraping.busqueda). Resultados de mayor a menor relevancia, con el
+    fragmento coincidente en HTML escapado y <mark> en las coincidencias.
+    """
+    LIMITE_DEFAULT = 20
+
+    # tipo -> (campos extra de cada resultado)
+    CAMPOS = {
+        'post': ['grupo__nombre', 'autor', 'fecha_post', 'fecha_scraping'],
+        'recomendacion': ['comision_id', 'comision__codigo', 'sentimiento', 'post_origen_id', 'fecha_creacion'],
+    }
+
+    def list(self, request):
+        texto = request.query_params.get('q', '').strip()
+        if not texto:
+            return Response({'detail': 'q es obligatorio.'}, status=status.HTTP_400_BAD_REQUEST)
+        tipos = [t.strip() for t in request.query_params.get('tipo', '').split(',') if t.strip()]
+        if any(tipo not in FUENTES for tipo in tipos):
+            return Response(
+                {'detail': f"tipo debe ser uno de: {', '.join(FUENTES)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limite = int(request.query_params.get('limite', self.LIMITE_DEFAULT))
+        except ValueError:
+            return Response({'detail': 'limite debe ser un entero.'}, status=status.HTTP_400_BAD_REQUEST)
+        limite = max(1, min(limite, LIMITE_MAXIMO))
+
+        resultados = []
+        for tipo in tipos or FUENTES:
+            encontrados = buscar(tipo, texto, limite)
+            modelo = apps.get_model(*FUENTES[tipo])
+            datos = {
+                fila['pk']: fila
+                for fila in modelo.objects.filter(pk__in=[r.id for r in encontrados])
+                .values('pk', *self.CAMPOS[tipo])
+            }
+            for resultado in encontrados:
+                extra = datos.get(resultado.id, {})
+                resultados.append({
+                    'tipo': tipo, 'id': resultado.id, 'rango': resultado.rango,
+                    'fragmento': resultado.fragmento,
+                    **{campo: valor for campo, valor in extra.items() if campo != 'pk'},
+                })
+        resultados.sort(key=lambda r: -r['rango'])
+        return Response({'q': texto, 'resultados': resultados[:limite]})
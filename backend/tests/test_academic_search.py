@@ -1,4 +1,5 @@
 from typing import Any, Dict, cast
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
@@ -12,6 +13,7 @@ User = get_user_model()
 
 class DocenteSearchAPITest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='apiuser_doc', password='password')
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
@@ -61,6 +63,7 @@ class DocenteSearchAPITest(APITestCase):
 
 class ComisionSearchAPITest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='apiuser_com', password='password')
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
@@ -1,4 +1,5 @@
 from rest_framework.test import APITestCase
+from django.core.cache import cache
 from rest_framework import status
 from django.urls import reverse
 from academic.models import Comision, Docente
@@ -10,6 +11,7 @@ User = get_user_model()
 class ComisionAPITest(APITestCase):
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='apiuser_com', password='password')
         self.client.force_authenticate(user=self.user)
         
@@ -52,6 +54,7 @@ class ComisionAPITest(APITestCase):
 class RecomendacionAPITest(APITestCase):
     
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='apiuser', password='password')
         self.client.force_authenticate(user=self.user)
         